@@ -0,0 +1,56 @@
+"""add indexes for foreign keys and hot filter paths
+
+Revision ID: 0008_add_hot_path_indexes
+Revises: 0007_create_document_rices
+Create Date: 2025-01-04 00:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "0008_add_hot_path_indexes"
+down_revision: Union[str, None] = "0007_create_document_rices"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create indexes for foreign keys and hot filter paths."""
+    op.create_index(
+        "ix_documents_active_created_at_id",
+        "documents",
+        ["created_at", "id"],
+        sqlite_where=sa.text("is_archived IS 0"),
+        postgresql_where=sa.text("is_archived IS false"),
+    )
+    op.create_index(
+        "ix_documents_active_status_created_at_id",
+        "documents",
+        ["status", "created_at", "id"],
+        sqlite_where=sa.text("is_archived IS 0"),
+        postgresql_where=sa.text("is_archived IS false"),
+    )
+    op.create_index("ix_approvals_document_id", "approvals", ["document_id"])
+    op.create_index("ix_approval_steps_approval_id", "approval_steps", ["approval_id"])
+    op.create_index("ix_approval_steps_approver_id_status", "approval_steps", ["approver_id", "status"])
+    op.create_index("ix_comments_document_id_created_at", "comments", ["document_id", "created_at"])
+    op.create_index("ix_comments_approval_id_created_at", "comments", ["approval_id", "created_at"])
+    op.create_index("ix_document_metrics_document_id", "document_metrics", ["document_id"])
+    op.create_index("ix_document_rices_document_id", "document_rices", ["document_id"])
+    op.create_index("ix_records_created_at", "records", ["created_at"])
+
+
+def downgrade() -> None:
+    """Drop indexes for foreign keys and hot filter paths."""
+    op.drop_index("ix_records_created_at", table_name="records")
+    op.drop_index("ix_document_rices_document_id", table_name="document_rices")
+    op.drop_index("ix_document_metrics_document_id", table_name="document_metrics")
+    op.drop_index("ix_comments_approval_id_created_at", table_name="comments")
+    op.drop_index("ix_comments_document_id_created_at", table_name="comments")
+    op.drop_index("ix_approval_steps_approver_id_status", table_name="approval_steps")
+    op.drop_index("ix_approval_steps_approval_id", table_name="approval_steps")
+    op.drop_index("ix_approvals_document_id", table_name="approvals")
+    op.drop_index("ix_documents_active_status_created_at_id", table_name="documents")
+    op.drop_index("ix_documents_active_created_at_id", table_name="documents")
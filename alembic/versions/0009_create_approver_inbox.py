@@ -0,0 +1,52 @@
+"""create approver inbox table
+
+Revision ID: 0009_create_approver_inbox
+Revises: 0008_add_hot_path_indexes
+Create Date: 2025-01-05 00:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "0009_create_approver_inbox"
+down_revision: Union[str, None] = "0008_add_hot_path_indexes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create approver inbox table and fill it from pending approval steps."""
+    op.create_table(
+        "approver_inbox",
+        sa.Column("approver_id", sa.Integer(), nullable=False),
+        sa.Column("document_id", sa.Integer(), nullable=False),
+        sa.Column("document_created_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("approver_id", "document_id"),
+        sa.ForeignKeyConstraint(["approver_id"], ["users.id"]),
+        sa.ForeignKeyConstraint(["document_id"], ["documents.id"]),
+    )
+    op.create_index(
+        "ix_approver_inbox_approver_id_document_created_at",
+        "approver_inbox",
+        ["approver_id", "document_created_at"],
+    )
+    op.create_index("ix_approver_inbox_document_id", "approver_inbox", ["document_id"])
+    op.execute(
+        """
+        INSERT INTO approver_inbox (approver_id, document_id, document_created_at)
+        SELECT DISTINCT approval_steps.approver_id, documents.id, documents.created_at
+        FROM approval_steps
+        JOIN approvals ON approval_steps.approval_id = approvals.id
+        JOIN documents ON approvals.document_id = documents.id
+        WHERE documents.is_archived = false AND approval_steps.status = 'PENDING'
+        """
+    )
+
+
+def downgrade() -> None:
+    """Drop approver inbox table."""
+    op.drop_index("ix_approver_inbox_document_id", table_name="approver_inbox")
+    op.drop_index("ix_approver_inbox_approver_id_document_created_at", table_name="approver_inbox")
+    op.drop_table("approver_inbox")
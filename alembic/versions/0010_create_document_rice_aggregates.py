@@ -0,0 +1,60 @@
+"""create document rice aggregates table
+
+Revision ID: 0010_create_document_rice_aggregates
+Revises: 0009_create_approver_inbox
+Create Date: 2025-01-06 00:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "0010_create_document_rice_aggregates"
+down_revision: Union[str, None] = "0009_create_approver_inbox"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create RICE aggregates table and fill it from existing RICE scores."""
+    op.create_table(
+        "document_rice_aggregates",
+        sa.Column("document_id", sa.Integer(), nullable=False),
+        sa.Column("rice_count", sa.Integer(), nullable=False),
+        sa.Column("score_mean", sa.Float(), nullable=False),
+        sa.Column("score_min", sa.Float(), nullable=False),
+        sa.Column("score_max", sa.Float(), nullable=False),
+        sa.Column("weighted_score", sa.Float(), nullable=False),
+        sa.PrimaryKeyConstraint("document_id"),
+        sa.ForeignKeyConstraint(["document_id"], ["documents.id"]),
+    )
+    op.create_index(
+        "ix_document_rice_aggregates_weighted_score_document_id",
+        "document_rice_aggregates",
+        ["weighted_score", "document_id"],
+    )
+    op.execute(
+        """
+        INSERT INTO document_rice_aggregates
+            (document_id, rice_count, score_mean, score_min, score_max, weighted_score)
+        SELECT
+            document_id,
+            COUNT(id),
+            AVG(score),
+            MIN(score),
+            MAX(score),
+            COALESCE(SUM(score * confidence) / NULLIF(SUM(confidence), 0), AVG(score))
+        FROM document_rices
+        GROUP BY document_id
+        """
+    )
+
+
+def downgrade() -> None:
+    """Drop RICE aggregates table."""
+    op.drop_index(
+        "ix_document_rice_aggregates_weighted_score_document_id",
+        table_name="document_rice_aggregates",
+    )
+    op.drop_table("document_rice_aggregates")
@@ -0,0 +1,35 @@
+"""add numeric value and normalized unit to document metrics
+
+Revision ID: 0011_add_document_metric_numeric_value
+Revises: 0010_create_document_rice_aggregates
+Create Date: 2025-01-07 00:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "0011_add_document_metric_numeric_value"
+down_revision: Union[str, None] = "0010_create_document_rice_aggregates"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add typed metric columns; existing rows are filled by ``python -m app.cli backfill-metric-values``."""
+    op.add_column("document_metrics", sa.Column("value_numeric", sa.Float(), nullable=True))
+    op.add_column("document_metrics", sa.Column("unit_normalized", sa.String(length=64), nullable=True))
+    op.create_index(
+        "ix_document_metrics_name_unit_normalized_value_numeric",
+        "document_metrics",
+        ["name", "unit_normalized", "value_numeric"],
+    )
+
+
+def downgrade() -> None:
+    """Drop typed metric columns."""
+    op.drop_index("ix_document_metrics_name_unit_normalized_value_numeric", table_name="document_metrics")
+    with op.batch_alter_table("document_metrics") as batch_op:
+        batch_op.drop_column("unit_normalized")
+        batch_op.drop_column("value_numeric")
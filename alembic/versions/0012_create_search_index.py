@@ -0,0 +1,85 @@
+"""create full-text search index
+
+Revision ID: 0012_create_search_index
+Revises: 0011_add_document_metric_numeric_value
+Create Date: 2025-01-08 00:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "0012_create_search_index"
+down_revision: Union[str, None] = "0011_add_document_metric_numeric_value"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create the search index (FTS5 on SQLite, tsvector with GIN on Postgres) and fill it."""
+    is_sqlite = op.get_bind().dialect.name == "sqlite"
+    if is_sqlite:
+        op.execute(
+            """
+            CREATE VIRTUAL TABLE search_index USING fts5(
+                kind UNINDEXED,
+                object_id UNINDEXED,
+                document_id UNINDEXED,
+                title,
+                body,
+                tokenize = 'unicode61 remove_diacritics 2',
+                prefix = '2 3'
+            )
+            """
+        )
+    else:
+        op.execute(
+            """
+            CREATE TABLE search_index (
+                kind VARCHAR(16) NOT NULL,
+                object_id INTEGER NOT NULL,
+                document_id INTEGER,
+                title TEXT NOT NULL DEFAULT '',
+                body TEXT NOT NULL DEFAULT '',
+                tsv TSVECTOR GENERATED ALWAYS AS (
+                    setweight(to_tsvector('russian', title), 'A') || setweight(to_tsvector('russian', body), 'B')
+                ) STORED,
+                PRIMARY KEY (kind, object_id)
+            )
+            """
+        )
+        op.execute("CREATE INDEX ix_search_index_tsv ON search_index USING GIN (tsv)")
+    rowid_column = "rowid, " if is_sqlite else ""
+    sources = (
+        (
+            "document",
+            0,
+            "SELECT id AS object_id, id AS document_id, title, COALESCE(description, '') AS body "
+            "FROM documents WHERE is_archived = false",
+        ),
+        (
+            "comment",
+            1,
+            "SELECT comments.id AS object_id, documents.id AS document_id, '' AS title, comments.content AS body "
+            "FROM comments "
+            "LEFT JOIN approvals ON approvals.id = comments.approval_id "
+            "JOIN documents ON documents.id = COALESCE(comments.document_id, approvals.document_id) "
+            "WHERE documents.is_archived = false",
+        ),
+        (
+            "record",
+            2,
+            "SELECT id AS object_id, NULL AS document_id, title, COALESCE(description, '') AS body FROM records",
+        ),
+    )
+    for kind, code, source in sources:
+        rowid_value = f"object_id * 4 + {code}, " if is_sqlite else ""
+        op.execute(
+            f"INSERT INTO search_index ({rowid_column}kind, object_id, document_id, title, body) "
+            f"SELECT {rowid_value}'{kind}', object_id, document_id, title, body FROM ({source}) AS source"
+        )
+
+
+def downgrade() -> None:
+    """Drop the search index."""
+    op.execute("DROP TABLE search_index")
@@ -4,8 +4,10 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.application.services.approval_service import ApprovalService
 from app.application.services.comment_service import CommentService
+from app.core.conditional import etag_matches, make_etag, not_modified, set_etag
 from app.core.dependencies import get_current_user, get_db_session
 from app.core.flash import set_flash
+from app.core.responses import FastJSONResponse
 
 router = APIRouter(prefix="/approvals", tags=["approvals"])
 
@@ -86,21 +88,15 @@ async def request_revision(
 
 @router.get("/{approval_id}/comments")
 async def list_approval_comments(
+    request: Request,
     approval_id: int,
     session: AsyncSession = Depends(get_db_session),
     user: dict = Depends(get_current_user),
 ) -> JSONResponse:
     """Return comments for an approval."""
     service = CommentService(session)
-    comments = await service.list_for_approval(approval_id)
-    payload = [
-        {
-            "id": comment.id,
-            "content": comment.content,
-            "document_id": comment.document_id,
-            "approval_id": comment.approval_id,
-            "created_at": comment.created_at.isoformat(),
-        }
-        for comment in comments
-    ]
-    return JSONResponse(payload)
+    etag = make_etag("approval_comments", approval_id, await service.get_approval_comments_version(approval_id))
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    comments = await service.list_rows_for_approval(approval_id)
+    return set_etag(FastJSONResponse(comments), etag)
@@ -1,7 +1,9 @@
 from fastapi import APIRouter, Depends, Request
 from fastapi.responses import HTMLResponse, RedirectResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.dependencies import get_current_user
+from app.application.services.approval_service import ApprovalService
+from app.core.dependencies import get_current_user, get_db_session
 from app.core.flash import set_flash
 from app.core.templating import render_template
 
@@ -14,9 +16,14 @@ async def login_page(request: Request) -> HTMLResponse:
 
 
 @router.get("/", response_class=HTMLResponse)
-async def home(request: Request, user: dict = Depends(get_current_user)) -> HTMLResponse:
+async def home(
+    request: Request,
+    session: AsyncSession = Depends(get_db_session),
+    user: dict = Depends(get_current_user),
+) -> HTMLResponse:
     """Render the protected home page."""
-    return render_template(request, "home.html", {"user": user})
+    pending_count = await ApprovalService(session).count_pending_documents(user["id"])
+    return render_template(request, "home.html", {"user": user, "pending_count": pending_count})
 
 
 @router.post("/logout")
@@ -1,15 +1,23 @@
-from fastapi import APIRouter, Depends, Form, Request
-from fastapi.responses import HTMLResponse, JSONResponse, RedirectResponse
+from fastapi import APIRouter, Depends, Form, Query, Request
+from fastapi.responses import HTMLResponse, JSONResponse, RedirectResponse, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.application.services.approval_service import ApprovalService
 from app.application.services.comment_service import CommentService
+from app.application.services.document_detail_service import DETAIL_QUERY_BUDGET, DocumentDetailService
+from app.application.services.document_export_service import EXPORT_MEDIA_TYPES, stream_document_export
 from app.application.services.document_metric_service import DocumentMetricService
 from app.application.services.document_rice_service import DocumentRICEService
 from app.application.services.document_service import DocumentService
+from app.core.conditional import etag_matches, make_etag, not_modified, set_etag
+from app.core.config import settings
 from app.core.dependencies import get_current_user, get_db_session
-from app.core.flash import set_flash
+from app.core.flash import FLASH_COOKIE_NAME, set_flash
+from app.core.metrics import query_budget
+from app.core.pagination import CursorPagination, clamp_pagination
+from app.core.responses import FastJSONResponse
 from app.core.templating import render_template
+from app.db.session import fan_out_reads
 from app.domain.enums import ApprovalStatus, ApprovalStepStatus, DocumentStatus
 from app.schemas.document import DocumentCreate, DocumentUpdate
 
@@ -19,14 +27,28 @@ router = APIRouter(prefix="/documents", tags=["documents"])
 @router.get("", response_class=HTMLResponse)
 async def list_documents(
     request: Request,
+    cursor: str | None = Query(None),
+    per_page: int = Query(20, ge=1, le=50),
+    status: str | None = Query(None),
+    q: str | None = Query(None, max_length=255),
     session: AsyncSession = Depends(get_db_session),
     user: dict = Depends(get_current_user),
 ) -> HTMLResponse:
-    """Render the list of documents."""
-    service = DocumentService(session)
-    approval_service = ApprovalService(session)
-    documents = await service.list_documents()
-    pending_documents = await approval_service.list_pending_documents(user["id"])
+    """Render a keyset-paginated list of documents."""
+    _, per_page = clamp_pagination(1, per_page)
+    status_filter = status if status in {item.value for item in DocumentStatus} else None
+    title_prefix = q.strip() if q and q.strip() else None
+    (documents, next_cursor), pending_documents = await fan_out_reads(
+        session,
+        lambda read_session: DocumentService(read_session).list_documents(
+            limit=per_page,
+            cursor=cursor,
+            status=status_filter,
+            title_prefix=title_prefix,
+        ),
+        lambda read_session: ApprovalService(read_session).list_pending_documents(user["id"]),
+    )
+    pagination = CursorPagination(per_page=per_page, cursor=cursor, next_cursor=next_cursor)
     status_labels = {
         DocumentStatus.DRAFT.value: "Черновик",
         DocumentStatus.APPROVAL.value: "Согласование",
@@ -42,6 +64,8 @@ async def list_documents(
             "documents": documents,
             "pending_documents": pending_documents,
             "status_labels": status_labels,
+            "pagination": pagination,
+            "filters": {"status": status_filter, "q": title_prefix},
         },
     )
 
@@ -63,31 +87,130 @@ async def create_document(
     return response
 
 
+@router.get("/export")
+async def export_documents(
+    export_format: str = Query("ndjson", alias="format", pattern="^(ndjson|csv)$"),
+    user: dict = Depends(get_current_user),
+) -> StreamingResponse:
+    """Stream all documents with metrics, RICE scores and approval state."""
+    return StreamingResponse(
+        stream_document_export(export_format),
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="documents.{export_format}"'},
+    )
+
+
+def parse_document_ids(ids: str) -> list[int] | None:
+    """Parse a comma-separated id list, returning None when it is malformed, empty or too long."""
+    try:
+        document_ids = list(dict.fromkeys(int(part) for part in ids.split(",") if part.strip()))
+    except ValueError:
+        return None
+    if not document_ids or len(document_ids) > settings.batch_max_ids:
+        return None
+    return document_ids
+
+
+def invalid_ids_response() -> JSONResponse:
+    """Return the error response for a rejected id list."""
+    return JSONResponse(
+        {"detail": f"Укажите от 1 до {settings.batch_max_ids} идентификаторов документов через запятую"},
+        status_code=400,
+    )
+
+
+@router.get("/comments")
+@query_budget(2)
+async def list_comments_for_documents(
+    ids: str = Query(...),
+    session: AsyncSession = Depends(get_db_session),
+    user: dict = Depends(get_current_user),
+) -> JSONResponse:
+    """Return comments for several documents, keyed by document id."""
+    document_ids = parse_document_ids(ids)
+    if document_ids is None:
+        return invalid_ids_response()
+    return FastJSONResponse(await CommentService(session).list_for_documents(document_ids))
+
+
+@router.get("/metrics")
+@query_budget(2)
+async def list_metrics_for_documents(
+    ids: str = Query(...),
+    session: AsyncSession = Depends(get_db_session),
+    user: dict = Depends(get_current_user),
+) -> JSONResponse:
+    """Return metrics for several documents, keyed by document id."""
+    document_ids = parse_document_ids(ids)
+    if document_ids is None:
+        return invalid_ids_response()
+    return FastJSONResponse(await DocumentMetricService(session).list_metrics_for_documents(document_ids))
+
+
+@router.get("/rice")
+@query_budget(2)
+async def list_rice_for_documents(
+    ids: str = Query(...),
+    session: AsyncSession = Depends(get_db_session),
+    user: dict = Depends(get_current_user),
+) -> JSONResponse:
+    """Return RICE scores for several documents, keyed by document id."""
+    document_ids = parse_document_ids(ids)
+    if document_ids is None:
+        return invalid_ids_response()
+    return FastJSONResponse(await DocumentRICEService(session).list_rice_for_documents(document_ids))
+
+
+@router.get("/metrics/rollup")
+@query_budget(2)
+async def rollup_document_metrics(
+    status: list[DocumentStatus] = Query([]),
+    session: AsyncSession = Depends(get_db_session),
+    user: dict = Depends(get_current_user),
+) -> JSONResponse:
+    """Return totals and averages of numeric metrics across active documents by name and unit."""
+    rollup = await DocumentMetricService(session).rollup_metrics([item.value for item in status])
+    return FastJSONResponse(rollup)
+
+
+@router.get("/ranking")
+@query_budget(2)
+async def rank_documents(
+    limit: int = Query(20, ge=1, le=100),
+    status: list[DocumentStatus] = Query([]),
+    session: AsyncSession = Depends(get_db_session),
+    user: dict = Depends(get_current_user),
+) -> JSONResponse:
+    """Return the top documents by aggregate RICE score, optionally filtered by status."""
+    ranking = await DocumentRICEService(session).rank_documents(limit, [item.value for item in status])
+    return FastJSONResponse(ranking)
+
+
 @router.get("/{document_id}", response_class=HTMLResponse)
+@query_budget(DETAIL_QUERY_BUDGET + 2)  # plus the version query and an uncached principal lookup
 async def get_document(
     request: Request,
     document_id: int,
     session: AsyncSession = Depends(get_db_session),
     user: dict = Depends(get_current_user),
 ) -> HTMLResponse:
-    """Render a document detail page."""
-    service = DocumentService(session)
-    approval_service = ApprovalService(session)
-    comment_service = CommentService(session)
-    metric_service = DocumentMetricService(session)
-    rice_service = DocumentRICEService(session)
-    document = await service.get_document(document_id)
-    if not document:
+    """Render a document detail page, answering 304 when nothing it shows has changed."""
+    service = DocumentDetailService(session)
+    etag = None
+    if not request.cookies.get(FLASH_COOKIE_NAME):
+        version = await service.get_version(document_id)
+        if version is not None:
+            etag = make_etag("document", document_id, user["id"], request.app.state.templates_version, version)
+            if etag_matches(request, etag):
+                return not_modified(etag)
+    detail = await service.load(document_id)
+    if not detail:
         return render_template(
             request,
             "error.html",
             {"user": user, "status_code": 404, "detail": "Документ не найден"},
         )
-    approval, steps = await approval_service.get_approval_with_steps(document.id)
-    document_comments = await comment_service.list_for_document(document.id)
-    approval_comments = await comment_service.list_for_approval(approval.id) if approval else []
-    metrics = await metric_service.list_metrics_for_document(document.id)
-    rices = await rice_service.list_rice_for_document(document.id)
+    steps = detail.approval_steps
     status_labels = {
         DocumentStatus.DRAFT.value: "Черновик",
         DocumentStatus.APPROVAL.value: "Согласование",
@@ -114,25 +237,30 @@ async def get_document(
         )
         current_step = pending_step or steps[-1]
         current_step_index = steps.index(current_step) + 1
-    return render_template(
+    response = render_template(
         request,
         "documents/detail.html",
         {
             "user": user,
-            "document": document,
-            "approval": approval,
+            "document": detail.document,
+            "approval": detail.approval,
             "approval_steps": steps,
-            "document_comments": document_comments,
-            "approval_comments": approval_comments,
-            "metrics": metrics,
-            "rices": rices,
+            "document_comments": detail.document_comments,
+            "approval_comments": detail.approval_comments,
+            "metrics": detail.metrics,
+            "rices": detail.rices,
             "status_labels": status_labels,
             "approval_status_labels": approval_status_labels,
             "step_status_labels": step_status_labels,
             "current_step": current_step,
             "current_step_index": current_step_index,
+            "fragment_keys": detail.fragment_keys(user["id"]),
         },
     )
+    response.headers["X-Query-Count"] = str(detail.query_count)
+    if etag:
+        set_etag(response, etag)
+    return response
 
 
 @router.post("/{document_id}/submit")
@@ -208,24 +336,18 @@ async def restore_document(
 
 @router.get("/{document_id}/comments")
 async def list_document_comments(
+    request: Request,
     document_id: int,
     session: AsyncSession = Depends(get_db_session),
     user: dict = Depends(get_current_user),
 ) -> JSONResponse:
     """Return comments for a document."""
     service = CommentService(session)
-    comments = await service.list_for_document(document_id)
-    payload = [
-        {
-            "id": comment.id,
-            "content": comment.content,
-            "document_id": comment.document_id,
-            "approval_id": comment.approval_id,
-            "created_at": comment.created_at.isoformat(),
-        }
-        for comment in comments
-    ]
-    return JSONResponse(payload)
+    etag = make_etag("document_comments", document_id, await service.get_document_comments_version(document_id))
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    comments = await service.list_rows_for_document(document_id)
+    return set_etag(FastJSONResponse(comments), etag)
 
 
 @router.post("/{document_id}/metrics")
@@ -342,24 +464,15 @@ async def delete_document_metric(
 
 @router.get("/{document_id}/rice")
 async def list_document_rice(
+    request: Request,
     document_id: int,
     session: AsyncSession = Depends(get_db_session),
     user: dict = Depends(get_current_user),
 ) -> JSONResponse:
     """Return RICE scores for a document."""
     service = DocumentRICEService(session)
-    rices = await service.list_rice_for_document(document_id)
-    payload = [
-        {
-            "id": rice.id,
-            "document_id": rice.document_id,
-            "author_id": rice.author_id,
-            "reach": rice.reach,
-            "impact": rice.impact,
-            "confidence": rice.confidence,
-            "effort": rice.effort,
-            "score": rice.score,
-        }
-        for rice in rices
-    ]
-    return JSONResponse(payload)
+    etag = make_etag("document_rice", document_id, await service.get_rice_version(document_id))
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    rices = await service.list_rice_rows_for_document(document_id)
+    return set_etag(FastJSONResponse(rices), etag)
@@ -1,8 +1,10 @@
 from fastapi import APIRouter, Depends
+from fastapi.responses import PlainTextResponse
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.dependencies import get_db_session
+from app.core.metrics import metrics
 
 router = APIRouter()
 
@@ -18,3 +20,9 @@ async def ready(session: AsyncSession = Depends(get_db_session)) -> dict:
     """Check database readiness."""
     await session.execute(text("SELECT 1"))
     return {"status": "ready"}
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def prometheus_metrics() -> PlainTextResponse:
+    """Expose request, database error and password hashing metrics of this process in the Prometheus text format."""
+    return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
@@ -24,8 +24,8 @@ async def list_records(
     page, per_page = clamp_pagination(page, per_page)
     pagination = Pagination(page=page, per_page=per_page, total=0)
     service = RecordService(session)
-    records, total = await service.list_records(offset=pagination.offset, limit=pagination.per_page)
-    pagination = Pagination(page=page, per_page=per_page, total=total)
+    records, total, is_estimate = await service.list_records(offset=pagination.offset, limit=pagination.per_page)
+    pagination = Pagination(page=page, per_page=per_page, total=total, total_is_estimate=is_estimate)
     return render_template(
         request,
         "records/list.html",
@@ -42,7 +42,7 @@ async def new_record(
     return render_template(request, "records/form.html", {"user": user, "record": None})
 
 
-@router.post("/new")
+@router.post("/new", response_model=None)
 async def create_record(
     request: Request,
     title: str = Form(...),
@@ -78,7 +78,7 @@ async def edit_record(
     return render_template(request, "records/form.html", {"user": user, "record": record})
 
 
-@router.post("/{record_id}/edit")
+@router.post("/{record_id}/edit", response_model=None)
 async def update_record(
     request: Request,
     record_id: int,
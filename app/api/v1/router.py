@@ -1,7 +1,7 @@
 from fastapi import APIRouter
 
 from app.api.routers.users import router as users_router
-from app.api.v1 import approvals, auth, comments, documents, health, records
+from app.api.v1 import approvals, auth, comments, documents, health, records, search
 
 api_router = APIRouter()
 api_router.include_router(auth.router)
@@ -10,4 +10,5 @@ api_router.include_router(records.router)
 api_router.include_router(documents.router)
 api_router.include_router(approvals.router)
 api_router.include_router(comments.router)
+api_router.include_router(search.router)
 api_router.include_router(users_router)
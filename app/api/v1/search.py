@@ -0,0 +1,47 @@
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.responses import HTMLResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.application.services.search_service import SEARCH_KIND_LABELS, SearchService
+from app.core.dependencies import get_current_user, get_db_session
+from app.core.metrics import query_budget
+from app.core.pagination import clamp_pagination
+from app.core.templating import render_template
+
+router = APIRouter(prefix="/search", tags=["search"])
+
+
+@router.get("", response_class=HTMLResponse)
+@query_budget(2)
+async def search(
+    request: Request,
+    q: str = Query("", max_length=255),
+    kind: str | None = Query(None),
+    page: int = Query(1, ge=1),
+    per_page: int = Query(20, ge=1, le=50),
+    session: AsyncSession = Depends(get_db_session),
+    user: dict = Depends(get_current_user),
+) -> HTMLResponse:
+    """Render ranked full-text search hits over documents, comments and records."""
+    page, per_page = clamp_pagination(page, per_page)
+    kind_filter = kind if kind in SEARCH_KIND_LABELS else None
+    hits, has_next = await SearchService(session).search(
+        q,
+        kind_filter,
+        offset=(page - 1) * per_page,
+        limit=per_page,
+    )
+    return render_template(
+        request,
+        "search/results.html",
+        {
+            "user": user,
+            "query": q,
+            "kind": kind_filter,
+            "kind_labels": SEARCH_KIND_LABELS,
+            "hits": hits,
+            "page": page,
+            "per_page": per_page,
+            "has_next": has_next,
+        },
+    )
@@ -1,5 +1,6 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.fragment_cache import fragment_cache
 from app.domain.approval_rules import (
     can_transition_approval_status,
     can_transition_document_status,
@@ -7,6 +8,7 @@ from app.domain.approval_rules import (
 )
 from app.domain.enums import ApprovalStatus, ApprovalStepStatus, DocumentStatus
 from app.infrastructure.repositories.approval_repository import ApprovalRepository
+from app.infrastructure.repositories.approver_inbox_repository import ApproverInboxRepository
 from app.infrastructure.repositories.document_repository import DocumentRepository
 from app.services.base import BaseService
 
@@ -19,12 +21,13 @@ class ApprovalService(BaseService):
         super().__init__(session)
         self.repository = ApprovalRepository(session)
         self.documents = DocumentRepository(session)
+        self.inbox = ApproverInboxRepository(session)
 
     async def create_approval_flow(self, document_id: int, approvers: list[int]):
         """Create approval flow for a document."""
         if not approvers:
             return None
-        async with self.session.begin():
+        async with self.uow:
             document = await self.documents.get_document(document_id)
             if not document:
                 return None
@@ -41,18 +44,19 @@ class ApprovalService(BaseService):
                 document_id=document.id,
                 status=ApprovalStatus.PENDING.value,
             )
-            for approver_id in approvers:
-                await self.repository.create_step(
-                    approval_id=approval.id,
-                    approver_id=approver_id,
-                    status=ApprovalStepStatus.PENDING.value,
-                )
+            await self.repository.create_steps(
+                approval_id=approval.id,
+                approver_ids=approvers,
+                status=ApprovalStepStatus.PENDING.value,
+            )
             document.status = DocumentStatus.APPROVAL.value
-            return approval
+            await self.inbox.refresh_document(document.id)
+        fragment_cache.invalidate_document(document_id)
+        return approval
 
     async def approve_step(self, step_id: int, user_id: int):
         """Approve a single step."""
-        async with self.session.begin():
+        async with self.uow:
             step = await self.repository.get_step(step_id)
             if not step:
                 return None
@@ -63,8 +67,12 @@ class ApprovalService(BaseService):
                 return None
             step.status = ApprovalStepStatus.APPROVED.value
             step.rejection_reason = None
-            await self.recalc_approval_status(step.approval_id)
-            return step
+            approval = await self.recalc_approval_status(step.approval_id)
+            if approval:
+                await self.inbox.refresh_document(approval.document_id)
+        if approval:
+            fragment_cache.invalidate_document(approval.document_id)
+        return step
 
     async def reject_step(self, step_id: int, user_id: int, reason: str):
         """Reject a single step with reason and cancel the document."""
@@ -84,7 +92,7 @@ class ApprovalService(BaseService):
         """Reject a single step with reason and update document status."""
         if not reason:
             return None
-        async with self.session.begin():
+        async with self.uow:
             step = await self.repository.get_step(step_id)
             if not step:
                 return None
@@ -98,6 +106,7 @@ class ApprovalService(BaseService):
             approval = step.approval or await self.repository.get_approval(step.approval_id)
             if not approval:
                 return step
+            await self.inbox.refresh_document(approval.document_id)
             approval_status = ApprovalStatus(approval.status)
             if can_transition_approval_status(approval_status, ApprovalStatus.REJECTED):
                 approval.status = ApprovalStatus.REJECTED.value
@@ -110,7 +119,8 @@ class ApprovalService(BaseService):
                 and can_transition_document_status(document_status, document_target)
             ):
                 document.status = document_target.value
-            return step
+        fragment_cache.invalidate_document(approval.document_id)
+        return step
 
     async def recalc_approval_status(self, approval_id: int):
         """Recalculate approval status based on steps."""
@@ -155,4 +165,8 @@ class ApprovalService(BaseService):
 
     async def list_pending_documents(self, approver_id: int):
         """List documents awaiting approver action."""
-        return await self.repository.list_documents_for_approver(approver_id)
+        return await self.inbox.list_documents(approver_id)
+
+    async def count_pending_documents(self, approver_id: int) -> int:
+        """Count documents awaiting approver action."""
+        return await self.inbox.count(approver_id)
@@ -1,8 +1,10 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.fragment_cache import fragment_cache
 from app.infrastructure.repositories.approval_repository import ApprovalRepository
 from app.infrastructure.repositories.comment_repository import CommentRepository
 from app.infrastructure.repositories.document_repository import DocumentRepository
+from app.infrastructure.repositories.search_repository import SearchRepository
 from app.services.base import BaseService
 
 
@@ -15,6 +17,7 @@ class CommentService(BaseService):
         self.comments = CommentRepository(session)
         self.documents = DocumentRepository(session)
         self.approvals = ApprovalRepository(session)
+        self.search_index = SearchRepository(session)
 
     async def add_comment(
         self,
@@ -27,7 +30,8 @@ class CommentService(BaseService):
             return None
         if bool(document_id) == bool(approval_id):
             return None
-        async with self.session.begin():
+        async with self.uow:
+            owner_document_id = document_id
             if document_id:
                 document = await self.documents.get_document(document_id)
                 if not document or document.is_archived:
@@ -36,16 +40,35 @@ class CommentService(BaseService):
                 approval = await self.approvals.get_approval(approval_id)
                 if not approval:
                     return None
-            return await self.comments.create_comment(
+                owner_document_id = approval.document_id
+            comment = await self.comments.create_comment(
                 content=content,
                 document_id=document_id,
                 approval_id=approval_id,
             )
+            await self.search_index.index("comment", [comment])
+        fragment_cache.invalidate_document(
+            owner_document_id,
+            "approval" if approval_id else "document_comments",
+        )
+        return comment
 
-    async def list_for_document(self, document_id: int):
-        """List comments for a document."""
-        return await self.comments.list_for_document(document_id)
+    async def get_document_comments_version(self, document_id: int) -> tuple:
+        """Return a version tuple of a document's comments."""
+        return await self.comments.get_version_for_document(document_id)
 
-    async def list_for_approval(self, approval_id: int):
-        """List comments for an approval."""
-        return await self.comments.list_for_approval(approval_id)
+    async def get_approval_comments_version(self, approval_id: int) -> tuple:
+        """Return a version tuple of an approval's comments."""
+        return await self.comments.get_version_for_approval(approval_id)
+
+    async def list_rows_for_document(self, document_id: int):
+        """List comment rows for a document, ready for JSON encoding."""
+        return await self.comments.list_rows_for_document(document_id)
+
+    async def list_rows_for_approval(self, approval_id: int):
+        """List comment rows for an approval, ready for JSON encoding."""
+        return await self.comments.list_rows_for_approval(approval_id)
+
+    async def list_for_documents(self, document_ids: list[int]):
+        """List comment rows for many documents, grouped by document id."""
+        return await self.comments.list_for_documents(document_ids)
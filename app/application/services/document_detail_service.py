@@ -0,0 +1,126 @@
+from dataclasses import dataclass, field
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.session import count_queries, fan_out_reads
+from app.domain.models.approval import Approval, ApprovalStep
+from app.domain.models.comment import Comment
+from app.domain.models.document import Document
+from app.domain.models.document_metric import DocumentMetric
+from app.domain.models.document_rice import DocumentRICE
+from app.infrastructure.repositories.comment_repository import CommentRepository
+from app.infrastructure.repositories.document_metric_repository import DocumentMetricRepository
+from app.infrastructure.repositories.document_repository import DocumentRepository
+from app.infrastructure.repositories.document_rice_repository import DocumentRICERepository
+from app.services.base import BaseService
+
+# Document with approvals and steps (joined), comments, metrics, RICE scores. Metrics and
+# RICE are separate collections of the document: joining them would multiply rows, and a
+# selectinload pass issues one statement per relationship anyway.
+DETAIL_QUERY_BUDGET = 4
+
+
+@dataclass(slots=True)
+class DocumentDetailReadModel:
+    """Everything the document detail page renders, loaded as one aggregate."""
+
+    document: Document
+    approval: Approval | None = None
+    approval_steps: list[ApprovalStep] = field(default_factory=list)
+    document_comments: list[Comment] = field(default_factory=list)
+    approval_comments: list[Comment] = field(default_factory=list)
+    metrics: list[DocumentMetric] = field(default_factory=list)
+    rices: list[DocumentRICE] = field(default_factory=list)
+    query_count: int = 0
+
+    def fragment_keys(self, user_id: int) -> dict[str, tuple]:
+        """Return fragment cache keys for each detail-page section.
+
+        Keys are built from the state the section renders: ``updated_at`` and
+        max ids where the tables have them, field values for metrics and RICE
+        scores, which have no version column. Sections with per-user controls
+        also carry the viewer's id.
+        """
+        document = self.document
+        approval = self.approval
+        return {
+            "metrics": (
+                "metrics",
+                document.id,
+                document.status,
+                tuple((metric.id, metric.name, metric.value, metric.unit) for metric in self.metrics),
+            ),
+            "rices": (
+                "rices",
+                document.id,
+                document.status,
+                user_id,
+                tuple(
+                    (rice.id, rice.author_id, rice.reach, rice.impact, rice.confidence, rice.effort, rice.score)
+                    for rice in self.rices
+                ),
+            ),
+            "document_comments": (
+                "document_comments",
+                document.id,
+                len(self.document_comments),
+                max((comment.id for comment in self.document_comments), default=None),
+            ),
+            "approval": (
+                "approval",
+                document.id,
+                document.status,
+                user_id,
+                approval.id if approval else None,
+                approval.updated_at if approval else None,
+                max((step.updated_at for step in self.approval_steps), default=None),
+                len(self.approval_comments),
+                max((comment.id for comment in self.approval_comments), default=None),
+            ),
+        }
+
+
+class DocumentDetailService(BaseService):
+    """Read-side loader for the document detail aggregate."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        """Initialize service with a session."""
+        super().__init__(session)
+        self.documents = DocumentRepository(session)
+
+    async def get_version(self, document_id: int) -> tuple | None:
+        """Return a version tuple of the detail aggregate, or None when it is missing."""
+        return await self.documents.get_detail_version(document_id)
+
+    async def load(self, document_id: int) -> DocumentDetailReadModel | None:
+        """Load an active document aggregate in ``DETAIL_QUERY_BUDGET`` statements.
+
+        The document, approvals and steps come from one joined query; comments,
+        metrics and RICE scores are independent and fetched concurrently.
+        """
+        with count_queries() as counter:
+            document = await self.documents.get_document_with_approvals(document_id)
+            if not document or document.is_archived:
+                return None
+            approval = document.approvals[0] if document.approvals else None
+            comments, metrics, rices = await fan_out_reads(
+                self.session,
+                lambda session: CommentRepository(session).list_for_document_or_approval(
+                    document_id=document.id,
+                    approval_id=approval.id if approval else None,
+                ),
+                lambda session: DocumentMetricRepository(session).list_for_document(document.id),
+                lambda session: DocumentRICERepository(session).list_for_document(document.id),
+            )
+        return DocumentDetailReadModel(
+            document=document,
+            approval=approval,
+            approval_steps=list(approval.steps) if approval else [],
+            document_comments=[comment for comment in comments if comment.document_id == document.id],
+            approval_comments=[
+                comment for comment in comments if approval and comment.approval_id == approval.id
+            ],
+            metrics=metrics,
+            rices=rices,
+            query_count=counter.count,
+        )
@@ -0,0 +1,106 @@
+import csv
+import io
+import json
+from typing import Any, AsyncIterator
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.db.session import session_scope
+from app.domain.models.document import Document
+from app.infrastructure.repositories.document_repository import DocumentRepository
+from app.services.base import BaseService
+
+EXPORT_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+CSV_FIELDS = [
+    "id",
+    "title",
+    "description",
+    "status",
+    "is_archived",
+    "created_at",
+    "updated_at",
+    "approval_status",
+    "metrics",
+    "rices",
+]
+
+
+class DocumentExportService(BaseService):
+    """Service streaming the whole document base as NDJSON or CSV."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        """Initialize service with a session."""
+        super().__init__(session)
+        self.documents = DocumentRepository(session)
+
+    async def iter_rows(self, batch_size: int) -> AsyncIterator[list[dict[str, Any]]]:
+        """Yield batches of export rows."""
+        async for batch in self.documents.stream_export_batches(batch_size):
+            yield [self._to_row(document, approval_status) for document, approval_status in batch]
+
+    async def iter_ndjson(self, batch_size: int) -> AsyncIterator[str]:
+        """Yield NDJSON chunks, one chunk per batch."""
+        async for rows in self.iter_rows(batch_size):
+            yield "".join(json.dumps(row, ensure_ascii=False) + "\n" for row in rows)
+
+    async def iter_csv(self, batch_size: int) -> AsyncIterator[str]:
+        """Yield CSV chunks, starting with the header row."""
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=CSV_FIELDS)
+        writer.writeheader()
+        async for rows in self.iter_rows(batch_size):
+            for row in rows:
+                row["metrics"] = json.dumps(row["metrics"], ensure_ascii=False)
+                row["rices"] = json.dumps(row["rices"])
+            writer.writerows(rows)
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+        if buffer.tell():
+            yield buffer.getvalue()
+
+    def iter_format(self, export_format: str, batch_size: int) -> AsyncIterator[str]:
+        """Return the chunk iterator for the requested format."""
+        if export_format == "csv":
+            return self.iter_csv(batch_size)
+        return self.iter_ndjson(batch_size)
+
+    @staticmethod
+    def _to_row(document: Document, approval_status: str | None) -> dict[str, Any]:
+        """Convert a document with its metrics and RICE scores into a flat export row."""
+        return {
+            "id": document.id,
+            "title": document.title,
+            "description": document.description,
+            "status": document.status,
+            "is_archived": document.is_archived,
+            "created_at": document.created_at.isoformat(),
+            "updated_at": document.updated_at.isoformat(),
+            "approval_status": approval_status,
+            "metrics": [
+                {"name": metric.name, "value": metric.value, "unit": metric.unit} for metric in document.metrics
+            ],
+            "rices": [
+                {
+                    "author_id": rice.author_id,
+                    "reach": rice.reach,
+                    "impact": rice.impact,
+                    "confidence": rice.confidence,
+                    "effort": rice.effort,
+                    "score": rice.score,
+                }
+                for rice in document.rices
+            ],
+        }
+
+
+async def stream_document_export(export_format: str, batch_size: int | None = None) -> AsyncIterator[str]:
+    """Stream an export on a session of its own, so it can outlive the request dependencies."""
+    async with session_scope() as session:
+        service = DocumentExportService(session)
+        async for chunk in service.iter_format(export_format, batch_size or settings.export_batch_size):
+            yield chunk
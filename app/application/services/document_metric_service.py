@@ -1,10 +1,16 @@
+import logging
+
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.fragment_cache import fragment_cache
 from app.domain.enums import DocumentStatus
+from app.domain.metric_values import normalize_metric
 from app.infrastructure.repositories.document_metric_repository import DocumentMetricRepository
 from app.infrastructure.repositories.document_repository import DocumentRepository
 from app.services.base import BaseService
 
+logger = logging.getLogger(__name__)
+
 
 class DocumentMetricService(BaseService):
     """Service layer for document metrics."""
@@ -16,10 +22,14 @@ class DocumentMetricService(BaseService):
         self.metrics = DocumentMetricRepository(session)
 
     async def add_metric(self, document_id: int, name: str, value: str, unit: str):
-        """Add a metric to a document."""
+        """Add a metric to a document; the value must parse as a number."""
         if not name or not value or not unit:
             return None
-        async with self.session.begin():
+        normalized = normalize_metric(value, unit)
+        if normalized is None:
+            return None
+        value_numeric, unit_normalized = normalized
+        async with self.uow:
             document = await self.documents.get_document(document_id)
             if not document or document.is_archived:
                 return None
@@ -28,13 +38,27 @@ class DocumentMetricService(BaseService):
                 DocumentStatus.REVISION_REQUIRED.value,
             }:
                 return None
-            return await self.metrics.create_metric(document_id=document_id, name=name, value=value, unit=unit)
+            metric = await self.metrics.create_metric(
+                document_id=document_id,
+                name=name,
+                value=value,
+                unit=unit,
+                value_numeric=value_numeric,
+                unit_normalized=unit_normalized,
+            )
+            await self.documents.touch_document(document)
+        fragment_cache.invalidate_document(document_id, "metrics")
+        return metric
 
     async def update_metric(self, document_id: int, metric_id: int, name: str, value: str, unit: str):
-        """Update a metric in a document."""
+        """Update a metric in a document; the value must parse as a number."""
         if not name or not value or not unit:
             return None
-        async with self.session.begin():
+        normalized = normalize_metric(value, unit)
+        if normalized is None:
+            return None
+        value_numeric, unit_normalized = normalized
+        async with self.uow:
             document = await self.documents.get_document(document_id)
             if not document or document.is_archived:
                 return None
@@ -46,11 +70,21 @@ class DocumentMetricService(BaseService):
             metric = await self.metrics.get_metric(metric_id)
             if not metric or metric.document_id != document_id:
                 return None
-            return await self.metrics.update_metric(metric, name=name, value=value, unit=unit)
+            metric = await self.metrics.update_metric(
+                metric,
+                name=name,
+                value=value,
+                unit=unit,
+                value_numeric=value_numeric,
+                unit_normalized=unit_normalized,
+            )
+            await self.documents.touch_document(document)
+        fragment_cache.invalidate_document(document_id, "metrics")
+        return metric
 
     async def delete_metric(self, document_id: int, metric_id: int) -> bool:
         """Delete a metric from a document."""
-        async with self.session.begin():
+        async with self.uow:
             document = await self.documents.get_document(document_id)
             if not document or document.is_archived:
                 return False
@@ -63,8 +97,47 @@ class DocumentMetricService(BaseService):
             if not metric or metric.document_id != document_id:
                 return False
             await self.metrics.delete_metric(metric)
-            return True
+            await self.documents.touch_document(document)
+        fragment_cache.invalidate_document(document_id, "metrics")
+        return True
 
     async def list_metrics_for_document(self, document_id: int):
         """List metrics for a document."""
         return await self.metrics.list_for_document(document_id)
+
+    async def list_metrics_for_documents(self, document_ids: list[int]):
+        """List metric rows for many documents, grouped by document id."""
+        return await self.metrics.list_for_documents(document_ids)
+
+    async def rollup_metrics(self, statuses: list[str] | None = None):
+        """Return totals and averages of numeric metrics by name and unit."""
+        return await self.metrics.rollup(statuses)
+
+    async def backfill_numeric_values(self, chunk_size: int) -> tuple[int, int]:
+        """Parse string values of untyped metrics chunk by chunk; return (typed, left unparsed)."""
+        typed = unparsed = 0
+        after_id = 0
+        while True:
+            async with self.uow:
+                rows = await self.metrics.list_untyped_chunk(after_id, chunk_size)
+                if not rows:
+                    break
+                updates = []
+                for metric_id, value, unit in rows:
+                    normalized = normalize_metric(value, unit)
+                    if normalized is None:
+                        unparsed += 1
+                        continue
+                    updates.append({"id": metric_id, "value_numeric": normalized[0], "unit_normalized": normalized[1]})
+                if updates:
+                    await self.metrics.bulk_update_metrics(updates)
+            after_id = rows[-1][0]
+            typed += len(updates)
+            logger.info(
+                "Metric backfill progress: %d typed, %d unparsed, last id %d",
+                typed,
+                unparsed,
+                after_id,
+                extra={"typed": typed, "unparsed": unparsed, "after_id": after_id},
+            )
+        return typed, unparsed
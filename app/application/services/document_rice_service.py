@@ -1,8 +1,10 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.fragment_cache import fragment_cache
 from app.domain.enums import DocumentStatus
 from app.domain.models.document_rice import DocumentRICE
 from app.infrastructure.repositories.document_repository import DocumentRepository
+from app.infrastructure.repositories.document_rice_aggregate_repository import DocumentRICEAggregateRepository
 from app.infrastructure.repositories.document_rice_repository import DocumentRICERepository
 from app.services.base import BaseService
 
@@ -15,6 +17,7 @@ class DocumentRICEService(BaseService):
         super().__init__(session)
         self.documents = DocumentRepository(session)
         self.rices = DocumentRICERepository(session)
+        self.aggregates = DocumentRICEAggregateRepository(session)
 
     async def add_rice(self, document_id: int, author_id: int, data: dict) -> DocumentRICE | None:
         """Add a RICE score to a document."""
@@ -24,14 +27,14 @@ class DocumentRICEService(BaseService):
         effort = data.get("effort")
         if reach is None or impact is None or confidence is None or effort is None:
             return None
-        async with self.session.begin():
+        async with self.uow:
             document = await self.documents.get_document(document_id)
             if not document or document.is_archived:
                 return None
             if document.status != DocumentStatus.APPROVAL.value:
                 return None
             score = self.calc_score(reach, impact, confidence, effort)
-            return await self.rices.create_rice(
+            rice = await self.rices.create_rice(
                 document_id=document_id,
                 author_id=author_id,
                 reach=reach,
@@ -40,6 +43,10 @@ class DocumentRICEService(BaseService):
                 effort=effort,
                 score=score,
             )
+            await self.aggregates.refresh_document(document.id)
+            await self.documents.touch_document(document)
+        fragment_cache.invalidate_document(rice.document_id, "rices")
+        return rice
 
     async def update_rice(self, rice_id: int, author_id: int, data: dict) -> DocumentRICE | None:
         """Update a RICE score for a document."""
@@ -49,7 +56,7 @@ class DocumentRICEService(BaseService):
         effort = data.get("effort")
         if reach is None or impact is None or confidence is None or effort is None:
             return None
-        async with self.session.begin():
+        async with self.uow:
             rice = await self.rices.get_rice(rice_id)
             if not rice:
                 return None
@@ -61,7 +68,7 @@ class DocumentRICEService(BaseService):
             if document.status != DocumentStatus.APPROVAL.value:
                 return None
             score = self.calc_score(reach, impact, confidence, effort)
-            return await self.rices.update_rice(
+            rice = await self.rices.update_rice(
                 rice=rice,
                 reach=reach,
                 impact=impact,
@@ -69,10 +76,26 @@ class DocumentRICEService(BaseService):
                 effort=effort,
                 score=score,
             )
+            await self.aggregates.refresh_document(document.id)
+            await self.documents.touch_document(document)
+        fragment_cache.invalidate_document(rice.document_id, "rices")
+        return rice
 
-    async def list_rice_for_document(self, document_id: int) -> list[DocumentRICE]:
-        """List RICE scores for a document."""
-        return await self.rices.list_for_document(document_id)
+    async def get_rice_version(self, document_id: int) -> tuple:
+        """Return a version tuple of a document's RICE scores."""
+        return await self.rices.get_version_for_document(document_id)
+
+    async def list_rice_rows_for_document(self, document_id: int):
+        """List RICE score rows for a document, ready for JSON encoding."""
+        return await self.rices.list_rows_for_document(document_id)
+
+    async def list_rice_for_documents(self, document_ids: list[int]):
+        """List RICE score rows for many documents, grouped by document id."""
+        return await self.rices.list_for_documents(document_ids)
+
+    async def rank_documents(self, limit: int, statuses: list[str] | None = None):
+        """List the top documents by aggregate RICE score, optionally filtered by status."""
+        return await self.aggregates.list_ranking(limit, statuses)
 
     def calc_score(self, reach: float, impact: float, confidence: float, effort: float) -> float:
         """Calculate RICE score."""
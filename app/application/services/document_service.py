@@ -1,8 +1,12 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.fragment_cache import fragment_cache
+from app.core.pagination import decode_cursor, encode_cursor
 from app.domain.approval_rules import can_transition_document_status
 from app.domain.enums import DocumentStatus
+from app.infrastructure.repositories.approver_inbox_repository import ApproverInboxRepository
 from app.infrastructure.repositories.document_repository import DocumentRepository
+from app.infrastructure.repositories.search_repository import SearchRepository
 from app.schemas.document import DocumentCreate, DocumentUpdate
 from app.services.base import BaseService
 
@@ -14,20 +18,23 @@ class DocumentService(BaseService):
         """Initialize service with a session."""
         super().__init__(session)
         self.repository = DocumentRepository(session)
+        self.inbox = ApproverInboxRepository(session)
+        self.search_index = SearchRepository(session)
 
     async def create_draft(self, payload: DocumentCreate):
         """Create a document draft."""
-        async with self.session.begin():
+        async with self.uow:
             document = await self.repository.create_document(
                 title=payload.title,
                 description=payload.description,
             )
             document.status = DocumentStatus.DRAFT.value
+            await self.search_index.index("document", [document])
             return document
 
     async def update_draft(self, document_id: int, payload: DocumentUpdate):
         """Update an existing document draft."""
-        async with self.session.begin():
+        async with self.uow:
             document = await self.repository.get_document(document_id=document_id)
             if not document:
                 return None
@@ -38,11 +45,13 @@ class DocumentService(BaseService):
                 DocumentStatus.REVISION_REQUIRED.value,
             }:
                 return None
-            return await self.repository.update_document(
+            document = await self.repository.update_document(
                 document=document,
                 title=payload.title,
                 description=payload.description,
             )
+            await self.search_index.index("document", [document])
+            return document
 
     async def get_document(self, document_id: int):
         """Get a document by identifier."""
@@ -53,23 +62,44 @@ class DocumentService(BaseService):
             return None
         return document
 
-    async def list_documents(self):
-        """List all active documents."""
-        return await self.repository.list_documents()
+    async def list_documents(
+        self,
+        limit: int,
+        cursor: str | None = None,
+        status: str | None = None,
+        title_prefix: str | None = None,
+    ):
+        """Return a page of active documents and the cursor of the next page."""
+        documents = await self.repository.list_documents(
+            limit=limit + 1,
+            after=decode_cursor(cursor),
+            status=status,
+            title_prefix=title_prefix,
+        )
+        next_cursor = None
+        if len(documents) > limit:
+            documents = documents[:limit]
+            last = documents[-1]
+            next_cursor = encode_cursor(last.created_at, last.id)
+        return documents, next_cursor
 
     async def archive_document(self, document_id: int):
         """Archive a document draft."""
-        async with self.session.begin():
+        async with self.uow:
             document = await self.repository.get_document(document_id=document_id)
             if not document:
                 return None
             if document.is_archived:
                 return document
-            return await self.repository.archive_document(document)
+            document = await self.repository.archive_document(document)
+            await self.inbox.refresh_document(document.id)
+            await self.search_index.index_document_tree(document.id)
+        fragment_cache.invalidate_document(document_id)
+        return document
 
     async def restore_from_canceled(self, document_id: int):
         """Restore a canceled document back to draft."""
-        async with self.session.begin():
+        async with self.uow:
             document = await self.repository.get_document(document_id=document_id)
             if not document:
                 return None
@@ -81,4 +111,5 @@ class DocumentService(BaseService):
             if not can_transition_document_status(current_status, DocumentStatus.DRAFT):
                 return None
             document.status = DocumentStatus.DRAFT.value
-            return document
+        fragment_cache.invalidate_document(document_id)
+        return document
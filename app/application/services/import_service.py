@@ -0,0 +1,172 @@
+import csv
+import json
+import logging
+from dataclasses import dataclass
+from itertools import islice
+from pathlib import Path
+from typing import Any, Iterator
+
+from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.session import SessionLocal
+from app.domain.metric_values import normalize_metric
+from app.infrastructure.repositories.document_metric_repository import DocumentMetricRepository
+from app.infrastructure.repositories.document_repository import DocumentRepository
+from app.infrastructure.repositories.search_repository import SearchRepository
+from app.modules.records.repository import RecordRepository
+from app.schemas.document import DocumentImport, DocumentMetricCreate
+from app.schemas.record import RecordCreate
+from app.services.base import BaseService
+
+logger = logging.getLogger(__name__)
+
+IMPORT_TARGETS = ("documents", "records")
+IMPORT_FORMATS = ("ndjson", "csv")
+
+
+@dataclass(slots=True)
+class ImportResult:
+    """Counters of a finished bulk import."""
+
+    imported: int = 0
+    rejected: int = 0
+    last_row: int = 0
+
+
+def detect_format(path: str) -> str:
+    """Guess the import format from the file extension."""
+    return "csv" if Path(path).suffix.lower() == ".csv" else "ndjson"
+
+
+def iter_rows(path: str, import_format: str, offset: int = 0) -> Iterator[tuple[int, dict[str, Any] | None]]:
+    """Yield (row number, raw row) pairs from a file, skipping the first ``offset`` data rows.
+
+    Rows that cannot be parsed are yielded as None so the caller can count them.
+    """
+    with open(path, encoding="utf-8", newline="") as stream:
+        if import_format == "csv":
+            rows: Iterator[Any] = csv.DictReader(stream)
+        else:
+            rows = (line for line in stream if line.strip())
+        for row_number, raw in enumerate(islice(rows, offset, None), start=offset + 1):
+            if import_format == "csv":
+                yield row_number, _decode_csv_row(raw)
+                continue
+            try:
+                yield row_number, json.loads(raw)
+            except json.JSONDecodeError:
+                yield row_number, None
+
+
+def _decode_csv_row(row: dict[str, Any]) -> dict[str, Any] | None:
+    """Decode JSON-encoded nested columns of a CSV row, as written by the exporter."""
+    metrics = row.get("metrics")
+    if isinstance(metrics, str):
+        try:
+            row["metrics"] = json.loads(metrics) if metrics.strip() else []
+        except json.JSONDecodeError:
+            return None
+    return row
+
+
+class ImportService(BaseService):
+    """Service inserting validated import rows batch by batch, one transaction per batch."""
+
+    def __init__(self, session: AsyncSession, target: str) -> None:
+        """Initialize the service for a target table."""
+        super().__init__(session)
+        self.target = target
+        self.documents = DocumentRepository(session)
+        self.metrics = DocumentMetricRepository(session)
+        self.records = RecordRepository(session)
+        self.search_index = SearchRepository(session)
+
+    def validate(self, raw: dict[str, Any] | None) -> DocumentImport | RecordCreate | None:
+        """Validate a raw row with the target schema, returning None for invalid rows."""
+        if not isinstance(raw, dict):
+            return None
+        schema = DocumentImport if self.target == "documents" else RecordCreate
+        try:
+            return schema.model_validate(raw)
+        except ValidationError:
+            return None
+
+    @staticmethod
+    def _metric_row(document_id: int, metric: DocumentMetricCreate) -> dict[str, Any]:
+        """Build a metric insert row with its typed value; the schema has already checked the value parses."""
+        value_numeric, unit_normalized = normalize_metric(metric.value, metric.unit)
+        return {
+            "document_id": document_id,
+            **metric.model_dump(),
+            "value_numeric": value_numeric,
+            "unit_normalized": unit_normalized,
+        }
+
+    async def insert_batch(self, batch: list[Any]) -> None:
+        """Insert a batch of validated rows in its own transaction."""
+        async with self.uow:
+            if self.target == "records":
+                after_id = await self.search_index.max_source_id("record")
+                await self.records.bulk_create_records(
+                    [{"title": item.title, "description": item.description} for item in batch]
+                )
+                await self.search_index.index_after("record", after_id)
+                return
+            after_id = await self.search_index.max_source_id("document")
+            has_metrics = any(item.metrics for item in batch)
+            document_ids = await self.documents.bulk_create_documents(
+                [{"title": item.title, "description": item.description} for item in batch],
+                return_ids=has_metrics,
+            )
+            if has_metrics:
+                await self.metrics.bulk_create_metrics(
+                    [
+                        self._metric_row(document_id, metric)
+                        for document_id, item in zip(document_ids, batch)
+                        for metric in item.metrics
+                    ]
+                )
+            await self.search_index.index_after("document", after_id)
+
+
+async def import_file(
+    target: str,
+    path: str,
+    import_format: str | None = None,
+    batch_size: int = 1000,
+    offset: int = 0,
+) -> ImportResult:
+    """Stream a file into the database, committing every ``batch_size`` valid rows.
+
+    Progress is logged after each commit with the last committed row number;
+    pass it back as ``offset`` to resume an interrupted import.
+    """
+    import_format = import_format or detect_format(path)
+    result = ImportResult(last_row=offset)
+    batch: list[Any] = []
+    async with SessionLocal() as session:
+        service = ImportService(session, target)
+        for row_number, raw in iter_rows(path, import_format, offset):
+            item = service.validate(raw)
+            if item is None:
+                result.rejected += 1
+                logger.warning("Import row %d rejected", row_number, extra={"target": target, "row": row_number})
+            else:
+                batch.append(item)
+            if len(batch) >= batch_size:
+                await service.insert_batch(batch)
+                result.imported += len(batch)
+                result.last_row = row_number
+                batch = []
+                logger.info(
+                    "Import progress: %d rows committed, resume with --offset %d",
+                    result.imported,
+                    result.last_row,
+                    extra={"target": target, "imported": result.imported, "offset": result.last_row},
+                )
+        if batch:
+            await service.insert_batch(batch)
+            result.imported += len(batch)
+        result.last_row = offset + result.imported + result.rejected
+    return result
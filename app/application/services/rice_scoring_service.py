@@ -0,0 +1,170 @@
+import logging
+from dataclasses import dataclass
+from typing import Any, AsyncIterator
+
+import numpy as np
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.infrastructure.repositories.document_repository import DocumentRepository
+from app.infrastructure.repositories.document_rice_aggregate_repository import DocumentRICEAggregateRepository
+from app.infrastructure.repositories.document_rice_repository import DocumentRICERepository
+from app.services.base import BaseService
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class RICEScenario:
+    """Multipliers applied to the stored RICE factors before scoring."""
+
+    reach: float = 1.0
+    impact: float = 1.0
+    confidence: float = 1.0
+    effort: float = 1.0
+
+    @property
+    def is_identity(self) -> bool:
+        """Return True when the scenario leaves every factor unchanged."""
+        return self.reach == self.impact == self.confidence == self.effort == 1.0
+
+
+@dataclass(slots=True)
+class RICEChunk:
+    """Column arrays of one chunk of RICE rows, with factors already scaled by the scenario."""
+
+    ids: np.ndarray
+    document_ids: np.ndarray
+    reach: np.ndarray
+    impact: np.ndarray
+    confidence: np.ndarray
+    effort: np.ndarray
+    stored_scores: np.ndarray
+    scores: np.ndarray
+
+
+def score_arrays(reach: np.ndarray, impact: np.ndarray, confidence: np.ndarray, effort: np.ndarray) -> np.ndarray:
+    """Vectorized ``DocumentRICEService.calc_score``: scores are 0 where effort is not positive."""
+    scores = np.zeros(effort.shape, dtype=np.float64)
+    np.divide(reach * impact * confidence, effort, out=scores, where=effort > 0)
+    return scores
+
+
+class RICEScoringService(BaseService):
+    """Service rescoring every RICE row in chunks, persisted or as a read-only what-if."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        """Initialize service with a session."""
+        super().__init__(session)
+        self.documents = DocumentRepository(session)
+        self.rices = DocumentRICERepository(session)
+        self.aggregates = DocumentRICEAggregateRepository(session)
+
+    async def load_chunk(self, scenario: RICEScenario, after_id: int, chunk_size: int) -> RICEChunk | None:
+        """Load and score the RICE rows following an id, or return None past the last row."""
+        rows = await self.rices.list_factor_chunk(after_id, chunk_size)
+        if not rows:
+            return None
+        columns = np.array([tuple(row) for row in rows], dtype=np.float64).T
+        reach = columns[2] * scenario.reach
+        impact = columns[3] * scenario.impact
+        confidence = columns[4] * scenario.confidence
+        effort = columns[5] * scenario.effort
+        return RICEChunk(
+            ids=columns[0].astype(np.int64),
+            document_ids=columns[1].astype(np.int64),
+            reach=reach,
+            impact=impact,
+            confidence=confidence,
+            effort=effort,
+            stored_scores=columns[6],
+            scores=score_arrays(reach, impact, confidence, effort),
+        )
+
+    async def iter_chunks(self, scenario: RICEScenario, chunk_size: int) -> AsyncIterator[RICEChunk]:
+        """Yield scored chunks of RICE rows, paging by id."""
+        after_id = 0
+        while (chunk := await self.load_chunk(scenario, after_id, chunk_size)) is not None:
+            yield chunk
+            after_id = int(chunk.ids[-1])
+
+    async def rescore(self, scenario: RICEScenario, chunk_size: int) -> int:
+        """Persist scaled factors and recomputed scores, one transaction per chunk; return rows updated.
+
+        Without scaling only rows whose stored score differs are written. Aggregates
+        are rebuilt once at the end.
+        """
+        updated = 0
+        after_id = 0
+        while True:
+            async with self.uow:
+                chunk = await self.load_chunk(scenario, after_id, chunk_size)
+                if chunk is None:
+                    break
+                if scenario.is_identity:
+                    changed = np.flatnonzero(chunk.scores != chunk.stored_scores)
+                else:
+                    changed = np.arange(len(chunk.ids))
+                if len(changed):
+                    await self.rices.bulk_update_rices(
+                        [
+                            {
+                                "id": int(chunk.ids[index]),
+                                "reach": float(chunk.reach[index]),
+                                "impact": float(chunk.impact[index]),
+                                "confidence": float(chunk.confidence[index]),
+                                "effort": float(chunk.effort[index]),
+                                "score": float(chunk.scores[index]),
+                            }
+                            for index in changed.tolist()
+                        ]
+                    )
+                    await self.documents.touch_documents(np.unique(chunk.document_ids[changed]).tolist())
+            after_id = int(chunk.ids[-1])
+            updated += len(changed)
+            logger.info("RICE rescore progress: %d rows updated", updated, extra={"updated": updated})
+        async with self.uow:
+            await self.aggregates.rebuild()
+        return updated
+
+    async def what_if(self, scenario: RICEScenario, chunk_size: int, limit: int) -> list[dict[str, Any]]:
+        """Rank active documents by the weighted score they would get under a scenario, writing nothing.
+
+        The weighted score follows the aggregate table: the confidence-weighted mean,
+        or the plain mean when confidences sum to zero.
+        """
+        document_ids = np.empty(0, dtype=np.int64)
+        counts = np.empty(0, dtype=np.float64)
+        score_sums = np.empty(0, dtype=np.float64)
+        weighted_sums = np.empty(0, dtype=np.float64)
+        confidence_sums = np.empty(0, dtype=np.float64)
+        async for chunk in self.iter_chunks(scenario, chunk_size):
+            document_ids = np.concatenate([document_ids, chunk.document_ids])
+            counts = np.concatenate([counts, np.ones(len(chunk.ids))])
+            score_sums = np.concatenate([score_sums, chunk.scores])
+            weighted_sums = np.concatenate([weighted_sums, chunk.scores * chunk.confidence])
+            confidence_sums = np.concatenate([confidence_sums, chunk.confidence])
+            document_ids, inverse = np.unique(document_ids, return_inverse=True)
+            counts = np.bincount(inverse, weights=counts, minlength=len(document_ids))
+            score_sums = np.bincount(inverse, weights=score_sums, minlength=len(document_ids))
+            weighted_sums = np.bincount(inverse, weights=weighted_sums, minlength=len(document_ids))
+            confidence_sums = np.bincount(inverse, weights=confidence_sums, minlength=len(document_ids))
+        archived = await self.documents.list_archived_ids()
+        if archived:
+            active = ~np.isin(document_ids, np.fromiter(archived, dtype=np.int64, count=len(archived)))
+            document_ids = document_ids[active]
+            counts = counts[active]
+            score_sums = score_sums[active]
+            weighted_sums = weighted_sums[active]
+            confidence_sums = confidence_sums[active]
+        weighted = np.divide(score_sums, counts, out=np.zeros_like(score_sums), where=counts > 0)
+        np.divide(weighted_sums, confidence_sums, out=weighted, where=confidence_sums != 0)
+        top = np.lexsort((-document_ids, -weighted))[:limit]
+        return [
+            {
+                "rank": rank,
+                "document_id": int(document_ids[index]),
+                "rice_count": int(counts[index]),
+                "weighted_score": float(weighted[index]),
+            }
+            for rank, index in enumerate(top.tolist(), start=1)
+        ]
@@ -0,0 +1,84 @@
+from dataclasses import dataclass
+
+from markupsafe import Markup, escape
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.infrastructure.repositories.search_repository import (
+    SNIPPET_END,
+    SNIPPET_START,
+    SearchRepository,
+    search_terms,
+)
+from app.services.base import BaseService
+
+SEARCH_KIND_LABELS = {
+    "document": "Документ",
+    "comment": "Комментарий",
+    "record": "Запись",
+}
+
+
+@dataclass(slots=True)
+class SearchHit:
+    """One ranked search result ready for rendering."""
+
+    kind: str
+    object_id: int
+    document_id: int | None
+    title: str
+    snippet: Markup
+
+    @property
+    def url(self) -> str | None:
+        """Return the page that shows the hit."""
+        if self.kind == "record":
+            return f"/records/{self.object_id}/edit"
+        if self.document_id is None:
+            return None
+        return f"/documents/{self.document_id}"
+
+    @property
+    def label(self) -> str:
+        """Return the human-readable kind of the hit."""
+        return SEARCH_KIND_LABELS[self.kind]
+
+
+def highlight(snippet: str) -> Markup:
+    """Escape a snippet and turn its match markers into ``<mark>`` tags."""
+    return (
+        escape(snippet)
+        .replace(SNIPPET_START, Markup("<mark>"))
+        .replace(SNIPPET_END, Markup("</mark>"))
+    )
+
+
+class SearchService(BaseService):
+    """Service layer for full-text search."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        """Initialize service with a session."""
+        super().__init__(session)
+        self.search_index = SearchRepository(session)
+
+    async def search(self, query: str, kind: str | None, offset: int, limit: int) -> tuple[list[SearchHit], bool]:
+        """Return a page of ranked hits and whether another page follows."""
+        terms = search_terms(query)
+        if not terms:
+            return [], False
+        rows = await self.search_index.search(terms, kind, limit=limit + 1, offset=offset)
+        hits = [
+            SearchHit(
+                kind=row["kind"],
+                object_id=row["object_id"],
+                document_id=row["document_id"],
+                title=row["title"],
+                snippet=highlight(row["snippet"] or ""),
+            )
+            for row in rows[:limit]
+        ]
+        return hits, len(rows) > limit
+
+    async def rebuild_index(self) -> int:
+        """Rebuild the search index from scratch and return the number of entries."""
+        async with self.uow:
+            return await self.search_index.rebuild()
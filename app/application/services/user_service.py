@@ -1,6 +1,7 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.security import get_password_hash, verify_password
+from app.core.principal_cache import principal_cache
+from app.core.security import password_hasher
 from app.infrastructure.repositories.user_repository import UserRepository
 from app.services.base import BaseService
 
@@ -15,11 +16,11 @@ class UserService(BaseService):
 
     async def register_user(self, email: str, full_name: str, password: str):
         """Register a new user."""
-        async with self.session.begin():
+        async with self.uow:
             existing = await self.repository.get_by_email(email)
             if existing:
                 return None
-            password_hash = get_password_hash(password)
+            password_hash = await password_hasher.hash(password)
             return await self.repository.create(email=email, full_name=full_name, password_hash=password_hash)
 
     async def authenticate_user(self, email: str, password: str):
@@ -29,7 +30,7 @@ class UserService(BaseService):
             return None
         if not user.is_active:
             return None
-        if not verify_password(password, user.password_hash):
+        if not await password_hasher.verify(password, user.password_hash):
             return None
         return user
 
@@ -45,22 +46,30 @@ class UserService(BaseService):
         password: str | None,
     ):
         """Update an existing user."""
-        async with self.session.begin():
+        async with self.uow:
             user = await self.repository.get_by_id(user_id)
             if not user:
                 return None
-            password_hash = get_password_hash(password) if password is not None else None
-            return await self.repository.update(
+            previous_email = user.email
+            password_hash = await password_hasher.hash(password) if password is not None else None
+            user = await self.repository.update(
                 user=user,
                 email=email,
                 full_name=full_name,
                 password_hash=password_hash,
             )
+            # Invalidating before the commit would let a concurrent request cache the old principal again.
+            emails = (previous_email, user.email)
+            self.uow.after_commit(lambda: principal_cache.invalidate(*emails))
+        return user
 
     async def deactivate_user(self, user_id: int):
         """Deactivate an existing user."""
-        async with self.session.begin():
+        async with self.uow:
             user = await self.repository.get_by_id(user_id)
             if not user:
                 return None
-            return await self.repository.deactivate(user)
+            user = await self.repository.deactivate(user)
+            email = user.email
+            self.uow.after_commit(lambda: principal_cache.invalidate(email))
+        return user
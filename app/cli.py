@@ -1,12 +1,23 @@
 import argparse
 import asyncio
+import json
 import logging
+import sys
+import time
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.security import get_password_hash
+from app import models  # noqa: F401
+from app.application.services.document_export_service import EXPORT_MEDIA_TYPES, stream_document_export
+from app.application.services.document_metric_service import DocumentMetricService
+from app.application.services.import_service import IMPORT_FORMATS, IMPORT_TARGETS, import_file
+from app.application.services.rice_scoring_service import RICEScenario, RICEScoringService
+from app.application.services.search_service import SearchService
+from app.core.security import password_hasher
 from app.core.logger import setup_logging
-from app.db.session import SessionLocal
+from app.db.session import SessionLocal, engine
+from app.infrastructure.repositories.approver_inbox_repository import ApproverInboxRepository
+from app.infrastructure.repositories.document_rice_aggregate_repository import DocumentRICEAggregateRepository
 from app.repositories.user_repository import UserRepository
 
 logger = logging.getLogger(__name__)
@@ -15,7 +26,7 @@ logger = logging.getLogger(__name__)
 async def create_user(session: AsyncSession, username: str, password: str) -> None:
     """Create a user with the provided credentials."""
     repository = UserRepository(session)
-    hashed_password = get_password_hash(password)
+    hashed_password = await password_hasher.hash(password)
     await repository.create_user(username=username, hashed_password=hashed_password)
     logger.info("User created", extra={"username": username})
 
@@ -24,6 +35,114 @@ async def run_create_user(username: str, password: str) -> None:
     """Run the create user workflow in an async session."""
     async with SessionLocal() as session:
         await create_user(session, username, password)
+    await engine.dispose()
+
+
+async def run_rebuild_inbox() -> None:
+    """Rebuild the approver inbox from approval steps."""
+    try:
+        async with SessionLocal() as session:
+            async with session.begin():
+                total = await ApproverInboxRepository(session).rebuild()
+    finally:
+        await engine.dispose()
+    logger.info("Approver inbox rebuilt", extra={"entries": total})
+
+
+async def run_rebuild_rice_aggregates() -> None:
+    """Rebuild per-document RICE aggregates from RICE scores."""
+    try:
+        async with SessionLocal() as session:
+            async with session.begin():
+                total = await DocumentRICEAggregateRepository(session).rebuild()
+    finally:
+        await engine.dispose()
+    logger.info("RICE aggregates rebuilt", extra={"documents": total})
+
+
+async def run_backfill_metric_values(chunk_size: int) -> None:
+    """Fill typed values of metrics stored before the numeric columns existed."""
+    try:
+        async with SessionLocal() as session:
+            typed, unparsed = await DocumentMetricService(session).backfill_numeric_values(chunk_size)
+    finally:
+        await engine.dispose()
+    logger.info(
+        "Metric backfill finished: %d typed, %d unparsed",
+        typed,
+        unparsed,
+        extra={"typed": typed, "unparsed": unparsed},
+    )
+
+
+async def run_rebuild_search() -> None:
+    """Rebuild the full-text search index from documents, comments and records."""
+    try:
+        async with SessionLocal() as session:
+            total = await SearchService(session).rebuild_index()
+    finally:
+        await engine.dispose()
+    logger.info("Search index rebuilt: %d entries", total, extra={"entries": total})
+
+
+async def run_export(export_format: str, output: str, batch_size: int | None) -> None:
+    """Write the document export to a file or stdout."""
+    started = time.perf_counter()
+    written = 0
+    stream = sys.stdout if output == "-" else open(output, "w", encoding="utf-8", newline="")
+    try:
+        async for chunk in stream_document_export(export_format, batch_size):
+            stream.write(chunk)
+            written += len(chunk)
+    finally:
+        if stream is not sys.stdout:
+            stream.close()
+        await engine.dispose()
+    logger.info(
+        "Documents exported",
+        extra={"format": export_format, "output": output, "chars": written, "seconds": time.perf_counter() - started},
+    )
+
+
+async def run_import(target: str, path: str, import_format: str | None, batch_size: int, offset: int) -> None:
+    """Bulk import documents or records from an NDJSON or CSV file."""
+    started = time.perf_counter()
+    try:
+        result = await import_file(target, path, import_format, batch_size, offset)
+    finally:
+        await engine.dispose()
+    logger.info(
+        "Import finished: %d rows imported, %d rejected",
+        result.imported,
+        result.rejected,
+        extra={
+            "target": target,
+            "imported": result.imported,
+            "rejected": result.rejected,
+            "offset": result.last_row,
+            "seconds": time.perf_counter() - started,
+        },
+    )
+
+
+async def run_rescore_rice(scenario: RICEScenario, chunk_size: int, what_if: bool, limit: int) -> None:
+    """Rescore every RICE row, or print the ranking a scenario would produce without saving it."""
+    started = time.perf_counter()
+    try:
+        async with SessionLocal() as session:
+            service = RICEScoringService(session)
+            if what_if:
+                for row in await service.what_if(scenario, chunk_size, limit):
+                    sys.stdout.write(json.dumps(row) + "\n")
+                return
+            updated = await service.rescore(scenario, chunk_size)
+    finally:
+        await engine.dispose()
+    logger.info(
+        "RICE rescore finished: %d rows updated",
+        updated,
+        extra={"updated": updated, "seconds": time.perf_counter() - started},
+    )
 
 
 def parse_args() -> argparse.Namespace:
@@ -33,6 +152,27 @@ def parse_args() -> argparse.Namespace:
     create_user_parser = subparsers.add_parser("create-user", help="Create a new user")
     create_user_parser.add_argument("--username", required=True)
     create_user_parser.add_argument("--password", required=True)
+    subparsers.add_parser("rebuild-inbox", help="Rebuild the approver inbox from approval steps")
+    subparsers.add_parser("rebuild-rice-aggregates", help="Rebuild per-document RICE aggregates")
+    subparsers.add_parser("rebuild-search", help="Rebuild the full-text search index")
+    backfill_parser = subparsers.add_parser("backfill-metric-values", help="Parse metric values into numeric columns")
+    backfill_parser.add_argument("--chunk-size", type=int, default=5000, help="Metrics per read and transaction")
+    export_parser = subparsers.add_parser("export", help="Export all documents as NDJSON or CSV")
+    export_parser.add_argument("--format", dest="export_format", choices=sorted(EXPORT_MEDIA_TYPES), default="ndjson")
+    export_parser.add_argument("--output", default="-", help="File path, or - for stdout")
+    export_parser.add_argument("--batch-size", type=int, default=None)
+    rescore_parser = subparsers.add_parser("rescore-rice", help="Recompute every RICE score, optionally rescaling factors")
+    for factor in ("reach", "impact", "confidence", "effort"):
+        rescore_parser.add_argument(f"--{factor}-scale", type=float, default=1.0, help=f"Multiply {factor} by this factor")
+    rescore_parser.add_argument("--chunk-size", type=int, default=10000, help="Rows per read and transaction")
+    rescore_parser.add_argument("--what-if", action="store_true", help="Print the resulting ranking without saving")
+    rescore_parser.add_argument("--limit", type=int, default=20, help="Documents to print in what-if mode")
+    import_parser = subparsers.add_parser("import", help="Bulk import documents or records from NDJSON or CSV")
+    import_parser.add_argument("target", choices=IMPORT_TARGETS)
+    import_parser.add_argument("--input", required=True, help="Path to an NDJSON or CSV file")
+    import_parser.add_argument("--format", dest="import_format", choices=IMPORT_FORMATS, default=None)
+    import_parser.add_argument("--batch-size", type=int, default=1000, help="Rows per executemany and transaction")
+    import_parser.add_argument("--offset", type=int, default=0, help="Skip this many data rows to resume an import")
     return parser.parse_args()
 
 
@@ -42,6 +182,26 @@ def main() -> None:
     args = parse_args()
     if args.command == "create-user":
         asyncio.run(run_create_user(args.username, args.password))
+    elif args.command == "rebuild-inbox":
+        asyncio.run(run_rebuild_inbox())
+    elif args.command == "rebuild-rice-aggregates":
+        asyncio.run(run_rebuild_rice_aggregates())
+    elif args.command == "rebuild-search":
+        asyncio.run(run_rebuild_search())
+    elif args.command == "backfill-metric-values":
+        asyncio.run(run_backfill_metric_values(args.chunk_size))
+    elif args.command == "export":
+        asyncio.run(run_export(args.export_format, args.output, args.batch_size))
+    elif args.command == "rescore-rice":
+        scenario = RICEScenario(
+            reach=args.reach_scale,
+            impact=args.impact_scale,
+            confidence=args.confidence_scale,
+            effort=args.effort_scale,
+        )
+        asyncio.run(run_rescore_rice(scenario, args.chunk_size, args.what_if, args.limit))
+    elif args.command == "import":
+        asyncio.run(run_import(args.target, args.input, args.import_format, args.batch_size, args.offset))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,36 @@
+import hashlib
+from typing import Any
+
+from fastapi import Request
+from fastapi.responses import Response
+
+CONDITIONAL_CACHE_CONTROL = "private, no-cache"
+
+
+def make_etag(*parts: Any) -> str:
+    """Build a weak ETag from version values."""
+    digest = hashlib.sha1(repr(parts).encode()).hexdigest()[:20]
+    return f'W/"{digest}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Return True when If-None-Match lists the ETag, using weak comparison."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(candidate.strip().removeprefix("W/") == opaque for candidate in header.split(","))
+
+
+def not_modified(etag: str) -> Response:
+    """Return an empty 304 response carrying the current ETag."""
+    return Response(status_code=304, headers={"ETag": etag, "Cache-Control": CONDITIONAL_CACHE_CONTROL})
+
+
+def set_etag(response: Response, etag: str) -> Response:
+    """Attach the ETag and a revalidate-every-time cache policy to a response."""
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = CONDITIONAL_CACHE_CONTROL
+    return response
@@ -1,3 +1,5 @@
+from typing import Literal
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -7,6 +9,38 @@ class Settings(BaseSettings):
     database_url: str
     secret_key: str
     environment: str
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_timeout: float = 30.0
+    db_pool_recycle: int = 1800
+    db_pool_pre_ping: bool = True
+    db_statement_cache_size: int = 100
+    sqlite_pool_enabled: bool = False
+    sqlite_busy_timeout_ms: int = 5000
+    sqlite_mmap_size: int = 268435456
+    sqlite_cache_size_kib: int = 65536
+    db_fanout_max_sessions: int = 3
+    principal_cache_enabled: bool = True
+    principal_cache_ttl_seconds: float = 30.0
+    principal_cache_max_size: int = 1024
+    password_hash_workers: int = 2
+    records_count_strategy: Literal["exact", "cached", "estimated"] = "exact"
+    row_count_cache_ttl_seconds: float = 60.0
+    export_batch_size: int = 1000
+    batch_max_ids: int = 100
+    template_bytecode_cache: bool = True
+    template_bytecode_cache_dir: str | None = None
+    fragment_cache_enabled: bool = True
+    fragment_cache_max_chars: int = 8_000_000
+    metrics_enabled: bool = True
+    server_timing_enabled: bool = True
+    sql_n_plus_one_threshold: int = 3
+    sql_query_budget_strict: bool = False
+    log_level: str = "INFO"
+    log_queue_size: int = 10000
+    log_sampling: dict[str, float] = {}
+    log_exception_rate_limit: int = 5
+    log_exception_rate_window_seconds: float = 60.0
 
     model_config = SettingsConfigDict(env_file=".env", case_sensitive=False)
 
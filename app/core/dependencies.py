@@ -3,9 +3,10 @@ from typing import AsyncGenerator
 from fastapi import Cookie, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.principal_cache import principal_cache
+from app.core.security import decode_access_token
 from app.db.session import session_scope
 from app.repositories.user_repository import UserRepository
-from app.core.security import decode_access_token
 
 
 async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
@@ -24,8 +25,13 @@ async def get_current_user(
     subject = decode_access_token(access_token)
     if not subject:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token")
+    principal = principal_cache.get(subject)
+    if principal:
+        return principal
     repository = UserRepository(session)
     user = await repository.get_by_email(subject)
-    if not user:
+    if not user or not user.is_active:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found")
-    return {"id": user.id, "email": user.email}
+    principal = {"id": user.id, "email": user.email}
+    principal_cache.set(subject, principal)
+    return principal
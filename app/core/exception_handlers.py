@@ -6,6 +6,8 @@ from fastapi.templating import Jinja2Templates
 from sqlalchemy.exc import SQLAlchemyError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
+from app.core.metrics import metrics
+
 logger = logging.getLogger(__name__)
 
 
@@ -35,6 +37,7 @@ def register_exception_handlers(app: FastAPI) -> None:
     @app.exception_handler(SQLAlchemyError)
     async def sqlalchemy_exception_handler(request: Request, exc: SQLAlchemyError):  # type: ignore[override]
         """Handle database errors with logging."""
+        metrics.record_db_error(exc)
         logger.exception("Database error", extra={"path": request.url.path})
         if _wants_html(request):
             templates: Jinja2Templates = request.app.state.templates
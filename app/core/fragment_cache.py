@@ -0,0 +1,99 @@
+from collections import OrderedDict
+from typing import Any, Hashable
+
+from jinja2 import Undefined, nodes
+from jinja2.ext import Extension
+from markupsafe import Markup
+
+from app.core.config import settings
+
+
+class FragmentCache:
+    """LRU cache of rendered template fragments bounded by total size in characters.
+
+    Keys are tuples whose first two items are the section name and the document id,
+    so services can drop the sections of a document they have just changed.
+    """
+
+    def __init__(self, max_chars: int, enabled: bool = True) -> None:
+        """Initialize an empty cache."""
+        self.max_chars = max_chars
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+        self.size = 0
+        self._entries: OrderedDict[tuple, str] = OrderedDict()
+
+    def get(self, key: tuple) -> str | None:
+        """Return a cached fragment, or None when absent."""
+        html = self._entries.get(key)
+        if html is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return html
+
+    def set(self, key: tuple, html: str) -> None:
+        """Store a fragment, evicting least recently used ones over the size limit."""
+        if len(html) > self.max_chars:
+            return
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self.size -= len(previous)
+        self._entries[key] = html
+        self.size += len(html)
+        while self.size > self.max_chars:
+            _, evicted = self._entries.popitem(last=False)
+            self.size -= len(evicted)
+
+    def invalidate_document(self, document_id: int, *sections: str) -> None:
+        """Drop cached fragments of a document, limited to the given sections when any are passed."""
+        stale = [
+            key
+            for key in self._entries
+            if key[1] == document_id and (not sections or key[0] in sections)
+        ]
+        for key in stale:
+            self.size -= len(self._entries.pop(key))
+
+    def clear(self) -> None:
+        """Drop every cached fragment."""
+        self._entries.clear()
+        self.size = 0
+
+    def stats(self) -> dict:
+        """Return hit/miss counters and current size."""
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self._entries), "chars": self.size}
+
+
+fragment_cache = FragmentCache(
+    max_chars=settings.fragment_cache_max_chars,
+    enabled=settings.fragment_cache_enabled,
+)
+
+
+class FragmentCacheExtension(Extension):
+    """Jinja2 ``{% cache key %}...{% endcache %}`` tag backed by the fragment cache.
+
+    A ``None`` or undefined key renders the body without caching.
+    """
+
+    tags = {"cache"}
+
+    def parse(self, parser: Any) -> nodes.Node:
+        """Parse the cache tag and its body."""
+        lineno = next(parser.stream).lineno
+        key = parser.parse_expression()
+        body = parser.parse_statements(("name:endcache",), drop_needle=True)
+        return nodes.CallBlock(self.call_method("_render", [key]), [], [], body).set_lineno(lineno)
+
+    def _render(self, key: Hashable | None, caller: Any) -> str:
+        """Return the cached fragment for the key, rendering and storing it on a miss."""
+        if key is None or isinstance(key, Undefined) or not fragment_cache.enabled:
+            return caller()
+        html = fragment_cache.get(key)
+        if html is None:
+            html = caller()
+            fragment_cache.set(key, html)
+        return Markup(html)
@@ -0,0 +1,21 @@
+from bisect import bisect_left
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class Histogram:
+    """Cumulative-on-render histogram with fixed upper bounds."""
+
+    __slots__ = ("counts", "total", "sum")
+
+    def __init__(self) -> None:
+        """Initialize empty buckets, the last one being ``+Inf``."""
+        self.counts = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.total = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        """Count one observation in the first bucket whose bound is not below it."""
+        self.counts[bisect_left(LATENCY_BUCKETS, value)] += 1
+        self.total += 1
+        self.sum += value
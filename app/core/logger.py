@@ -1,27 +1,174 @@
-import json
+import atexit
+import copy
 import logging
+import queue
+import random
+import time
 from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
 from typing import Any, Dict
 
+import orjson
+
+from app.core.config import settings
+
+# Attributes every LogRecord has; anything else on a record came from ``extra={...}``.
+RESERVED_ATTRS = frozenset(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {"message", "asctime"}
+
+_listener: QueueListener | None = None
+_queue_handler: QueueHandler | None = None
+_direct_handler: logging.Handler | None = None
+
 
 class JsonFormatter(logging.Formatter):
-    """Format log records as JSON strings."""
+    """Format log records as JSON strings, including ``extra`` fields."""
 
     def format(self, record: logging.LogRecord) -> str:
         """Convert a LogRecord into a JSON string."""
         payload: Dict[str, Any] = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
         }
+        for key, value in record.__dict__.items():
+            if key not in RESERVED_ATTRS and not key.startswith("_"):
+                payload[key] = value
         if record.exc_info:
             payload["exception"] = self.formatException(record.exc_info)
-        return json.dumps(payload, ensure_ascii=False)
+        elif record.exc_text:
+            payload["exception"] = record.exc_text
+        return orjson.dumps(payload, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+class SamplingFilter(logging.Filter):
+    """Keep only a share of records below WARNING for configured logger name prefixes."""
+
+    def __init__(self, rates: dict[str, float]) -> None:
+        """Initialize the filter with logger prefix to keep-ratio pairs."""
+        super().__init__()
+        self.rates = sorted(rates.items(), key=lambda item: len(item[0]), reverse=True)
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Return False for records dropped by sampling."""
+        if record.levelno >= logging.WARNING:
+            return True
+        for prefix, rate in self.rates:
+            if record.name == prefix or record.name.startswith(prefix + "."):
+                return random.random() < rate
+        return True
+
+
+class ExceptionRateLimitFilter(logging.Filter):
+    """Let through at most ``limit`` records per window for each repeated exception site.
+
+    The first record after a suppressed stretch carries the number of dropped records
+    in its ``suppressed`` field.
+    """
+
+    def __init__(self, limit: int, window_seconds: float) -> None:
+        """Initialize the filter with a per-window limit."""
+        super().__init__()
+        self.limit = limit
+        self.window_seconds = window_seconds
+        self._windows: dict[tuple, list[float | int]] = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Return False for exception records over the limit of their window."""
+        if not record.exc_info or self.limit <= 0:
+            return True
+        key = (record.name, record.pathname, record.lineno, record.exc_info[0])
+        now = time.monotonic()
+        window = self._windows.get(key)
+        if window is None or now - window[0] >= self.window_seconds:
+            suppressed = window[2] if window else 0
+            self._windows[key] = [now, 1, 0]
+            if suppressed:
+                record.suppressed = suppressed
+            return True
+        if window[1] < self.limit:
+            window[1] += 1
+            return True
+        window[2] += 1
+        return False
+
+
+class NonBlockingQueueHandler(QueueHandler):
+    """Queue handler that defers JSON formatting to the listener thread and never blocks.
+
+    Records arriving while the queue is full are dropped; the next queued record
+    reports how many in its ``dropped`` field.
+    """
+
+    def __init__(self, log_queue: queue.Queue) -> None:
+        """Initialize the handler with a bounded queue."""
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Merge message arguments now, since they may change; keep everything else for the listener."""
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """Put a record on the queue, dropping it when the queue is full."""
+        if self.dropped:
+            record.dropped = self.dropped
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+        else:
+            self.dropped = 0
 
 
 def setup_logging() -> None:
-    """Configure root logging with a JSON formatter."""
-    handler = logging.StreamHandler()
-    handler.setFormatter(JsonFormatter())
-    logging.basicConfig(level=logging.INFO, handlers=[handler])
+    """Route root logging through a bounded queue to a JSON writer running in a background thread.
+
+    Only handlers installed by this module are replaced; others on the root logger are kept.
+    """
+    global _listener, _queue_handler, _direct_handler
+    if _listener is not None:
+        return
+    root = logging.getLogger()
+    for handler in (_queue_handler, _direct_handler):
+        if handler is not None:
+            root.removeHandler(handler)
+    _direct_handler = None
+    log_queue: queue.Queue = queue.Queue(maxsize=settings.log_queue_size)
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(JsonFormatter())
+    _queue_handler = NonBlockingQueueHandler(log_queue)
+    if settings.log_sampling:
+        _queue_handler.addFilter(SamplingFilter(settings.log_sampling))
+    _queue_handler.addFilter(
+        ExceptionRateLimitFilter(
+            limit=settings.log_exception_rate_limit,
+            window_seconds=settings.log_exception_rate_window_seconds,
+        )
+    )
+    root.setLevel(settings.log_level.upper())
+    root.addHandler(_queue_handler)
+    _listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+    atexit.unregister(shutdown_logging)
+    atexit.register(shutdown_logging)
+
+
+def shutdown_logging() -> None:
+    """Switch root logging to writing directly, then stop the background writer once it has flushed the queue."""
+    global _listener, _direct_handler
+    if _listener is None:
+        return
+    # Records logged after shutdown, e.g. by other atexit hooks, would otherwise sit in a queue nobody reads.
+    _direct_handler = logging.StreamHandler()
+    _direct_handler.setFormatter(JsonFormatter())
+    for log_filter in _queue_handler.filters:
+        _direct_handler.addFilter(log_filter)
+    root = logging.getLogger()
+    root.addHandler(_direct_handler)
+    root.removeHandler(_queue_handler)
+    _listener.stop()
+    _listener = None
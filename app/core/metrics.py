@@ -0,0 +1,216 @@
+import logging
+import time
+from collections import defaultdict
+from typing import Any, Callable, TypeVar
+
+from fastapi import FastAPI
+from fastapi.routing import APIRoute
+from starlette.exceptions import HTTPException
+from starlette.routing import Mount
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+from app.core.histogram import LATENCY_BUCKETS, Histogram
+from app.core.security import password_hasher
+from app.db.session import QueryCounter, count_queries
+
+logger = logging.getLogger(__name__)
+
+UNMATCHED_ROUTE = "<unmatched>"
+
+EndpointT = TypeVar("EndpointT", bound=Callable[..., Any])
+
+
+def _labels(**labels: str) -> str:
+    """Render a Prometheus label set, escaping quotes, backslashes and newlines."""
+    return ",".join(
+        '{}="{}"'.format(name, value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"))
+        for name, value in labels.items()
+    )
+
+
+def _histogram_lines(name: str, labels: str, histogram: Histogram) -> list[str]:
+    """Render the bucket, sum and count samples of one histogram."""
+    prefix = f"{labels}," if labels else ""
+    suffix = f"{{{labels}}}" if labels else ""
+    lines = []
+    cumulative = 0
+    for bound, count in zip([*map(str, LATENCY_BUCKETS), "+Inf"], histogram.counts):
+        cumulative += count
+        lines.append(f'{name}_bucket{{{prefix}le="{bound}"}} {cumulative}')
+    lines.append(f"{name}_sum{suffix} {histogram.sum}")
+    lines.append(f"{name}_count{suffix} {histogram.total}")
+    return lines
+
+
+class MetricsRegistry:
+    """Per-process request and error metrics rendered in the Prometheus text format."""
+
+    def __init__(self) -> None:
+        """Initialize empty metrics."""
+        self.durations: dict[tuple[str, str], Histogram] = defaultdict(Histogram)
+        self.responses: dict[tuple[str, str, str], int] = defaultdict(int)
+        self.in_flight: dict[tuple[str, str], int] = defaultdict(int)
+        self.db_errors: dict[str, int] = defaultdict(int)
+
+    def record_db_error(self, exc: BaseException) -> None:
+        """Count a database error handled by the application, by exception class."""
+        self.db_errors[type(exc).__name__] += 1
+
+    def render(self) -> str:
+        """Return every metric in the Prometheus text exposition format."""
+        lines = [
+            "# HELP http_request_duration_seconds Request duration by route template.",
+            "# TYPE http_request_duration_seconds histogram",
+        ]
+        for (method, route), histogram in sorted(self.durations.items()):
+            lines += _histogram_lines("http_request_duration_seconds", _labels(method=method, route=route), histogram)
+        lines += [
+            "# HELP http_responses_total Responses by route template and status code.",
+            "# TYPE http_responses_total counter",
+        ]
+        for (method, route, status), count in sorted(self.responses.items()):
+            lines.append(f"http_responses_total{{{_labels(method=method, route=route, status=status)}}} {count}")
+        lines += [
+            "# HELP http_requests_in_flight Requests currently being handled by route template.",
+            "# TYPE http_requests_in_flight gauge",
+        ]
+        for (method, route), count in sorted(self.in_flight.items()):
+            lines.append(f"http_requests_in_flight{{{_labels(method=method, route=route)}}} {count}")
+        lines += [
+            "# HELP db_errors_total Database errors handled by the application, by exception class.",
+            "# TYPE db_errors_total counter",
+        ]
+        for error, count in sorted(self.db_errors.items()):
+            lines.append(f"db_errors_total{{{_labels(error=error)}}} {count}")
+        lines += [
+            "# HELP password_hash_workers Threads of the password hashing pool.",
+            "# TYPE password_hash_workers gauge",
+            f"password_hash_workers {password_hasher.max_workers}",
+            "# HELP password_hash_in_flight Password hash and verify calls running or queued.",
+            "# TYPE password_hash_in_flight gauge",
+            f"password_hash_in_flight {password_hasher.in_flight}",
+            "# HELP password_hash_queue_depth Password hash and verify calls waiting for a worker.",
+            "# TYPE password_hash_queue_depth gauge",
+            f"password_hash_queue_depth {password_hasher.queue_depth}",
+            "# HELP password_hash_wait_seconds Time password calls spent queued for a worker.",
+            "# TYPE password_hash_wait_seconds histogram",
+            *_histogram_lines("password_hash_wait_seconds", "", password_hasher.wait_seconds),
+            "# HELP password_hash_run_seconds Time password calls spent hashing on a worker.",
+            "# TYPE password_hash_run_seconds histogram",
+            *_histogram_lines("password_hash_run_seconds", "", password_hasher.run_seconds),
+        ]
+        return "\n".join(lines) + "\n"
+
+
+metrics = MetricsRegistry()
+
+
+class QueryBudgetExceeded(RuntimeError):
+    """Raised in strict mode when a request runs more SQL statements than its route declares."""
+
+
+def query_budget(limit: int) -> Callable[[EndpointT], EndpointT]:
+    """Declare the maximum number of SQL statements one request to the decorated endpoint may run."""
+
+    def decorator(endpoint: EndpointT) -> EndpointT:
+        endpoint.query_budget = limit  # type: ignore[attr-defined]
+        return endpoint
+
+    return decorator
+
+
+class RouteMetricsMiddleware:
+    """ASGI middleware timing one route, labelled with its path template.
+
+    It wraps the route's own ASGI app rather than the whole application, so the
+    template is known before the handler runs and no extra path matching is needed.
+    SQL statements of the request are counted too: they are reported in a
+    ``Server-Timing`` header and the request log line, repeated statement
+    fingerprints are flagged as N+1, and the route's query budget is enforced.
+    """
+
+    def __init__(self, app: ASGIApp, route: str, query_budget: int | None = None) -> None:
+        """Wrap an ASGI app serving the given route template."""
+        self.app = app
+        self.route = route
+        self.query_budget = query_budget
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Record duration, status code and in-flight count of an HTTP request."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        key = (scope["method"], self.route)
+        status = "500"
+        started = time.perf_counter()
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = str(message["status"])
+                if settings.server_timing_enabled:
+                    message = {**message, "headers": [*message.get("headers", []), self._server_timing(started, queries)]}
+            await send(message)
+
+        metrics.in_flight[key] += 1
+        with count_queries() as queries:
+            try:
+                await self.app(scope, receive, send_with_status)
+            except HTTPException as exc:
+                # Raised past the route, e.g. by the not-found fallback, and rendered by the outer handler.
+                status = str(exc.status_code)
+                raise
+            finally:
+                duration = time.perf_counter() - started
+                metrics.durations[key].observe(duration)
+                metrics.responses[(*key, status)] += 1
+                metrics.in_flight[key] -= 1
+                self._log_request(key[0], status, duration, queries)
+        if self.query_budget is not None and queries.count > self.query_budget and settings.sql_query_budget_strict:
+            raise QueryBudgetExceeded(
+                f"{key[0]} {self.route} ran {queries.count} SQL statements, budget is {self.query_budget}"
+            )
+
+    @staticmethod
+    def _server_timing(started: float, queries: QueryCounter) -> tuple[bytes, bytes]:
+        """Build a ``Server-Timing`` header with the database and total time so far."""
+        value = (
+            f'db;dur={queries.duration * 1000:.1f};desc="{queries.count} queries", '
+            f"total;dur={(time.perf_counter() - started) * 1000:.1f}"
+        )
+        return b"server-timing", value.encode("latin-1")
+
+    def _log_request(self, method: str, status: str, duration: float, queries: QueryCounter) -> None:
+        """Log one line per request with its SQL statistics, as a warning when they look wrong."""
+        repeated = queries.repeated(settings.sql_n_plus_one_threshold)
+        over_budget = self.query_budget is not None and queries.count > self.query_budget
+        extra = {
+            "method": method,
+            "route": self.route,
+            "status": int(status),
+            "duration_ms": round(duration * 1000, 1),
+            "db_queries": queries.count,
+            "db_time_ms": round(queries.duration * 1000, 1),
+        }
+        if repeated:
+            extra["n_plus_one"] = repeated
+        if over_budget:
+            extra["query_budget"] = self.query_budget
+        if repeated or over_budget:
+            logger.warning("Request ran suspicious SQL", extra=extra)
+        else:
+            logger.info("Request handled", extra=extra)
+
+
+def instrument_routes(application: FastAPI) -> None:
+    """Wrap every registered route, mount and the not-found fallback with ``RouteMetricsMiddleware``."""
+    if not settings.metrics_enabled:
+        return
+    router = application.router
+    for route in router.routes:
+        if isinstance(route, (APIRoute, Mount)) and not isinstance(route.app, RouteMetricsMiddleware):
+            budget = getattr(route.endpoint, "query_budget", None) if isinstance(route, APIRoute) else None
+            route.app = RouteMetricsMiddleware(route.app, route.path, budget)
+    if not isinstance(router.default, RouteMetricsMiddleware):
+        router.default = RouteMetricsMiddleware(router.default, UNMATCHED_ROUTE)
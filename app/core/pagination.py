@@ -1,4 +1,7 @@
+import base64
+import binascii
 from dataclasses import dataclass
+from datetime import datetime
 
 
 @dataclass(slots=True)
@@ -8,6 +11,7 @@ class Pagination:
     page: int
     per_page: int
     total: int
+    total_is_estimate: bool = False
 
     @property
     def total_pages(self) -> int:
@@ -16,14 +20,58 @@ class Pagination:
             return 1
         return (self.total + self.per_page - 1) // self.per_page
 
+    @property
+    def total_label(self) -> str:
+        """Return the total for display, marking planner estimates as approximate."""
+        if self.total_is_estimate:
+            return f"около {self.total}"
+        return str(self.total)
+
     @property
     def offset(self) -> int:
         """Return the SQL offset for the current page."""
         return (self.page - 1) * self.per_page
 
 
+@dataclass(slots=True)
+class CursorPagination:
+    """Keyset pagination metadata for templates."""
+
+    per_page: int
+    cursor: str | None = None
+    next_cursor: str | None = None
+
+    @property
+    def is_first(self) -> bool:
+        """Return True when the current page is the first one."""
+        return self.cursor is None
+
+    @property
+    def has_next(self) -> bool:
+        """Return True when there is a page after the current one."""
+        return self.next_cursor is not None
+
+
 def clamp_pagination(page: int, per_page: int, max_per_page: int = 50) -> tuple[int, int]:
     """Normalize pagination values to safe defaults."""
     safe_page = max(page, 1)
     safe_per_page = min(max(per_page, 1), max_per_page)
     return safe_page, safe_per_page
+
+
+def encode_cursor(created_at: datetime, item_id: int) -> str:
+    """Encode a (created_at, id) keyset position into an opaque cursor."""
+    raw = f"{created_at.isoformat()}|{item_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str | None) -> tuple[datetime, int] | None:
+    """Decode an opaque cursor, returning None when it is missing or malformed."""
+    if not cursor:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        created_at, item_id = raw.rsplit("|", 1)
+        return datetime.fromisoformat(created_at), int(item_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        return None
@@ -0,0 +1,64 @@
+import time
+from collections import OrderedDict
+
+from app.core.config import settings
+
+
+class PrincipalCache:
+    """Bounded LRU cache of resolved principals with a per-entry TTL."""
+
+    def __init__(self, max_size: int, ttl_seconds: float, enabled: bool = True) -> None:
+        """Initialize an empty cache."""
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, tuple[float, dict]] = OrderedDict()
+
+    def get(self, subject: str) -> dict | None:
+        """Return a cached principal for the subject, or None when absent or expired."""
+        if not self.enabled:
+            return None
+        entry = self._entries.get(subject)
+        if entry is None:
+            self.misses += 1
+            return None
+        expires_at, principal = entry
+        if expires_at <= time.monotonic():
+            del self._entries[subject]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(subject)
+        self.hits += 1
+        return dict(principal)
+
+    def set(self, subject: str, principal: dict) -> None:
+        """Store a principal, evicting the least recently used entry when full."""
+        if not self.enabled:
+            return
+        self._entries[subject] = (time.monotonic() + self.ttl_seconds, dict(principal))
+        self._entries.move_to_end(subject)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, *subjects: str | None) -> None:
+        """Drop cached principals for the given subjects."""
+        for subject in subjects:
+            if subject is not None:
+                self._entries.pop(subject, None)
+
+    def clear(self) -> None:
+        """Drop every cached principal."""
+        self._entries.clear()
+
+    def stats(self) -> dict:
+        """Return hit/miss counters and current size."""
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._entries)}
+
+
+principal_cache = PrincipalCache(
+    max_size=settings.principal_cache_max_size,
+    ttl_seconds=settings.principal_cache_ttl_seconds,
+    enabled=settings.principal_cache_enabled,
+)
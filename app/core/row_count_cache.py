@@ -0,0 +1,44 @@
+import time
+
+from app.core.config import settings
+
+
+class RowCountCache:
+    """Per-process cache of table row counts with a TTL and explicit invalidation."""
+
+    def __init__(self, ttl_seconds: float) -> None:
+        """Initialize an empty cache."""
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._entries: dict[str, tuple[float, int]] = {}
+
+    def get(self, key: str) -> int | None:
+        """Return a cached count, or None when absent or expired."""
+        entry = self._entries.get(key)
+        if entry is None or entry[0] <= time.monotonic():
+            self._entries.pop(key, None)
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry[1]
+
+    def set(self, key: str, value: int) -> None:
+        """Store a count until the TTL expires."""
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+
+    def invalidate(self, *keys: str) -> None:
+        """Drop cached counts for the given keys."""
+        for key in keys:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop every cached count."""
+        self._entries.clear()
+
+    def stats(self) -> dict:
+        """Return hit/miss counters and current size."""
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._entries)}
+
+
+row_count_cache = RowCountCache(ttl_seconds=settings.row_count_cache_ttl_seconds)
@@ -1,10 +1,14 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from typing import Any, Callable, Optional
 
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 
 from app.core.config import settings
+from app.core.histogram import Histogram
 
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 60
@@ -21,6 +25,70 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
+class PasswordHasher:
+    """Run bcrypt hashing and verification on a bounded worker pool off the event loop."""
+
+    def __init__(self, max_workers: int) -> None:
+        """Initialize the worker pool and metrics."""
+        self.max_workers = max(1, max_workers)
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="password-hasher")
+        self.in_flight = 0
+        self.completed = 0
+        self.wait_seconds = Histogram()
+        self.run_seconds = Histogram()
+        self.run_seconds_max = 0.0
+
+    @property
+    def queue_depth(self) -> int:
+        """Return the number of submitted calls still waiting for a worker."""
+        return max(0, self.in_flight - self.max_workers)
+
+    async def _submit(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Run a blocking call in the pool and record wait and run latency."""
+        submitted_at = time.perf_counter()
+        started_at = submitted_at
+
+        def call() -> Any:
+            nonlocal started_at
+            started_at = time.perf_counter()
+            return func(*args)
+
+        self.in_flight += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, call)
+        finally:
+            finished_at = time.perf_counter()
+            self.in_flight -= 1
+            self.completed += 1
+            self.wait_seconds.observe(started_at - submitted_at)
+            run_seconds = finished_at - started_at
+            self.run_seconds.observe(run_seconds)
+            self.run_seconds_max = max(self.run_seconds_max, run_seconds)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        """Verify a plaintext password against a hashed password."""
+        return await self._submit(verify_password, plain_password, hashed_password)
+
+    async def hash(self, password: str) -> str:
+        """Hash a plaintext password using bcrypt."""
+        return await self._submit(get_password_hash, password)
+
+    def stats(self) -> dict:
+        """Return queue depth and latency counters."""
+        return {
+            "workers": self.max_workers,
+            "in_flight": self.in_flight,
+            "queue_depth": self.queue_depth,
+            "completed": self.completed,
+            "wait_seconds_total": self.wait_seconds.sum,
+            "run_seconds_total": self.run_seconds.sum,
+            "run_seconds_max": self.run_seconds_max,
+        }
+
+
+password_hasher = PasswordHasher(max_workers=settings.password_hash_workers)
+
+
 def create_access_token(subject: str, expires_delta: Optional[timedelta] = None) -> str:
     """Create a signed JWT access token for the given subject."""
     expire = datetime.now(timezone.utc) + (expires_delta or timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES))
@@ -1,8 +1,51 @@
+import hashlib
+from pathlib import Path
+
 from fastapi import Request
 from fastapi.responses import HTMLResponse
+from fastapi.templating import Jinja2Templates
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
 
+from app.core.config import settings
+from app.core.fragment_cache import FragmentCacheExtension
 from app.core.flash import FLASH_COOKIE_NAME, pop_flash
 
+TEMPLATES_DIR = "app/templates"
+
+
+def create_templates() -> Jinja2Templates:
+    """Build the template renderer, with a bytecode cache shared by all workers."""
+    bytecode_cache = None
+    if settings.template_bytecode_cache:
+        cache_dir = settings.template_bytecode_cache_dir
+        if cache_dir:
+            Path(cache_dir).mkdir(parents=True, exist_ok=True)
+        bytecode_cache = FileSystemBytecodeCache(cache_dir)
+    environment = Environment(
+        loader=FileSystemLoader(TEMPLATES_DIR),
+        autoescape=True,
+        bytecode_cache=bytecode_cache,
+        extensions=[FragmentCacheExtension],
+    )
+    return Jinja2Templates(env=environment)
+
+
+def templates_version() -> str:
+    """Return a digest of all template sources, identical across workers of one deploy."""
+    digest = hashlib.sha1()
+    for path in sorted(Path(TEMPLATES_DIR).rglob("*.html")):
+        digest.update(path.as_posix().encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()[:12]
+
+
+def warm_up_templates(templates: Jinja2Templates) -> int:
+    """Compile every template up front and return how many were loaded."""
+    names = templates.env.list_templates(extensions=["html"])
+    for name in names:
+        templates.env.get_template(name)
+    return len(names)
+
 
 def render_template(request: Request, name: str, context: dict) -> HTMLResponse:
     """Render a Jinja2 template with shared context and flash messages."""
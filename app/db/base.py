@@ -3,3 +3,6 @@ from sqlalchemy.orm import DeclarativeBase
 
 class Base(DeclarativeBase):
     """Base class for SQLAlchemy models."""
+
+    # Fetch server-generated defaults with RETURNING at flush time instead of a later SELECT.
+    __mapper_args__ = {"eager_defaults": True}
@@ -1,14 +1,134 @@
-from contextlib import asynccontextmanager
-from typing import AsyncGenerator
+import asyncio
+import re
+import time
+from collections import Counter
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, AsyncGenerator, Awaitable, Callable, Iterator
 
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from app.core.config import settings
 
-engine = create_async_engine(settings.database_url, echo=False)
+database_url = make_url(settings.database_url)
+IS_SQLITE = database_url.get_backend_name() == "sqlite"
+IS_SQLITE_MEMORY = IS_SQLITE and database_url.database in (None, "", ":memory:")
+
+
+def _engine_options() -> dict[str, Any]:
+    """Build engine keyword arguments for the configured backend."""
+    options: dict[str, Any] = {"echo": False, "pool_pre_ping": settings.db_pool_pre_ping}
+    if IS_SQLITE_MEMORY or (IS_SQLITE and not settings.sqlite_pool_enabled):
+        # aiosqlite's default NullPool reconnects and re-applies pragmas per session, but closes
+        # every connection; pooled connections keep worker threads that block interpreter exit
+        # until the engine is disposed.
+        return options
+    if IS_SQLITE:
+        options["poolclass"] = AsyncAdaptedQueuePool
+    options.update(
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout,
+        pool_recycle=settings.db_pool_recycle,
+    )
+    if database_url.get_driver_name() == "asyncpg":
+        options["connect_args"] = {
+            "statement_cache_size": settings.db_statement_cache_size,
+            "prepared_statement_cache_size": settings.db_statement_cache_size,
+        }
+    return options
+
+
+engine = create_async_engine(database_url, **_engine_options())
 SessionLocal = async_sessionmaker(bind=engine, expire_on_commit=False)
 
 
+if IS_SQLITE:
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+        """Apply performance pragmas to every new SQLite connection."""
+        cursor = dbapi_connection.cursor()
+        try:
+            cursor.execute("PRAGMA journal_mode=WAL")
+            cursor.execute("PRAGMA synchronous=NORMAL")
+            cursor.execute(f"PRAGMA busy_timeout={int(settings.sqlite_busy_timeout_ms)}")
+            cursor.execute(f"PRAGMA mmap_size={int(settings.sqlite_mmap_size)}")
+            cursor.execute(f"PRAGMA cache_size={-int(settings.sqlite_cache_size_kib)}")
+        finally:
+            cursor.close()
+
+
+STATEMENT_LITERALS = re.compile(r"'(?:[^']|'')*'|\$\d+|\b\d+(?:\.\d+)?\b")
+STATEMENT_PARAMETER_LISTS = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+
+
+@lru_cache(maxsize=1024)
+def statement_fingerprint(statement: str) -> str:
+    """Normalize a SQL statement so that executions differing only in parameters compare equal."""
+    fingerprint = STATEMENT_LITERALS.sub("?", " ".join(statement.split()))
+    return STATEMENT_PARAMETER_LISTS.sub("(?...)", fingerprint)
+
+
+@dataclass(slots=True)
+class QueryCounter:
+    """SQL statements executed within a counting scope: count, time spent and fingerprints.
+
+    Scopes nest; statements are also recorded in every enclosing scope.
+    """
+
+    count: int = 0
+    duration: float = 0.0
+    fingerprints: Counter = field(default_factory=Counter)
+    parent: "QueryCounter | None" = None
+
+    def repeated(self, threshold: int) -> dict[str, int]:
+        """Return fingerprints executed at least ``threshold`` times, the usual sign of an N+1 loop."""
+        return {fingerprint: count for fingerprint, count in self.fingerprints.items() if count >= threshold}
+
+
+_query_counter: ContextVar[QueryCounter | None] = ContextVar("query_counter", default=None)
+
+
+@event.listens_for(engine.sync_engine, "before_cursor_execute")
+def _start_query(conn, cursor, statement, parameters, context, executemany) -> None:
+    """Remember when a statement started, if a counting scope is active."""
+    if _query_counter.get() is not None:
+        conn.info["query_started"] = time.perf_counter()
+
+
+@event.listens_for(engine.sync_engine, "after_cursor_execute")
+def _count_query(conn, cursor, statement, parameters, context, executemany) -> None:
+    """Record a finished statement in the active query counter and its parents."""
+    counter = _query_counter.get()
+    started = conn.info.pop("query_started", None)
+    if counter is None or started is None:
+        return
+    duration = time.perf_counter() - started
+    fingerprint = statement_fingerprint(statement)
+    while counter is not None:
+        counter.count += 1
+        counter.duration += duration
+        counter.fingerprints[fingerprint] += 1
+        counter = counter.parent
+
+
+@contextmanager
+def count_queries() -> Iterator[QueryCounter]:
+    """Count SQL statements executed in the current context."""
+    counter = QueryCounter(parent=_query_counter.get())
+    token = _query_counter.set(counter)
+    try:
+        yield counter
+    finally:
+        _query_counter.reset(token)
+
+
 async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
     """Yield an async SQLAlchemy session."""
     async with SessionLocal() as session:
@@ -21,3 +141,61 @@ async def session_scope() -> AsyncGenerator[AsyncSession, None]:
     async with SessionLocal() as session:
         async with session.begin():
             yield session
+
+
+_fan_out_reserved = 0
+
+
+def _pool_headroom() -> int:
+    """Return how many more connections the pool can hand out without waiting.
+
+    Connections reserved by fan-outs in progress count as taken, whether or not
+    they have been checked out yet. Other checkouts ignore these reservations.
+    """
+    pool = engine.sync_engine.pool
+    if not isinstance(pool, QueuePool):
+        return 0
+    if settings.db_max_overflow < 0:
+        return settings.db_fanout_max_sessions
+    capacity = settings.db_pool_size + settings.db_max_overflow
+    return capacity - pool.checkedout() - _fan_out_reserved
+
+
+async def fan_out_reads(
+    session: AsyncSession,
+    *reads: Callable[[AsyncSession], Awaitable[Any]],
+    max_sessions: int | None = None,
+) -> list[Any]:
+    """Run independent read-only callables concurrently and return their results in order.
+
+    The request's own session takes part and counts towards ``max_sessions``.
+    Extra pooled sessions are only opened while the pool has free connections
+    to spare; without headroom the reads run one after another on ``session``.
+    The check is best-effort: reservations are only seen by other fan-outs, so
+    ordinary checkouts can take the spare connections first, and an extra
+    session may then wait up to ``pool_timeout`` while the request holds its own
+    connection. Extra sessions are closed without committing.
+    """
+    global _fan_out_reserved
+    await session.connection()
+    limit = max(1, max_sessions or settings.db_fanout_max_sessions)
+    extra = min(min(len(reads), limit) - 1, _pool_headroom())
+    if extra <= 0:
+        return [await read(session) for read in reads]
+    _fan_out_reserved += extra
+    try:
+        results: list[Any] = [None] * len(reads)
+        pending = iter(enumerate(reads))
+
+        async def drain(read_session: AsyncSession) -> None:
+            for index, read in pending:
+                results[index] = await read(read_session)
+
+        async def drain_pooled() -> None:
+            async with SessionLocal() as read_session:
+                await drain(read_session)
+
+        await asyncio.gather(drain(session), *(drain_pooled() for _ in range(extra)))
+        return results
+    finally:
+        _fan_out_reserved -= extra
@@ -0,0 +1,68 @@
+import re
+
+NUMBER_PATTERN = re.compile(r"^[+-]?\d+(\.\d+)?$")
+UNIT_SCALES = {
+    "тыс": 1e3,
+    "млн": 1e6,
+    "млрд": 1e9,
+}
+UNIT_ALIASES = {
+    "руб": "RUB",
+    "рубль": "RUB",
+    "рубля": "RUB",
+    "рублей": "RUB",
+    "р": "RUB",
+    "₽": "RUB",
+    "rub": "RUB",
+    "usd": "USD",
+    "$": "USD",
+    "долл": "USD",
+    "eur": "EUR",
+    "€": "EUR",
+    "евро": "EUR",
+    "%": "%",
+    "процент": "%",
+    "процентов": "%",
+    "шт": "шт",
+    "штук": "шт",
+    "ч": "ч",
+    "час": "ч",
+    "часов": "ч",
+}
+
+
+def parse_metric_number(value: str) -> float | None:
+    """Parse a metric value such as ``1 200 000,50`` or ``1,200,000.50``; return None when it is not a number."""
+    text = re.sub(r"[\s_']", "", value)
+    if "," in text and "." in text:
+        decimal = max(text.rfind(","), text.rfind("."))
+        text = text[:decimal].replace(",", "").replace(".", "") + "." + text[decimal + 1 :]
+    elif text.count(",") == 1:
+        text = text.replace(",", ".")
+    elif text.count(",") > 1:
+        text = text.replace(",", "")
+    elif text.count(".") > 1:
+        text = text.replace(".", "")
+    if not NUMBER_PATTERN.match(text):
+        return None
+    return float(text)
+
+
+def normalize_metric_unit(unit: str) -> tuple[str, float]:
+    """Return the canonical unit and the multiplier from the entered unit, e.g. ``тыс. руб.`` -> (``RUB``, 1000)."""
+    tokens = unit.lower().replace(".", " ").split()
+    scale = 1.0
+    if len(tokens) > 1 and tokens[0] in UNIT_SCALES:
+        scale = UNIT_SCALES[tokens[0]]
+        tokens = tokens[1:]
+    base = " ".join(tokens)
+    return UNIT_ALIASES.get(base, base), scale
+
+
+def normalize_metric(value: str, unit: str) -> tuple[float, str] | None:
+    """Return the numeric value expressed in the canonical unit, or None when the value is not a number."""
+    number = parse_metric_number(value)
+    if number is None:
+        return None
+    normalized_unit, scale = normalize_metric_unit(unit)
+    return number * scale, normalized_unit
@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
@@ -13,7 +13,7 @@ class Approval(Base):
     __tablename__ = "approvals"
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
-    document_id: Mapped[int] = mapped_column(ForeignKey("documents.id"), nullable=False)
+    document_id: Mapped[int] = mapped_column(ForeignKey("documents.id"), nullable=False, index=True)
     status: Mapped[str] = mapped_column(String(32), nullable=False, default=ApprovalStatus.PENDING.value)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at: Mapped[datetime] = mapped_column(
@@ -27,6 +27,7 @@ class Approval(Base):
         "ApprovalStep",
         back_populates="approval",
         cascade="all, delete-orphan",
+        order_by="ApprovalStep.id",
     )
 
 
@@ -34,9 +35,10 @@ class ApprovalStep(Base):
     """Domain model for approval steps."""
 
     __tablename__ = "approval_steps"
+    __table_args__ = (Index("ix_approval_steps_approver_id_status", "approver_id", "status"),)
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
-    approval_id: Mapped[int] = mapped_column(ForeignKey("approvals.id"), nullable=False)
+    approval_id: Mapped[int] = mapped_column(ForeignKey("approvals.id"), nullable=False, index=True)
     approver_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
     status: Mapped[str] = mapped_column(String(32), nullable=False, default=ApprovalStepStatus.PENDING.value)
     rejection_reason: Mapped[str | None] = mapped_column(Text, nullable=True)
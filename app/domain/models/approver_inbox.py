@@ -0,0 +1,20 @@
+from datetime import datetime
+
+from sqlalchemy import DateTime, ForeignKey, Index
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class ApproverInboxEntry(Base):
+    """Materialized pair of an approver and a document awaiting their decision."""
+
+    __tablename__ = "approver_inbox"
+    __table_args__ = (
+        Index("ix_approver_inbox_approver_id_document_created_at", "approver_id", "document_created_at"),
+        Index("ix_approver_inbox_document_id", "document_id"),
+    )
+
+    approver_id: Mapped[int] = mapped_column(ForeignKey("users.id"), primary_key=True)
+    document_id: Mapped[int] = mapped_column(ForeignKey("documents.id"), primary_key=True)
+    document_created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
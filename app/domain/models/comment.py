@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import DateTime, ForeignKey, Integer, Text
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, Text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.db.base import Base
@@ -10,6 +10,10 @@ class Comment(Base):
     """Domain model for comments."""
 
     __tablename__ = "comments"
+    __table_args__ = (
+        Index("ix_comments_document_id_created_at", "document_id", "created_at"),
+        Index("ix_comments_approval_id_created_at", "approval_id", "created_at"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     document_id: Mapped[int | None] = mapped_column(ForeignKey("documents.id"), nullable=True)
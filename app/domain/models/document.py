@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import Boolean, DateTime, Integer, String, Text
+from sqlalchemy import Boolean, DateTime, Index, Integer, String, Text, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
@@ -11,6 +11,23 @@ class Document(Base):
     """Domain model for documents."""
 
     __tablename__ = "documents"
+    __table_args__ = (
+        Index(
+            "ix_documents_active_created_at_id",
+            "created_at",
+            "id",
+            sqlite_where=text("is_archived IS 0"),
+            postgresql_where=text("is_archived IS false"),
+        ),
+        Index(
+            "ix_documents_active_status_created_at_id",
+            "status",
+            "created_at",
+            "id",
+            sqlite_where=text("is_archived IS 0"),
+            postgresql_where=text("is_archived IS false"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     title: Mapped[str] = mapped_column(String(255), nullable=False)
@@ -33,9 +50,16 @@ class Document(Base):
         "DocumentMetric",
         back_populates="document",
         cascade="all, delete-orphan",
+        order_by="DocumentMetric.id",
     )
     rices: Mapped[list["DocumentRICE"]] = relationship(
         "DocumentRICE",
         back_populates="document",
         cascade="all, delete-orphan",
+        order_by="DocumentRICE.id",
+    )
+    approvals: Mapped[list["Approval"]] = relationship(
+        "Approval",
+        order_by="Approval.id.desc()",
+        viewonly=True,
     )
@@ -1,4 +1,4 @@
-from sqlalchemy import ForeignKey, Integer, String
+from sqlalchemy import Float, ForeignKey, Index, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
@@ -8,11 +8,16 @@ class DocumentMetric(Base):
     """Domain model for document metrics."""
 
     __tablename__ = "document_metrics"
+    __table_args__ = (
+        Index("ix_document_metrics_name_unit_normalized_value_numeric", "name", "unit_normalized", "value_numeric"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
-    document_id: Mapped[int] = mapped_column(ForeignKey("documents.id"), nullable=False)
+    document_id: Mapped[int] = mapped_column(ForeignKey("documents.id"), nullable=False, index=True)
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     value: Mapped[str] = mapped_column(String(255), nullable=False)
     unit: Mapped[str] = mapped_column(String(64), nullable=False)
+    value_numeric: Mapped[float | None] = mapped_column(Float, nullable=True)
+    unit_normalized: Mapped[str | None] = mapped_column(String(64), nullable=True)
 
     document: Mapped["Document"] = relationship("Document", back_populates="metrics")
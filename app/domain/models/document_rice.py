@@ -10,7 +10,7 @@ class DocumentRICE(Base):
     __tablename__ = "document_rices"
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
-    document_id: Mapped[int] = mapped_column(ForeignKey("documents.id"), nullable=False)
+    document_id: Mapped[int] = mapped_column(ForeignKey("documents.id"), nullable=False, index=True)
     author_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
     reach: Mapped[float] = mapped_column(Float, nullable=False)
     impact: Mapped[float] = mapped_column(Float, nullable=False)
@@ -0,0 +1,20 @@
+from sqlalchemy import Float, ForeignKey, Index, Integer
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class DocumentRICEAggregate(Base):
+    """Materialized summary of a document's RICE scores, kept in step with every RICE write."""
+
+    __tablename__ = "document_rice_aggregates"
+    __table_args__ = (
+        Index("ix_document_rice_aggregates_weighted_score_document_id", "weighted_score", "document_id"),
+    )
+
+    document_id: Mapped[int] = mapped_column(ForeignKey("documents.id"), primary_key=True)
+    rice_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    score_mean: Mapped[float] = mapped_column(Float, nullable=False)
+    score_min: Mapped[float] = mapped_column(Float, nullable=False)
+    score_max: Mapped[float] = mapped_column(Float, nullable=False)
+    weighted_score: Mapped[float] = mapped_column(Float, nullable=False)
@@ -0,0 +1,44 @@
+from sqlalchemy import DDL, event
+
+from app.db.base import Base
+
+SEARCH_KINDS = {"document": 0, "comment": 1, "record": 2}
+
+# The index is an FTS5 virtual table on SQLite and a tsvector table with a GIN index on
+# Postgres, so it is created with raw DDL instead of a mapped class. FTS5 rowids encode the
+# kind in the low two bits (object_id * 4 + kind code) so rows can be replaced by rowid.
+SQLITE_SEARCH_INDEX_DDL = (
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS search_index USING fts5(
+        kind UNINDEXED,
+        object_id UNINDEXED,
+        document_id UNINDEXED,
+        title,
+        body,
+        tokenize = 'unicode61 remove_diacritics 2',
+        prefix = '2 3'
+    )
+    """,
+)
+POSTGRESQL_SEARCH_INDEX_DDL = (
+    """
+    CREATE TABLE IF NOT EXISTS search_index (
+        kind VARCHAR(16) NOT NULL,
+        object_id INTEGER NOT NULL,
+        document_id INTEGER,
+        title TEXT NOT NULL DEFAULT '',
+        body TEXT NOT NULL DEFAULT '',
+        tsv TSVECTOR GENERATED ALWAYS AS (
+            setweight(to_tsvector('russian', title), 'A') || setweight(to_tsvector('russian', body), 'B')
+        ) STORED,
+        PRIMARY KEY (kind, object_id)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_search_index_tsv ON search_index USING GIN (tsv)",
+)
+
+for _statement in SQLITE_SEARCH_INDEX_DDL:
+    event.listen(Base.metadata, "after_create", DDL(_statement).execute_if(dialect="sqlite"))
+for _statement in POSTGRESQL_SEARCH_INDEX_DDL:
+    event.listen(Base.metadata, "after_create", DDL(_statement).execute_if(dialect="postgresql"))
+event.listen(Base.metadata, "before_drop", DDL("DROP TABLE IF EXISTS search_index"))
@@ -1,11 +1,9 @@
-from sqlalchemy import select
+from sqlalchemy import insert, select
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from app.domain.enums import ApprovalStepStatus
 from app.domain.models.approval import Approval, ApprovalStep
-from app.domain.models.document import Document
 from app.repositories.base import BaseRepository
 
 
@@ -48,8 +46,7 @@ class ApprovalRepository(BaseRepository):
         approval = Approval(document_id=document_id, status=status)
         self.session.add(approval)
         try:
-            await self.session.flush()
-            await self.session.refresh(approval)
+            await self.session.flush([approval])
             return approval
         except SQLAlchemyError:
             self.logger.exception("Failed to create approval", extra={"document_id": document_id})
@@ -59,14 +56,25 @@ class ApprovalRepository(BaseRepository):
         """Create and persist approval step."""
         step = ApprovalStep(approval_id=approval_id, approver_id=approver_id, status=status)
         self.session.add(step)
+        return step
+
+    async def create_steps(self, approval_id: int, approver_ids: list[int], status: str) -> list[ApprovalStep]:
+        """Create approval steps for all approvers with a single INSERT ... RETURNING."""
+        if not approver_ids:
+            return []
         try:
-            await self.session.flush()
-            await self.session.refresh(step)
-            return step
+            result = await self.session.scalars(
+                insert(ApprovalStep).returning(ApprovalStep),
+                [
+                    {"approval_id": approval_id, "approver_id": approver_id, "status": status}
+                    for approver_id in approver_ids
+                ],
+            )
+            return list(result.all())
         except SQLAlchemyError:
             self.logger.exception(
-                "Failed to create approval step",
-                extra={"approval_id": approval_id, "approver_id": approver_id},
+                "Failed to create approval steps",
+                extra={"approval_id": approval_id, "approver_ids": approver_ids},
             )
             raise
 
@@ -95,26 +103,3 @@ class ApprovalRepository(BaseRepository):
         except SQLAlchemyError:
             self.logger.exception("Failed to list approval steps", extra={"approval_id": approval_id})
             raise
-
-    async def list_documents_for_approver(self, approver_id: int) -> list[Document]:
-        """List documents waiting for approver action."""
-        try:
-            result = await self.session.execute(
-                select(Document)
-                .join(Approval, Approval.document_id == Document.id)
-                .join(ApprovalStep, ApprovalStep.approval_id == Approval.id)
-                .where(
-                    Document.is_archived.is_(False),
-                    ApprovalStep.approver_id == approver_id,
-                    ApprovalStep.status == ApprovalStepStatus.PENDING.value,
-                )
-                .order_by(Document.created_at.desc())
-                .distinct()
-            )
-            return list(result.scalars().all())
-        except SQLAlchemyError:
-            self.logger.exception(
-                "Failed to list documents for approver",
-                extra={"approver_id": approver_id},
-            )
-            raise
@@ -0,0 +1,93 @@
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.enums import ApprovalStepStatus
+from app.domain.models.approval import Approval, ApprovalStep
+from app.domain.models.approver_inbox import ApproverInboxEntry
+from app.domain.models.document import Document
+from app.repositories.base import BaseRepository
+
+
+class ApproverInboxRepository(BaseRepository):
+    """Repository for the materialized approver inbox."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        """Initialize repository with a session."""
+        super().__init__(session)
+
+    @staticmethod
+    def _pending_pairs():
+        """Select distinct (approver, document) pairs with a pending step on an active document."""
+        return (
+            select(ApprovalStep.approver_id, Document.id, Document.created_at)
+            .join(Approval, ApprovalStep.approval_id == Approval.id)
+            .join(Document, Approval.document_id == Document.id)
+            .where(
+                Document.is_archived.is_(False),
+                ApprovalStep.status == ApprovalStepStatus.PENDING.value,
+            )
+            .distinct()
+        )
+
+    async def refresh_document(self, document_id: int) -> None:
+        """Recompute inbox entries for one document from its approval steps."""
+        try:
+            # Without the lock, two concurrent refreshes under READ COMMITTED both delete, then both
+            # insert the pairs they saw, leaving duplicates or entries for already decided steps.
+            await self.lock_document(document_id)
+            await self.session.execute(
+                delete(ApproverInboxEntry).where(ApproverInboxEntry.document_id == document_id)
+            )
+            await self.session.execute(
+                insert(ApproverInboxEntry).from_select(
+                    ["approver_id", "document_id", "document_created_at"],
+                    self._pending_pairs().where(Document.id == document_id),
+                )
+            )
+        except SQLAlchemyError:
+            self.logger.exception("Failed to refresh approver inbox", extra={"document_id": document_id})
+            raise
+
+    async def rebuild(self) -> int:
+        """Rebuild the whole inbox from approval steps and return the number of entries."""
+        try:
+            await self.session.execute(delete(ApproverInboxEntry))
+            await self.session.execute(
+                insert(ApproverInboxEntry).from_select(
+                    ["approver_id", "document_id", "document_created_at"],
+                    self._pending_pairs(),
+                )
+            )
+            result = await self.session.execute(select(func.count()).select_from(ApproverInboxEntry))
+            return int(result.scalar_one())
+        except SQLAlchemyError:
+            self.logger.exception("Failed to rebuild approver inbox")
+            raise
+
+    async def list_documents(self, approver_id: int) -> list[Document]:
+        """List documents waiting for approver action, newest first."""
+        try:
+            result = await self.session.execute(
+                select(Document)
+                .join(ApproverInboxEntry, ApproverInboxEntry.document_id == Document.id)
+                .where(ApproverInboxEntry.approver_id == approver_id)
+                .order_by(ApproverInboxEntry.document_created_at.desc())
+            )
+            return list(result.scalars().all())
+        except SQLAlchemyError:
+            self.logger.exception("Failed to list approver inbox", extra={"approver_id": approver_id})
+            raise
+
+    async def count(self, approver_id: int) -> int:
+        """Count documents waiting for approver action."""
+        try:
+            result = await self.session.execute(
+                select(func.count())
+                .select_from(ApproverInboxEntry)
+                .where(ApproverInboxEntry.approver_id == approver_id)
+            )
+            return int(result.scalar_one())
+        except SQLAlchemyError:
+            self.logger.exception("Failed to count approver inbox", extra={"approver_id": approver_id})
+            raise
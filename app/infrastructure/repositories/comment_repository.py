@@ -1,9 +1,13 @@
-from sqlalchemy import select
+from collections.abc import Sequence
+
+from sqlalchemy import RowMapping, func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.domain.models.comment import Comment
 from app.repositories.base import BaseRepository
 
+COMMENT_COLUMNS = (Comment.id, Comment.content, Comment.document_id, Comment.approval_id, Comment.created_at)
+
 
 class CommentRepository(BaseRepository):
     """Repository for managing comments."""
@@ -21,23 +25,61 @@ class CommentRepository(BaseRepository):
         """Create a new comment."""
         comment = Comment(content=content, document_id=document_id, approval_id=approval_id)
         self.session.add(comment)
-        await self.session.flush()
         return comment
 
-    async def list_for_document(self, document_id: int) -> list[Comment]:
-        """List comments for a document."""
+    async def list_rows_for_document(self, document_id: int) -> list[RowMapping]:
+        """List comment columns for a document without hydrating ORM objects."""
         result = await self.session.execute(
-            select(Comment)
+            select(*COMMENT_COLUMNS)
             .where(Comment.document_id == document_id)
             .order_by(Comment.created_at.asc())
         )
-        return list(result.scalars().all())
+        return list(result.mappings().all())
 
-    async def list_for_approval(self, approval_id: int) -> list[Comment]:
-        """List comments for an approval."""
+    async def list_rows_for_approval(self, approval_id: int) -> list[RowMapping]:
+        """List comment columns for an approval without hydrating ORM objects."""
         result = await self.session.execute(
-            select(Comment)
+            select(*COMMENT_COLUMNS)
             .where(Comment.approval_id == approval_id)
             .order_by(Comment.created_at.asc())
         )
+        return list(result.mappings().all())
+
+    async def list_for_documents(self, document_ids: Sequence[int]) -> dict[int, list[RowMapping]]:
+        """List comment columns for many documents in one query, grouped by document id."""
+        result = await self.session.execute(
+            select(*COMMENT_COLUMNS)
+            .where(Comment.document_id.in_(document_ids))
+            .order_by(Comment.created_at.asc())
+        )
+        return self.group_by_document(result.mappings(), document_ids)
+
+    async def get_version_for_document(self, document_id: int) -> tuple[int, int | None]:
+        """Return (count, max id) of a document's comments; comments are never edited."""
+        result = await self.session.execute(
+            select(func.count(Comment.id), func.max(Comment.id)).where(Comment.document_id == document_id)
+        )
+        return tuple(result.one())
+
+    async def get_version_for_approval(self, approval_id: int) -> tuple[int, int | None]:
+        """Return (count, max id) of an approval's comments."""
+        result = await self.session.execute(
+            select(func.count(Comment.id), func.max(Comment.id)).where(Comment.approval_id == approval_id)
+        )
+        return tuple(result.one())
+
+    async def list_for_document_or_approval(
+        self,
+        document_id: int,
+        approval_id: int | None,
+    ) -> list[Comment]:
+        """List comments for a document and, optionally, one of its approvals in one query."""
+        condition = Comment.document_id == document_id
+        if approval_id is not None:
+            condition = or_(condition, Comment.approval_id == approval_id)
+        result = await self.session.execute(
+            select(Comment)
+            .where(condition)
+            .order_by(Comment.created_at.asc())
+        )
         return list(result.scalars().all())
@@ -1,9 +1,22 @@
-from sqlalchemy import select
+from collections.abc import Sequence
+
+from sqlalchemy import Row, RowMapping, func, insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.domain.models.document import Document
 from app.domain.models.document_metric import DocumentMetric
 from app.repositories.base import BaseRepository
 
+METRIC_COLUMNS = (
+    DocumentMetric.id,
+    DocumentMetric.document_id,
+    DocumentMetric.name,
+    DocumentMetric.value,
+    DocumentMetric.unit,
+    DocumentMetric.value_numeric,
+    DocumentMetric.unit_normalized,
+)
+
 
 class DocumentMetricRepository(BaseRepository):
     """Repository for managing document metrics."""
@@ -12,30 +25,56 @@ class DocumentMetricRepository(BaseRepository):
         """Initialize repository with a session."""
         super().__init__(session)
 
-    async def create_metric(self, document_id: int, name: str, value: str, unit: str) -> DocumentMetric:
+    async def create_metric(
+        self,
+        document_id: int,
+        name: str,
+        value: str,
+        unit: str,
+        value_numeric: float,
+        unit_normalized: str,
+    ) -> DocumentMetric:
         """Create a new metric for a document."""
-        metric = DocumentMetric(document_id=document_id, name=name, value=value, unit=unit)
+        metric = DocumentMetric(
+            document_id=document_id,
+            name=name,
+            value=value,
+            unit=unit,
+            value_numeric=value_numeric,
+            unit_normalized=unit_normalized,
+        )
         self.session.add(metric)
-        await self.session.flush()
         return metric
 
+    async def bulk_create_metrics(self, rows: list[dict]) -> None:
+        """Insert metrics with one executemany."""
+        await self.session.execute(insert(DocumentMetric), rows)
+
     async def get_metric(self, metric_id: int) -> DocumentMetric | None:
         """Get a metric by id."""
         result = await self.session.execute(select(DocumentMetric).where(DocumentMetric.id == metric_id))
         return result.scalar_one_or_none()
 
-    async def update_metric(self, metric: DocumentMetric, name: str, value: str, unit: str) -> DocumentMetric:
+    async def update_metric(
+        self,
+        metric: DocumentMetric,
+        name: str,
+        value: str,
+        unit: str,
+        value_numeric: float,
+        unit_normalized: str,
+    ) -> DocumentMetric:
         """Update an existing metric."""
         metric.name = name
         metric.value = value
         metric.unit = unit
-        await self.session.flush()
+        metric.value_numeric = value_numeric
+        metric.unit_normalized = unit_normalized
         return metric
 
     async def delete_metric(self, metric: DocumentMetric) -> None:
         """Delete a metric."""
         await self.session.delete(metric)
-        await self.session.flush()
 
     async def list_for_document(self, document_id: int) -> list[DocumentMetric]:
         """List metrics for a document."""
@@ -45,3 +84,49 @@ class DocumentMetricRepository(BaseRepository):
             .order_by(DocumentMetric.id.asc())
         )
         return list(result.scalars().all())
+
+    async def list_for_documents(self, document_ids: Sequence[int]) -> dict[int, list[RowMapping]]:
+        """List metric columns for many documents in one query, grouped by document id."""
+        result = await self.session.execute(
+            select(*METRIC_COLUMNS)
+            .where(DocumentMetric.document_id.in_(document_ids))
+            .order_by(DocumentMetric.id.asc())
+        )
+        return self.group_by_document(result.mappings(), document_ids)
+
+    async def list_untyped_chunk(self, after_id: int, limit: int) -> list[Row]:
+        """List (id, value, unit) of metrics without a numeric value after an id, by id."""
+        result = await self.session.execute(
+            select(DocumentMetric.id, DocumentMetric.value, DocumentMetric.unit)
+            .where(DocumentMetric.id > after_id, DocumentMetric.value_numeric.is_(None))
+            .order_by(DocumentMetric.id.asc())
+            .limit(limit)
+        )
+        return list(result.all())
+
+    async def bulk_update_metrics(self, rows: list[dict]) -> None:
+        """Update metrics by primary key with one executemany; each dict carries ``id``."""
+        await self.session.execute(update(DocumentMetric), rows)
+
+    async def rollup(self, statuses: Sequence[str] | None = None) -> list[RowMapping]:
+        """Sum and average numeric metrics of active documents by name and normalized unit."""
+        statement = (
+            select(
+                DocumentMetric.name,
+                DocumentMetric.unit_normalized.label("unit"),
+                func.count(DocumentMetric.id).label("count"),
+                func.count(func.distinct(DocumentMetric.document_id)).label("documents"),
+                func.sum(DocumentMetric.value_numeric).label("total"),
+                func.avg(DocumentMetric.value_numeric).label("average"),
+                func.min(DocumentMetric.value_numeric).label("min"),
+                func.max(DocumentMetric.value_numeric).label("max"),
+            )
+            .join(Document, Document.id == DocumentMetric.document_id)
+            .where(Document.is_archived.is_(False), DocumentMetric.value_numeric.is_not(None))
+            .group_by(DocumentMetric.name, DocumentMetric.unit_normalized)
+            .order_by(DocumentMetric.name.asc(), DocumentMetric.unit_normalized.asc())
+        )
+        if statuses:
+            statement = statement.where(Document.status.in_(statuses))
+        result = await self.session.execute(statement)
+        return list(result.mappings().all())
@@ -1,8 +1,16 @@
-from sqlalchemy import select
+from datetime import datetime
+from typing import AsyncIterator, Sequence
+
+from sqlalchemy import Row, func, insert, or_, select, tuple_, update
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, selectinload
 
+from app.domain.models.approval import Approval, ApprovalStep
+from app.domain.models.comment import Comment
 from app.domain.models.document import Document
+from app.domain.models.document_metric import DocumentMetric
+from app.domain.models.document_rice import DocumentRICE
 from app.repositories.base import BaseRepository
 
 
@@ -13,17 +21,31 @@ class DocumentRepository(BaseRepository):
         """Initialize repository with a session."""
         super().__init__(session)
 
-    async def list_documents(self) -> list[Document]:
-        """Return all active documents."""
+    async def list_documents(
+        self,
+        limit: int,
+        after: tuple[datetime, int] | None = None,
+        status: str | None = None,
+        title_prefix: str | None = None,
+    ) -> list[Document]:
+        """Return a page of active documents ordered by (created_at, id) descending."""
+        query = select(Document).where(Document.is_archived.is_(False))
+        if status:
+            query = query.where(Document.status == status)
+        if title_prefix:
+            query = query.where(Document.title.startswith(title_prefix, autoescape=True))
+        if after:
+            query = query.where(tuple_(Document.created_at, Document.id) < tuple_(*after))
         try:
             result = await self.session.execute(
-                select(Document)
-                .where(Document.is_archived.is_(False))
-                .order_by(Document.created_at.desc())
+                query.order_by(Document.created_at.desc(), Document.id.desc()).limit(limit)
             )
             return list(result.scalars().all())
         except SQLAlchemyError:
-            self.logger.exception("Failed to list documents")
+            self.logger.exception(
+                "Failed to list documents",
+                extra={"status": status, "title_prefix": title_prefix, "limit": limit},
+            )
             raise
 
     async def get_document(self, document_id: int) -> Document | None:
@@ -35,37 +57,118 @@ class DocumentRepository(BaseRepository):
             self.logger.exception("Failed to fetch document", extra={"document_id": document_id})
             raise
 
+    async def get_document_with_approvals(self, document_id: int) -> Document | None:
+        """Fetch a document with its approvals and their steps in one joined query."""
+        try:
+            result = await self.session.execute(
+                select(Document)
+                .options(joinedload(Document.approvals).joinedload(Approval.steps))
+                .where(Document.id == document_id)
+            )
+            return result.unique().scalars().first()
+        except SQLAlchemyError:
+            self.logger.exception("Failed to fetch document with approvals", extra={"document_id": document_id})
+            raise
+
+    async def get_detail_version(self, document_id: int) -> tuple | None:
+        """Return a version tuple of everything the detail page shows, or None for a missing document.
+
+        One statement of index-backed aggregates; used to answer conditional GETs
+        without loading the aggregate.
+        """
+        # Subqueries filter by the bound id rather than correlating to Document: the approval id
+        # list sits two levels deep, where SQLAlchemy would not correlate it and would scan
+        # every approval instead.
+        approval_ids = select(Approval.id).where(Approval.document_id == document_id)
+        comment_filter = or_(Comment.document_id == document_id, Comment.approval_id.in_(approval_ids))
+        query = select(
+            Document.updated_at,
+            select(func.max(Approval.updated_at)).where(Approval.document_id == document_id).scalar_subquery(),
+            select(func.max(ApprovalStep.updated_at))
+            .where(ApprovalStep.approval_id.in_(approval_ids))
+            .scalar_subquery(),
+            select(func.count(Comment.id)).where(comment_filter).scalar_subquery(),
+            select(func.max(Comment.id)).where(comment_filter).scalar_subquery(),
+            select(func.count(DocumentMetric.id)).where(DocumentMetric.document_id == document_id).scalar_subquery(),
+            select(func.max(DocumentMetric.id)).where(DocumentMetric.document_id == document_id).scalar_subquery(),
+            select(func.count(DocumentRICE.id)).where(DocumentRICE.document_id == document_id).scalar_subquery(),
+            select(func.max(DocumentRICE.id)).where(DocumentRICE.document_id == document_id).scalar_subquery(),
+        ).where(Document.id == document_id, Document.is_archived.is_(False))
+        try:
+            result = await self.session.execute(query)
+            row = result.first()
+            return tuple(row) if row else None
+        except SQLAlchemyError:
+            self.logger.exception("Failed to fetch document version", extra={"document_id": document_id})
+            raise
+
+    async def stream_export_batches(self, batch_size: int) -> AsyncIterator[Sequence[Row]]:
+        """Yield (document, latest approval status) rows in id order, one batch at a time.
+
+        Rows come from a server-side cursor; metrics and RICE scores are loaded
+        with one extra SELECT ... IN per batch.
+        """
+        approval_status = (
+            select(Approval.status)
+            .where(Approval.document_id == Document.id)
+            .order_by(Approval.id.desc())
+            .limit(1)
+            .scalar_subquery()
+        )
+        query = (
+            select(Document, approval_status.label("approval_status"))
+            .options(selectinload(Document.metrics), selectinload(Document.rices))
+            .order_by(Document.id)
+            .execution_options(yield_per=batch_size)
+        )
+        try:
+            result = await self.session.stream(query)
+            async for partition in result.partitions():
+                yield partition
+        except SQLAlchemyError:
+            self.logger.exception("Failed to stream documents for export", extra={"batch_size": batch_size})
+            raise
+
     async def create_document(self, title: str, description: str | None) -> Document:
         """Create and persist a document."""
         document = Document(title=title, description=description)
         self.session.add(document)
-        try:
-            await self.session.flush()
-            await self.session.refresh(document)
-            return document
-        except SQLAlchemyError:
-            self.logger.exception("Failed to create document", extra={"title": title})
-            raise
+        return document
+
+    async def bulk_create_documents(self, rows: list[dict], return_ids: bool = False) -> list[int]:
+        """Insert documents with one executemany, optionally returning ids in row order."""
+        if not return_ids:
+            await self.session.execute(insert(Document), rows)
+            return []
+        result = await self.session.execute(
+            insert(Document).returning(Document.id, sort_by_parameter_order=True),
+            rows,
+        )
+        return list(result.scalars().all())
 
     async def update_document(self, document: Document, title: str, description: str | None) -> Document:
         """Update an existing document."""
         document.title = title
         document.description = description
-        try:
-            await self.session.flush()
-            await self.session.refresh(document)
-            return document
-        except SQLAlchemyError:
-            self.logger.exception("Failed to update document", extra={"document_id": document.id})
-            raise
+        return document
+
+    async def touch_document(self, document: Document) -> Document:
+        """Bump updated_at so version checks see changes to child rows without a version column."""
+        document.updated_at = datetime.utcnow()
+        return document
+
+    async def touch_documents(self, document_ids: Sequence[int]) -> None:
+        """Bump updated_at of many documents with one UPDATE, for bulk writes to child rows."""
+        await self.session.execute(
+            update(Document).where(Document.id.in_(document_ids)).values(updated_at=datetime.utcnow())
+        )
+
+    async def list_archived_ids(self) -> set[int]:
+        """Return ids of archived documents."""
+        result = await self.session.execute(select(Document.id).where(Document.is_archived.is_(True)))
+        return set(result.scalars().all())
 
     async def archive_document(self, document: Document) -> Document:
         """Archive an existing document."""
         document.is_archived = True
-        try:
-            await self.session.flush()
-            await self.session.refresh(document)
-            return document
-        except SQLAlchemyError:
-            self.logger.exception("Failed to archive document", extra={"document_id": document.id})
-            raise
+        return document
@@ -0,0 +1,93 @@
+from collections.abc import Sequence
+
+from sqlalchemy import RowMapping, delete, func, insert, select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.models.document import Document
+from app.domain.models.document_rice import DocumentRICE
+from app.domain.models.document_rice_aggregate import DocumentRICEAggregate
+from app.repositories.base import BaseRepository
+
+AGGREGATE_COLUMNS = ["document_id", "rice_count", "score_mean", "score_min", "score_max", "weighted_score"]
+
+
+class DocumentRICEAggregateRepository(BaseRepository):
+    """Repository for per-document RICE aggregates and the portfolio ranking."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        """Initialize repository with a session."""
+        super().__init__(session)
+
+    @staticmethod
+    def _aggregates():
+        """Select aggregate values per document; the weighted score is the confidence-weighted mean."""
+        weighted = func.sum(DocumentRICE.score * DocumentRICE.confidence) / func.nullif(
+            func.sum(DocumentRICE.confidence), 0
+        )
+        return select(
+            DocumentRICE.document_id,
+            func.count(DocumentRICE.id),
+            func.avg(DocumentRICE.score),
+            func.min(DocumentRICE.score),
+            func.max(DocumentRICE.score),
+            func.coalesce(weighted, func.avg(DocumentRICE.score)),
+        ).group_by(DocumentRICE.document_id)
+
+    async def refresh_document(self, document_id: int) -> None:
+        """Recompute the aggregate of one document from its RICE scores."""
+        try:
+            # Serializes concurrent refreshes, which would otherwise both insert after both deleted.
+            await self.lock_document(document_id)
+            await self.session.execute(
+                delete(DocumentRICEAggregate).where(DocumentRICEAggregate.document_id == document_id)
+            )
+            await self.session.execute(
+                insert(DocumentRICEAggregate).from_select(
+                    AGGREGATE_COLUMNS,
+                    self._aggregates().where(DocumentRICE.document_id == document_id),
+                )
+            )
+        except SQLAlchemyError:
+            self.logger.exception("Failed to refresh RICE aggregate", extra={"document_id": document_id})
+            raise
+
+    async def rebuild(self) -> int:
+        """Rebuild every aggregate from RICE scores and return the number of documents."""
+        try:
+            await self.session.execute(delete(DocumentRICEAggregate))
+            await self.session.execute(
+                insert(DocumentRICEAggregate).from_select(AGGREGATE_COLUMNS, self._aggregates())
+            )
+            result = await self.session.execute(select(func.count()).select_from(DocumentRICEAggregate))
+            return int(result.scalar_one())
+        except SQLAlchemyError:
+            self.logger.exception("Failed to rebuild RICE aggregates")
+            raise
+
+    async def list_ranking(self, limit: int, statuses: Sequence[str] | None = None) -> list[RowMapping]:
+        """List the top active documents by weighted score, walking the score index."""
+        statement = (
+            select(
+                DocumentRICEAggregate.document_id,
+                Document.title,
+                Document.status,
+                DocumentRICEAggregate.rice_count,
+                DocumentRICEAggregate.score_mean,
+                DocumentRICEAggregate.score_min,
+                DocumentRICEAggregate.score_max,
+                DocumentRICEAggregate.weighted_score,
+            )
+            .join(Document, Document.id == DocumentRICEAggregate.document_id)
+            .where(Document.is_archived.is_(False))
+            .order_by(DocumentRICEAggregate.weighted_score.desc(), DocumentRICEAggregate.document_id.desc())
+            .limit(limit)
+        )
+        if statuses:
+            statement = statement.where(Document.status.in_(statuses))
+        try:
+            result = await self.session.execute(statement)
+            return list(result.mappings().all())
+        except SQLAlchemyError:
+            self.logger.exception("Failed to list RICE ranking")
+            raise
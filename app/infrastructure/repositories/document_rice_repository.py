@@ -1,9 +1,23 @@
-from sqlalchemy import select
+from collections.abc import Sequence
+
+from sqlalchemy import Row, RowMapping, func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.domain.models.document import Document
 from app.domain.models.document_rice import DocumentRICE
 from app.repositories.base import BaseRepository
 
+RICE_COLUMNS = (
+    DocumentRICE.id,
+    DocumentRICE.document_id,
+    DocumentRICE.author_id,
+    DocumentRICE.reach,
+    DocumentRICE.impact,
+    DocumentRICE.confidence,
+    DocumentRICE.effort,
+    DocumentRICE.score,
+)
+
 
 class DocumentRICERepository(BaseRepository):
     """Repository for managing document RICE scores."""
@@ -33,9 +47,22 @@ class DocumentRICERepository(BaseRepository):
             score=score,
         )
         self.session.add(rice)
-        await self.session.flush()
         return rice
 
+    async def get_version_for_document(self, document_id: int) -> tuple:
+        """Return (count, max id, document updated_at) for a document's RICE scores.
+
+        RICE edits touch the document, so its updated_at covers in-place updates.
+        """
+        result = await self.session.execute(
+            select(
+                func.count(DocumentRICE.id),
+                func.max(DocumentRICE.id),
+                select(Document.updated_at).where(Document.id == document_id).scalar_subquery(),
+            ).where(DocumentRICE.document_id == document_id)
+        )
+        return tuple(result.one())
+
     async def get_rice(self, rice_id: int) -> DocumentRICE | None:
         """Get a RICE score by id."""
         result = await self.session.execute(select(DocumentRICE).where(DocumentRICE.id == rice_id))
@@ -56,7 +83,6 @@ class DocumentRICERepository(BaseRepository):
         rice.confidence = confidence
         rice.effort = effort
         rice.score = score
-        await self.session.flush()
         return rice
 
     async def list_for_document(self, document_id: int) -> list[DocumentRICE]:
@@ -67,3 +93,43 @@ class DocumentRICERepository(BaseRepository):
             .order_by(DocumentRICE.id.asc())
         )
         return list(result.scalars().all())
+
+    async def list_rows_for_document(self, document_id: int) -> list[RowMapping]:
+        """List RICE score columns for a document without hydrating ORM objects."""
+        result = await self.session.execute(
+            select(*RICE_COLUMNS)
+            .where(DocumentRICE.document_id == document_id)
+            .order_by(DocumentRICE.id.asc())
+        )
+        return list(result.mappings().all())
+
+    async def list_for_documents(self, document_ids: Sequence[int]) -> dict[int, list[RowMapping]]:
+        """List RICE score columns for many documents in one query, grouped by document id."""
+        result = await self.session.execute(
+            select(*RICE_COLUMNS)
+            .where(DocumentRICE.document_id.in_(document_ids))
+            .order_by(DocumentRICE.id.asc())
+        )
+        return self.group_by_document(result.mappings(), document_ids)
+
+    async def list_factor_chunk(self, after_id: int, limit: int) -> list[Row]:
+        """List (id, document_id, reach, impact, confidence, effort, score) rows after an id, by id."""
+        result = await self.session.execute(
+            select(
+                DocumentRICE.id,
+                DocumentRICE.document_id,
+                DocumentRICE.reach,
+                DocumentRICE.impact,
+                DocumentRICE.confidence,
+                DocumentRICE.effort,
+                DocumentRICE.score,
+            )
+            .where(DocumentRICE.id > after_id)
+            .order_by(DocumentRICE.id.asc())
+            .limit(limit)
+        )
+        return list(result.all())
+
+    async def bulk_update_rices(self, rows: list[dict]) -> None:
+        """Update RICE rows by primary key with one executemany; each dict carries ``id``."""
+        await self.session.execute(update(DocumentRICE), rows)
@@ -0,0 +1,180 @@
+import re
+from collections.abc import Sequence
+from typing import Any
+
+from sqlalchemy import RowMapping, bindparam, text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.session import IS_SQLITE
+from app.domain.models.search_index import SEARCH_KINDS
+from app.repositories.base import BaseRepository
+
+SNIPPET_START = "\x02"
+SNIPPET_END = "\x03"
+
+# Each source yields (object_id, document_id, title, body) for one kind of indexed object.
+# Archived documents and their comments are left out, so searches need no join.
+SEARCH_SOURCES = {
+    "document": (
+        "SELECT id AS object_id, id AS document_id, title, COALESCE(description, '') AS body "
+        "FROM documents WHERE is_archived = false"
+    ),
+    "comment": (
+        "SELECT comments.id AS object_id, documents.id AS document_id, '' AS title, comments.content AS body "
+        "FROM comments "
+        "LEFT JOIN approvals ON approvals.id = comments.approval_id "
+        "JOIN documents ON documents.id = COALESCE(comments.document_id, approvals.document_id) "
+        "WHERE documents.is_archived = false"
+    ),
+    "record": "SELECT id AS object_id, NULL AS document_id, title, COALESCE(description, '') AS body FROM records",
+}
+SEARCH_SOURCE_TABLES = {"document": "documents", "comment": "comments", "record": "records"}
+
+
+def search_terms(query: str) -> list[str]:
+    """Split a user query into lowercase word tokens, dropping operators and punctuation."""
+    return re.findall(r"\w+", query.lower())
+
+
+class SearchRepository(BaseRepository):
+    """Repository for the full-text search index: FTS5 on SQLite, tsvector with GIN on Postgres."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        """Initialize repository with a session."""
+        super().__init__(session)
+
+    @staticmethod
+    def _insert_from_source(kind: str, condition: str) -> str:
+        """Build an INSERT ... SELECT copying matching source rows of a kind into the index."""
+        rowid = f"object_id * 4 + {SEARCH_KINDS[kind]}, " if IS_SQLITE else ""
+        columns = "rowid, " if IS_SQLITE else ""
+        return (
+            f"INSERT INTO search_index ({columns}kind, object_id, document_id, title, body) "
+            f"SELECT {rowid}'{kind}', object_id, document_id, title, body "
+            f"FROM ({SEARCH_SOURCES[kind]}) AS source WHERE {condition}"
+        )
+
+    async def index(self, kind: str, objects: Sequence[Any]) -> None:
+        """Replace index entries of the given mapped objects with their current content.
+
+        Pending objects are flushed first, so new rows have ids and the source query sees them.
+        """
+        await self.session.flush()
+        await self._replace(kind, [item.id for item in objects])
+
+    async def index_document_tree(self, document_id: int) -> None:
+        """Re-index a document with all of its comments, e.g. after it was archived."""
+        await self.session.flush()
+        result = await self.session.execute(
+            text(
+                "SELECT comments.id FROM comments "
+                "LEFT JOIN approvals ON approvals.id = comments.approval_id "
+                "WHERE comments.document_id = :document_id OR approvals.document_id = :document_id"
+            ),
+            {"document_id": document_id},
+        )
+        await self._replace("document", [document_id])
+        await self._replace("comment", list(result.scalars().all()))
+
+    async def _replace(self, kind: str, ids: list[int]) -> None:
+        """Delete index entries of the given ids and insert their current source rows."""
+        if not ids:
+            return
+        if IS_SQLITE:
+            await self.session.execute(
+                text("DELETE FROM search_index WHERE rowid IN :rowids").bindparams(
+                    bindparam("rowids", expanding=True)
+                ),
+                {"rowids": [object_id * 4 + SEARCH_KINDS[kind] for object_id in ids]},
+            )
+        else:
+            await self.session.execute(
+                text("DELETE FROM search_index WHERE kind = :kind AND object_id IN :ids").bindparams(
+                    bindparam("ids", expanding=True)
+                ),
+                {"kind": kind, "ids": ids},
+            )
+        await self.session.execute(
+            text(self._insert_from_source(kind, "object_id IN :ids")).bindparams(bindparam("ids", expanding=True)),
+            {"ids": ids},
+        )
+
+    async def index_after(self, kind: str, after_id: int) -> None:
+        """Index every object of a kind with an id above ``after_id``, as after a bulk insert."""
+        await self.session.flush()
+        if IS_SQLITE:
+            await self.session.execute(
+                text("DELETE FROM search_index WHERE rowid > :low AND rowid % 4 = :code"),
+                {"low": after_id * 4 + 3, "code": SEARCH_KINDS[kind]},
+            )
+        else:
+            await self.session.execute(
+                text("DELETE FROM search_index WHERE kind = :kind AND object_id > :after_id"),
+                {"kind": kind, "after_id": after_id},
+            )
+        await self.session.execute(text(self._insert_from_source(kind, "object_id > :after_id")), {"after_id": after_id})
+
+    async def max_source_id(self, kind: str) -> int:
+        """Return the highest id in the source table of a kind, or 0 when it is empty."""
+        result = await self.session.execute(text(f"SELECT COALESCE(MAX(id), 0) FROM {SEARCH_SOURCE_TABLES[kind]}"))
+        return int(result.scalar_one())
+
+    async def rebuild(self) -> int:
+        """Rebuild the whole index from documents, comments and records and return its size."""
+        try:
+            await self.session.execute(text("DELETE FROM search_index"))
+            for kind in SEARCH_SOURCES:
+                await self.session.execute(text(self._insert_from_source(kind, "1 = 1")))
+            result = await self.session.execute(text("SELECT COUNT(*) FROM search_index"))
+            return int(result.scalar_one())
+        except SQLAlchemyError:
+            self.logger.exception("Failed to rebuild search index")
+            raise
+
+    async def search(self, terms: Sequence[str], kind: str | None, limit: int, offset: int) -> list[RowMapping]:
+        """Return ranked hits that contain every term as a word prefix.
+
+        Snippets mark matched words with ``SNIPPET_START``/``SNIPPET_END`` so callers can escape
+        the text before highlighting.
+        """
+        if IS_SQLITE:
+            # The kind is encoded in the rowid, which avoids reading the UNINDEXED column per match.
+            kind_filter = "AND search_index.rowid % 4 = :kind" if kind else ""
+            statement = f"""
+                SELECT search_index.kind, search_index.object_id, search_index.document_id, search_index.title,
+                    snippet(search_index, -1, :start, :end, '…', 16) AS snippet,
+                    bm25(search_index, 0.0, 0.0, 0.0, 10.0, 1.0) AS rank
+                FROM search_index
+                WHERE search_index MATCH :query {kind_filter}
+                ORDER BY rank, search_index.rowid DESC
+                LIMIT :limit OFFSET :offset
+            """
+            query = " ".join(f'"{term}"*' for term in terms)
+        else:
+            kind_filter = "AND search_index.kind = :kind" if kind else ""
+            statement = f"""
+                SELECT search_index.kind, search_index.object_id, search_index.document_id, search_index.title,
+                    ts_headline(
+                        'russian',
+                        CASE WHEN search_index.body = '' THEN search_index.title ELSE search_index.body END,
+                        query,
+                        'StartSel=' || :start || ', StopSel=' || :end || ', MaxWords=32, MinWords=8'
+                    ) AS snippet,
+                    ts_rank_cd(search_index.tsv, query) AS rank
+                FROM search_index
+                CROSS JOIN to_tsquery('russian', :query) AS query
+                WHERE search_index.tsv @@ query {kind_filter}
+                ORDER BY rank DESC, search_index.object_id DESC
+                LIMIT :limit OFFSET :offset
+            """
+            query = " & ".join(f"{term}:*" for term in terms)
+        params = {"query": query, "start": SNIPPET_START, "end": SNIPPET_END, "limit": limit, "offset": offset}
+        if kind:
+            params["kind"] = SEARCH_KINDS[kind] if IS_SQLITE else kind
+        try:
+            result = await self.session.execute(text(statement), params)
+            return list(result.mappings().all())
+        except SQLAlchemyError:
+            self.logger.exception("Failed to search", extra={"query": query})
+            raise
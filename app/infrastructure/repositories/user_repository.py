@@ -35,13 +35,7 @@ class UserRepository(BaseRepository):
         """Create and persist a user."""
         user = User(email=email, full_name=full_name, password_hash=password_hash, is_active=True)
         self.session.add(user)
-        try:
-            await self.session.flush()
-            await self.session.refresh(user)
-            return user
-        except SQLAlchemyError:
-            self.logger.exception("Failed to create user", extra={"email": email})
-            raise
+        return user
 
     async def update(
         self,
@@ -57,21 +51,9 @@ class UserRepository(BaseRepository):
             user.full_name = full_name
         if password_hash is not None:
             user.password_hash = password_hash
-        try:
-            await self.session.flush()
-            await self.session.refresh(user)
-            return user
-        except SQLAlchemyError:
-            self.logger.exception("Failed to update user", extra={"user_id": user.id})
-            raise
+        return user
 
     async def deactivate(self, user: User) -> User:
         """Deactivate a user."""
         user.is_active = False
-        try:
-            await self.session.flush()
-            await self.session.refresh(user)
-            return user
-        except SQLAlchemyError:
-            self.logger.exception("Failed to deactivate user", extra={"user_id": user.id})
-            raise
+        return user
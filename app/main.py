@@ -1,20 +1,46 @@
+import logging
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
 from fastapi import FastAPI
 from fastapi.staticfiles import StaticFiles
-from fastapi.templating import Jinja2Templates
 
 from app.api.v1.router import api_router
 from app.core.exception_handlers import register_exception_handlers
-from app.core.logger import setup_logging
+from app.core.logger import setup_logging, shutdown_logging
+from app.core.metrics import instrument_routes
+from app.core.templating import create_templates, templates_version, warm_up_templates
+from app.db.session import engine
+
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(application: FastAPI) -> AsyncIterator[None]:
+    """Compile templates on startup; release pooled connections and flush queued logs on shutdown."""
+    setup_logging()
+    started = time.perf_counter()
+    compiled = warm_up_templates(application.state.templates)
+    logger.info(
+        "Templates compiled",
+        extra={"templates": compiled, "seconds": round(time.perf_counter() - started, 3)},
+    )
+    yield
+    await engine.dispose()
+    shutdown_logging()
 
 
 def create_app() -> FastAPI:
     """Create and configure the FastAPI application."""
     setup_logging()
-    application = FastAPI()
+    application = FastAPI(lifespan=lifespan)
     application.include_router(api_router)
     application.mount("/static", StaticFiles(directory="app/static"), name="static")
-    application.state.templates = Jinja2Templates(directory="app/templates")
+    application.state.templates = create_templates()
+    application.state.templates_version = templates_version()
     register_exception_handlers(application)
+    instrument_routes(application)
     return application
 
 
@@ -1,9 +1,24 @@
 from app.models.approval import Approval, ApprovalStep
+from app.models.approver_inbox import ApproverInboxEntry
 from app.models.comment import Comment
 from app.models.document import Document
 from app.models.document_metric import DocumentMetric
 from app.models.document_rice import DocumentRICE
+from app.models.document_rice_aggregate import DocumentRICEAggregate
+from app.models.search_index import SEARCH_KINDS
 from app.models.user import User
 from app.modules.records.model import Record
 
-__all__ = ["Approval", "ApprovalStep", "Comment", "Document", "DocumentMetric", "DocumentRICE", "Record", "User"]
+__all__ = [
+    "Approval",
+    "ApprovalStep",
+    "ApproverInboxEntry",
+    "Comment",
+    "Document",
+    "DocumentMetric",
+    "DocumentRICE",
+    "DocumentRICEAggregate",
+    "Record",
+    "SEARCH_KINDS",
+    "User",
+]
@@ -0,0 +1,3 @@
+from app.domain.models.approver_inbox import ApproverInboxEntry
+
+__all__ = ["ApproverInboxEntry"]
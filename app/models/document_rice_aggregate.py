@@ -0,0 +1,3 @@
+from app.domain.models.document_rice_aggregate import DocumentRICEAggregate
+
+__all__ = ["DocumentRICEAggregate"]
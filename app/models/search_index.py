@@ -0,0 +1,3 @@
+from app.domain.models.search_index import SEARCH_KINDS
+
+__all__ = ["SEARCH_KINDS"]
@@ -1,5 +1,5 @@
-from sqlalchemy import func, select
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy import func, insert, select, text
+from sqlalchemy.exc import OperationalError, SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.modules.records.model import Record
@@ -33,6 +33,34 @@ class RecordRepository(BaseRepository):
             self.logger.exception("Failed to count records")
             raise
 
+    async def estimate_records(self) -> int | None:
+        """Return the planner's row estimate for records, or None when statistics are missing."""
+        dialect = self.session.get_bind().dialect.name
+        try:
+            if dialect == "postgresql":
+                result = await self.session.execute(
+                    text("SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:table)"),
+                    {"table": Record.__tablename__},
+                )
+                estimate = result.scalar()
+            elif dialect == "sqlite":
+                result = await self.session.execute(
+                    text("SELECT stat FROM sqlite_stat1 WHERE tbl = :table"),
+                    {"table": Record.__tablename__},
+                )
+                estimate = max((int(stat.split()[0]) for stat in result.scalars()), default=None)
+            else:
+                return None
+        except OperationalError:
+            # sqlite_stat1 only exists after the first ANALYZE.
+            return None
+        except SQLAlchemyError:
+            self.logger.exception("Failed to estimate records", extra={"dialect": dialect})
+            raise
+        if estimate is None or estimate <= 0:
+            return None
+        return int(estimate)
+
     async def get_record(self, record_id: int) -> Record | None:
         """Return a record by ID."""
         try:
@@ -46,22 +74,14 @@ class RecordRepository(BaseRepository):
         """Create a new record."""
         record = Record(title=title, description=description)
         self.session.add(record)
-        try:
-            await self.session.flush()
-            await self.session.refresh(record)
-            return record
-        except SQLAlchemyError:
-            self.logger.exception("Failed to create record", extra={"title": title})
-            raise
+        return record
+
+    async def bulk_create_records(self, rows: list[dict]) -> None:
+        """Insert records with one executemany."""
+        await self.session.execute(insert(Record), rows)
 
     async def update_record(self, record: Record, title: str, description: str | None) -> Record:
         """Update a record."""
         record.title = title
         record.description = description
-        try:
-            await self.session.flush()
-            await self.session.refresh(record)
-            return record
-        except SQLAlchemyError:
-            self.logger.exception("Failed to update record", extra={"record_id": record.id})
-            raise
+        return record
@@ -1,9 +1,14 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import settings
+from app.core.row_count_cache import row_count_cache
+from app.infrastructure.repositories.search_repository import SearchRepository
 from app.modules.records.repository import RecordRepository
 from app.schemas.record import RecordCreate, RecordUpdate
 from app.services.base import BaseService
 
+RECORDS_COUNT_KEY = "records"
+
 
 class RecordService(BaseService):
     """Service layer for record workflows."""
@@ -12,12 +17,33 @@ class RecordService(BaseService):
         """Initialize service with a session."""
         super().__init__(session)
         self.repository = RecordRepository(session)
+        self.search_index = SearchRepository(session)
 
     async def list_records(self, offset: int, limit: int):
-        """Return list of records and total count."""
-        records = await self.repository.list_records(offset=offset, limit=limit)
-        total = await self.repository.count_records()
-        return records, total
+        """Return a page of records, the total count and whether the total is an estimate."""
+        records = await self.repository.list_records(offset=offset, limit=limit + 1)
+        has_more = len(records) > limit
+        records = records[:limit]
+        total, is_estimate = await self.count_records()
+        # Estimates may lag behind the table; never hide rows the page just proved exist.
+        total = max(total, offset + len(records) + int(has_more))
+        return records, total, is_estimate
+
+    async def count_records(self) -> tuple[int, bool]:
+        """Return the records total using the configured count strategy."""
+        strategy = settings.records_count_strategy
+        if strategy == "estimated":
+            estimate = await self.repository.estimate_records()
+            if estimate is not None:
+                return estimate, True
+        elif strategy == "cached":
+            cached = row_count_cache.get(RECORDS_COUNT_KEY)
+            if cached is not None:
+                return cached, False
+            total = await self.repository.count_records()
+            row_count_cache.set(RECORDS_COUNT_KEY, total)
+            return total, False
+        return await self.repository.count_records(), False
 
     async def get_record(self, record_id: int):
         """Get a record or None."""
@@ -25,11 +51,19 @@ class RecordService(BaseService):
 
     async def create_record(self, payload: RecordCreate):
         """Create a new record."""
-        return await self.repository.create_record(title=payload.title, description=payload.description)
+        async with self.uow:
+            record = await self.repository.create_record(title=payload.title, description=payload.description)
+            await self.search_index.index("record", [record])
+            # Invalidating before the commit would let a concurrent request cache the old count again.
+            self.uow.after_commit(lambda: row_count_cache.invalidate(RECORDS_COUNT_KEY))
+        return record
 
     async def update_record(self, record_id: int, payload: RecordUpdate):
         """Update an existing record."""
-        record = await self.repository.get_record(record_id=record_id)
-        if not record:
-            return None
-        return await self.repository.update_record(record, title=payload.title, description=payload.description)
+        async with self.uow:
+            record = await self.repository.get_record(record_id=record_id)
+            if not record:
+                return None
+            record = await self.repository.update_record(record, title=payload.title, description=payload.description)
+            await self.search_index.index("record", [record])
+            return record
@@ -1,7 +1,11 @@
 import logging
+from collections.abc import Iterable, Sequence
 
+from sqlalchemy import RowMapping, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.domain.models.document import Document
+
 
 class BaseRepository:
     """Base class for repositories."""
@@ -11,3 +15,18 @@ class BaseRepository:
     def __init__(self, session: AsyncSession) -> None:
         """Initialize repository with a session."""
         self.session = session
+
+    @staticmethod
+    def group_by_document(rows: Iterable[RowMapping], document_ids: Sequence[int]) -> dict[int, list[RowMapping]]:
+        """Group rows by their document_id, with an empty list for every id that has none."""
+        grouped: dict[int, list[RowMapping]] = {document_id: [] for document_id in document_ids}
+        for row in rows:
+            grouped[row["document_id"]].append(row)
+        return grouped
+
+    async def lock_document(self, document_id: int) -> None:
+        """Lock a document row until the transaction ends, serializing rewrites of data derived from it.
+
+        SQLite ignores ``FOR UPDATE``; its single writer already serializes these transactions.
+        """
+        await self.session.execute(select(Document.id).where(Document.id == document_id).with_for_update())
@@ -28,7 +28,6 @@ class UserRepository(BaseRepository):
         self.session.add(user)
         try:
             await self.session.flush()
-            await self.session.refresh(user)
             return user
         except SQLAlchemyError:
             self.logger.exception("Failed to create user", extra={"email": email})
@@ -1,6 +1,8 @@
 from datetime import datetime
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
+
+from app.domain.metric_values import parse_metric_number
 
 
 class DocumentBase(BaseModel):
@@ -18,6 +20,28 @@ class DocumentUpdate(DocumentBase):
     """Schema for updating documents."""
 
 
+class DocumentMetricCreate(BaseModel):
+    """Schema for creating document metrics."""
+
+    name: str = Field(..., min_length=1, max_length=255)
+    value: str = Field(..., min_length=1, max_length=255)
+    unit: str = Field(..., min_length=1, max_length=64)
+
+    @field_validator("value")
+    @classmethod
+    def value_is_number(cls, value: str) -> str:
+        """Reject values that cannot be stored as numbers."""
+        if parse_metric_number(value) is None:
+            raise ValueError("value must be a number")
+        return value
+
+
+class DocumentImport(DocumentCreate):
+    """Schema for a document row in a bulk import file."""
+
+    metrics: list[DocumentMetricCreate] = Field(default_factory=list)
+
+
 class DocumentRead(DocumentBase):
     """Schema for reading documents."""
 
@@ -1,6 +1,6 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.security import get_password_hash, verify_password
+from app.core.security import password_hasher
 from app.repositories.user_repository import UserRepository
 from app.services.base import BaseService
 
@@ -20,9 +20,9 @@ class AuthService(BaseService):
             return False
         if not user.is_active:
             return False
-        return verify_password(password, user.password_hash)
+        return await password_hasher.verify(password, user.password_hash)
 
     async def register(self, email: str, full_name: str, password: str) -> None:
         """Register a new user with a hashed password."""
-        password_hash = get_password_hash(password)
+        password_hash = await password_hasher.hash(password)
         await self.repository.create_user(email=email, full_name=full_name, password_hash=password_hash)
@@ -1,5 +1,7 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.services.unit_of_work import UnitOfWork
+
 
 class BaseService:
     """Base class for services."""
@@ -7,3 +9,4 @@ class BaseService:
     def __init__(self, session: AsyncSession) -> None:
         """Initialize service with a session."""
         self.session = session
+        self.uow = UnitOfWork(session)
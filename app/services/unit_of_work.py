@@ -0,0 +1,74 @@
+import logging
+from types import TracebackType
+from typing import Callable
+
+from sqlalchemy import event
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession, AsyncSessionTransaction
+from sqlalchemy.orm import Session
+
+AFTER_COMMIT_CALLBACKS = "after_commit_callbacks"
+
+
+@event.listens_for(Session, "after_commit")
+def _run_after_commit_callbacks(session: Session) -> None:
+    """Run callbacks registered for the transaction that just committed."""
+    for callback in session.info.pop(AFTER_COMMIT_CALLBACKS, []):
+        callback()
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_after_commit_callbacks(session: Session) -> None:
+    """Forget callbacks of a transaction that was rolled back."""
+    session.info.pop(AFTER_COMMIT_CALLBACKS, None)
+
+
+class UnitOfWork:
+    """Transaction boundary that collects repository changes and flushes them once.
+
+    When the session already has a transaction (for example one opened by the
+    request dependency), the unit of work joins it and only flushes; the owner
+    of that transaction commits. Otherwise it begins and commits its own.
+    """
+
+    logger = logging.getLogger(__name__)
+
+    def __init__(self, session: AsyncSession) -> None:
+        """Initialize the unit of work with a session."""
+        self.session = session
+        self._transaction: AsyncSessionTransaction | None = None
+
+    async def __aenter__(self) -> "UnitOfWork":
+        """Begin a transaction unless one is already active."""
+        if not self.session.in_transaction():
+            self._transaction = await self.session.begin()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> bool:
+        """Flush pending changes once, then commit or roll back an owned transaction."""
+        transaction, self._transaction = self._transaction, None
+        if exc_type is not None:
+            if transaction is not None:
+                await transaction.rollback()
+            return False
+        try:
+            if transaction is not None:
+                await transaction.commit()
+            else:
+                await self.session.flush()
+        except SQLAlchemyError:
+            self.logger.exception("Failed to flush unit of work")
+            raise
+        return False
+
+    def after_commit(self, callback: Callable[[], None]) -> None:
+        """Run a callback once the transaction this unit of work belongs to commits, whoever owns it.
+
+        Use it for side effects such as cache invalidation that must not be seen before the data is.
+        """
+        self.session.info.setdefault(AFTER_COMMIT_CALLBACKS, []).append(callback)
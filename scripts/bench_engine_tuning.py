@@ -0,0 +1,80 @@
+"""Measure mixed read/write throughput with default and tuned engine settings.
+
+Each worker loops over point reads and committed inserts of records for a fixed time,
+first on an engine created with SQLAlchemy defaults, then on the application engine
+with its pool settings and, for SQLite, its connection pragmas.
+
+    python -m scripts.bench_engine_tuning --workers 8 --seconds 5 --write-ratio 0.2
+"""
+
+import argparse
+import asyncio
+import random
+import time
+
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+
+from scripts.bench_support import reset_schema, run
+
+from app.db.session import database_url, engine
+from app.modules.records.repository import RecordRepository
+
+SEED_ROWS = 10_000
+
+
+async def throughput(bench_engine: AsyncEngine, workers: int, seconds: float, write_ratio: float) -> float:
+    """Return operations per second of concurrent workers sharing one engine."""
+    session_factory = async_sessionmaker(bind=bench_engine, expire_on_commit=False)
+    deadline = time.perf_counter() + seconds
+    operations = 0
+
+    async def worker() -> None:
+        nonlocal operations
+        while time.perf_counter() < deadline:
+            async with session_factory() as session:
+                repository = RecordRepository(session)
+                if random.random() < write_ratio:
+                    await repository.create_record(title="Запись", description="Описание")
+                    await session.commit()
+                else:
+                    await repository.get_record(random.randint(1, SEED_ROWS))
+            operations += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(workers)))
+    return operations / (time.perf_counter() - started)
+
+
+async def main() -> None:
+    """Parse arguments, seed records and compare both engines."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, default=8, help="concurrent sessions")
+    parser.add_argument("--seconds", type=float, default=5.0, help="duration of each run")
+    parser.add_argument("--write-ratio", type=float, default=0.2, help="share of operations that insert and commit")
+    args = parser.parse_args()
+
+    await reset_schema()
+    async with engine.begin() as connection:
+        session = async_sessionmaker(bind=connection)()
+        await RecordRepository(session).bulk_create_records(
+            [{"title": f"Запись {index}", "description": None} for index in range(SEED_ROWS)]
+        )
+    await engine.dispose()
+
+    default_engine = create_async_engine(database_url)
+    if database_url.get_backend_name() == "sqlite":
+        # WAL is stored in the database file; switch back so the default run uses the SQLite default journal.
+        async with default_engine.connect() as connection:
+            await connection.exec_driver_sql("PRAGMA journal_mode=DELETE")
+    try:
+        default = await throughput(default_engine, args.workers, args.seconds, args.write_ratio)
+    finally:
+        await default_engine.dispose()
+    tuned = await throughput(engine, args.workers, args.seconds, args.write_ratio)
+    print(f"backend={database_url.get_backend_name()} workers={args.workers} write_ratio={args.write_ratio}")
+    print(f"default engine: {default:.0f} ops/s")
+    print(f"tuned engine:   {tuned:.0f} ops/s ({tuned / default:.2f}x)")
+
+
+if __name__ == "__main__":
+    run(main)
@@ -0,0 +1,101 @@
+"""Measure document export throughput and memory in each format.
+
+Seeds documents with one metric and one RICE score each, then drains
+``stream_document_export`` for every format and reports rows per second, bytes
+written and the peak growth of anonymous memory. File-backed pages are left out:
+SQLite maps up to ``SQLITE_MMAP_SIZE`` of the database into the process, which
+shows up in RSS without being allocated by the export. Linux only.
+
+    python -m scripts.bench_export --documents 500000
+"""
+
+import argparse
+import time
+
+from sqlalchemy import insert
+
+from scripts.bench_support import reset_schema, run
+
+from app.application.services.document_export_service import EXPORT_MEDIA_TYPES, stream_document_export
+from app.core.config import settings
+from app.db.session import SessionLocal
+from app.domain.models.document_metric import DocumentMetric
+from app.domain.models.document_rice import DocumentRICE
+from app.domain.models.user import User
+from app.infrastructure.repositories.document_repository import DocumentRepository
+
+SEED_BATCH_SIZE = 10_000
+
+
+async def seed(documents: int) -> None:
+    """Insert documents with one metric and one RICE score each, in batches."""
+    async with SessionLocal() as session:
+        author = User(email="bench@example.com", full_name="Bench", password_hash="-")
+        session.add(author)
+        await session.flush()
+        repository = DocumentRepository(session)
+        for start in range(0, documents, SEED_BATCH_SIZE):
+            batch = range(start, min(documents, start + SEED_BATCH_SIZE))
+            ids = await repository.bulk_create_documents(
+                [{"title": f"Документ {index}", "description": "Описание"} for index in batch], return_ids=True
+            )
+            await session.execute(
+                insert(DocumentMetric),
+                [{"document_id": document_id, "name": "Выручка", "value": "100", "unit": "руб"} for document_id in ids],
+            )
+            await session.execute(
+                insert(DocumentRICE),
+                [
+                    {
+                        "document_id": document_id,
+                        "author_id": author.id,
+                        "reach": 100.0,
+                        "impact": 2.0,
+                        "confidence": 0.8,
+                        "effort": 4.0,
+                        "score": 40.0,
+                    }
+                    for document_id in ids
+                ],
+            )
+            await session.commit()
+
+
+def anonymous_rss_mib() -> float:
+    """Return the anonymous (heap and stack) resident memory of this process in MiB."""
+    with open("/proc/self/status") as status:
+        for line in status:
+            if line.startswith("RssAnon:"):
+                return int(line.split()[1]) / 1024
+    raise RuntimeError("RssAnon is missing from /proc/self/status")
+
+
+async def main() -> None:
+    """Parse arguments, seed documents and drain the export in every format."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--documents", type=int, default=500_000, help="documents to seed")
+    parser.add_argument("--batch-size", type=int, default=settings.export_batch_size, help="export batch size")
+    args = parser.parse_args()
+
+    await reset_schema()
+    started = time.perf_counter()
+    await seed(args.documents)
+    print(f"seeded {args.documents} documents in {time.perf_counter() - started:.1f}s")
+
+    for export_format in sorted(EXPORT_MEDIA_TYPES):
+        rss_before = rss_peak = anonymous_rss_mib()
+        written = 0
+        started = time.perf_counter()
+        async for chunk in stream_document_export(export_format, args.batch_size):
+            written += len(chunk.encode())
+            rss_peak = max(rss_peak, anonymous_rss_mib())
+        elapsed = time.perf_counter() - started
+        print(
+            f"{export_format:<6} {args.documents / elapsed:,.0f} rows/s, {elapsed:.1f}s, "
+            f"{written / 2**20:.0f} MiB written, peak anonymous RSS +{rss_peak - rss_before:.0f} MiB "
+            f"(batch {args.batch_size})"
+        )
+
+
+if __name__ == "__main__":
+    run(main)
@@ -0,0 +1,96 @@
+"""Compare the ORM-and-dicts JSON path with column projections encoded by orjson.
+
+Loads a document's comments both ways: ORM entities copied into dicts and encoded
+by the standard ``JSONResponse``, against the projection rows the endpoints return
+through ``FastJSONResponse``. Reports latency percentiles and the peak traced
+allocation of each path, and checks that both produce the same payload.
+
+    python -m scripts.bench_json --comments 10000 --runs 20
+"""
+
+import argparse
+import json
+import time
+import tracemalloc
+from typing import Awaitable, Callable
+
+from fastapi.responses import JSONResponse
+from sqlalchemy import insert, select
+
+from scripts.bench_support import reset_schema, run, summary
+
+from app.application.services.document_service import DocumentService
+from app.core.responses import FastJSONResponse
+from app.db.session import SessionLocal
+from app.domain.models.comment import Comment
+from app.infrastructure.repositories.comment_repository import CommentRepository
+from app.schemas.document import DocumentCreate
+
+
+async def orm_body(document_id: int) -> bytes:
+    """Render comments the way the endpoint did before projections."""
+    async with SessionLocal() as session:
+        result = await session.execute(
+            select(Comment).where(Comment.document_id == document_id).order_by(Comment.created_at.asc())
+        )
+        payload = [
+            {
+                "id": comment.id,
+                "content": comment.content,
+                "document_id": comment.document_id,
+                "approval_id": comment.approval_id,
+                "created_at": comment.created_at.isoformat(),
+            }
+            for comment in result.scalars().all()
+        ]
+        return JSONResponse(payload).body
+
+
+async def projection_body(document_id: int) -> bytes:
+    """Render comments the way the endpoint does now."""
+    async with SessionLocal() as session:
+        return FastJSONResponse(await CommentRepository(session).list_rows_for_document(document_id)).body
+
+
+async def measure(render: Callable[[int], Awaitable[bytes]], document_id: int, runs: int) -> tuple[list[float], float]:
+    """Return latencies of ``runs`` renders and the peak traced allocation of one render in MiB."""
+    latencies = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        await render(document_id)
+        latencies.append(time.perf_counter() - started)
+    tracemalloc.start()
+    try:
+        await render(document_id)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return latencies, peak / 2**20
+
+
+async def main() -> None:
+    """Parse arguments, seed comments and compare both paths."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--comments", type=int, default=10_000, help="comments on the document")
+    parser.add_argument("--runs", type=int, default=20, help="timed renders per path")
+    args = parser.parse_args()
+
+    await reset_schema()
+    async with SessionLocal() as session:
+        document = await DocumentService(session).create_draft(DocumentCreate(title="Документ", description="Описание"))
+    async with SessionLocal() as session:
+        await session.execute(
+            insert(Comment),
+            [{"document_id": document.id, "content": f"Комментарий {index}"} for index in range(args.comments)],
+        )
+        await session.commit()
+
+    if json.loads(await orm_body(document.id)) != json.loads(await projection_body(document.id)):
+        raise SystemExit("the two paths produced different payloads")
+    for label, render in (("ORM + dicts + JSONResponse", orm_body), ("projection + FastJSONResponse", projection_body)):
+        latencies, peak = await measure(render, document.id, args.runs)
+        print(f"{label:<30} {summary(latencies)} peak alloc {peak:.1f} MiB")
+
+
+if __name__ == "__main__":
+    run(main)
@@ -0,0 +1,83 @@
+"""Measure how concurrent logins affect the latency of other routes.
+
+Runs a burst of ``POST /login`` requests while ``GET /health`` is probed every few
+milliseconds, once with bcrypt on the password hashing pool and once inline on the
+event loop, and prints the probe latencies of both modes.
+
+    python -m scripts.bench_password_hashing --logins 64
+"""
+
+import argparse
+import asyncio
+import time
+from unittest import mock
+
+import httpx
+
+from scripts.bench_support import reset_schema, run, summary
+
+from app.core.security import PasswordHasher, password_hasher
+from app.db.session import SessionLocal
+from app.domain.models.user import User
+from app.main import app
+
+
+async def run_inline(self: PasswordHasher, func, *args):
+    """Call the hashing function directly on the event loop, as before the worker pool."""
+    return func(*args)
+
+
+async def measure(logins: int, probe_interval: float) -> tuple[list[float], float]:
+    """Return health probe latencies and the wall time of a burst of concurrent logins."""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        latencies: list[float] = []
+        done = asyncio.Event()
+
+        async def probe() -> None:
+            # Latency counts from when the probe was due, so time the event loop spent blocked is included.
+            due = time.perf_counter()
+            while not done.is_set():
+                await asyncio.sleep(max(0.0, due - time.perf_counter()))
+                await client.get("/health")
+                finished = time.perf_counter()
+                latencies.append(finished - due)
+                due = finished + probe_interval
+
+        async def login() -> None:
+            response = await client.post("/login", data={"email": "bench@example.com", "password": "secret"})
+            response.raise_for_status()
+
+        prober = asyncio.create_task(probe())
+        started = time.perf_counter()
+        await asyncio.gather(*(login() for _ in range(logins)))
+        elapsed = time.perf_counter() - started
+        done.set()
+        await prober
+    return latencies, elapsed
+
+
+async def main() -> None:
+    """Parse arguments, seed a user and compare both modes."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--logins", type=int, default=64, help="concurrent login requests")
+    parser.add_argument("--probe-interval", type=float, default=0.005, help="seconds between health probes")
+    args = parser.parse_args()
+
+    await reset_schema()
+    async with SessionLocal() as session:
+        session.add(User(email="bench@example.com", full_name="Bench", password_hash=await password_hasher.hash("secret")))
+        await session.commit()
+
+    with mock.patch.object(PasswordHasher, "_submit", run_inline):
+        latencies, elapsed = await measure(args.logins, args.probe_interval)
+    print(f"inline  logins={args.logins} in {elapsed:.2f}s, /health {summary(latencies)}")
+    latencies, elapsed = await measure(args.logins, args.probe_interval)
+    print(
+        f"pooled  logins={args.logins} in {elapsed:.2f}s, /health {summary(latencies)} "
+        f"(workers={password_hasher.max_workers})"
+    )
+
+
+if __name__ == "__main__":
+    run(main)
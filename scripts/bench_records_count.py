@@ -0,0 +1,63 @@
+"""Measure the records list page with each count strategy on a large table.
+
+Seeds the records table, runs ANALYZE so the planner estimate exists, then times
+``RecordService.list_records`` for the first page under every value of
+``RECORDS_COUNT_STRATEGY``.
+
+    python -m scripts.bench_records_count --rows 1000000 --requests 50
+"""
+
+import argparse
+import time
+
+from sqlalchemy import text
+
+from scripts.bench_support import reset_schema, run, summary, timed
+
+from app.core.config import settings
+from app.core.row_count_cache import row_count_cache
+from app.db.session import SessionLocal, engine
+from app.modules.records.repository import RecordRepository
+from app.modules.records.service import RecordService
+
+BATCH_SIZE = 10_000
+STRATEGIES = ("exact", "estimated", "cached")
+
+
+async def seed(rows: int) -> None:
+    """Insert ``rows`` records in batches and refresh planner statistics."""
+    async with SessionLocal() as session:
+        repository = RecordRepository(session)
+        for start in range(0, rows, BATCH_SIZE):
+            batch = range(start, min(rows, start + BATCH_SIZE))
+            await repository.bulk_create_records([{"title": f"Запись {index}", "description": None} for index in batch])
+            await session.commit()
+    async with engine.begin() as connection:
+        await connection.execute(text("ANALYZE records"))
+
+
+async def main() -> None:
+    """Parse arguments, seed records and time the first page with every strategy."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000, help="records to seed")
+    parser.add_argument("--requests", type=int, default=50, help="page loads per strategy")
+    args = parser.parse_args()
+
+    await reset_schema()
+    with timed(f"seed {args.rows} records"):
+        await seed(args.rows)
+
+    for strategy in STRATEGIES:
+        settings.records_count_strategy = strategy
+        row_count_cache.clear()
+        latencies = []
+        for _ in range(args.requests):
+            started = time.perf_counter()
+            async with SessionLocal() as session:
+                _, total, is_estimate = await RecordService(session).list_records(offset=0, limit=20)
+            latencies.append(time.perf_counter() - started)
+        print(f"{strategy:<9} total={total} estimate={is_estimate} {summary(latencies)}")
+
+
+if __name__ == "__main__":
+    run(main)
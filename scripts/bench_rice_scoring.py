@@ -0,0 +1,124 @@
+"""Measure bulk RICE scoring: per-row Python against NumPy, and the database round trips.
+
+Seeds RICE rows spread over documents, with about 1% zero efforts, then reports:
+scoring every row with ``DocumentRICEService.calc_score`` against ``score_arrays``
+on the same columns, a read-only what-if ranking, and a persisted rescore that
+halves confidence so every row is written.
+
+    python -m scripts.bench_rice_scoring --rows 5000000
+"""
+
+import argparse
+import time
+
+import numpy as np
+from sqlalchemy import insert
+
+from scripts.bench_support import reset_schema, run
+
+from app.application.services.document_rice_service import DocumentRICEService
+from app.application.services.rice_scoring_service import RICEScenario, RICEScoringService, score_arrays
+from app.db.session import SessionLocal
+from app.domain.models.document_rice import DocumentRICE
+from app.domain.models.user import User
+from app.infrastructure.repositories.document_repository import DocumentRepository
+
+SEED_BATCH_SIZE = 50_000
+ROWS_PER_DOCUMENT = 50
+
+
+def factor_columns(rows: int, seed: int = 0) -> dict[str, np.ndarray]:
+    """Return random reach, impact, confidence and effort columns, with some zero efforts."""
+    generator = np.random.default_rng(seed)
+    effort = generator.uniform(0.5, 10.0, rows)
+    effort[generator.random(rows) < 0.01] = 0.0
+    return {
+        "reach": generator.uniform(1, 10_000, rows),
+        "impact": generator.choice([0.25, 0.5, 1.0, 2.0, 3.0], rows),
+        "confidence": generator.choice([0.5, 0.8, 1.0], rows),
+        "effort": effort,
+    }
+
+
+async def seed(rows: int) -> None:
+    """Insert documents and ``rows`` RICE scores in batches."""
+    columns = factor_columns(rows)
+    scores = score_arrays(columns["reach"], columns["impact"], columns["confidence"], columns["effort"])
+    async with SessionLocal() as session:
+        author = User(email="bench@example.com", full_name="Bench", password_hash="-")
+        session.add(author)
+        await session.flush()
+        documents = DocumentRepository(session)
+        for start in range(0, rows, SEED_BATCH_SIZE):
+            stop = min(rows, start + SEED_BATCH_SIZE)
+            document_ids = await documents.bulk_create_documents(
+                [{"title": f"Документ {index}", "description": None} for index in range(start, stop, ROWS_PER_DOCUMENT)],
+                return_ids=True,
+            )
+            await session.execute(
+                insert(DocumentRICE),
+                [
+                    {
+                        "document_id": document_ids[(index - start) // ROWS_PER_DOCUMENT],
+                        "author_id": author.id,
+                        "reach": float(columns["reach"][index]),
+                        "impact": float(columns["impact"][index]),
+                        "confidence": float(columns["confidence"][index]),
+                        "effort": float(columns["effort"][index]),
+                        "score": float(scores[index]),
+                    }
+                    for index in range(start, stop)
+                ],
+            )
+            await session.commit()
+
+
+def compare_scoring(rows: int) -> None:
+    """Score the same columns row by row and vectorized, and check they agree."""
+    columns = factor_columns(rows)
+    service = DocumentRICEService(SessionLocal())
+    started = time.perf_counter()
+    per_row = [
+        service.calc_score(reach, impact, confidence, effort)
+        for reach, impact, confidence, effort in zip(
+            columns["reach"].tolist(), columns["impact"].tolist(), columns["confidence"].tolist(), columns["effort"].tolist()
+        )
+    ]
+    python_seconds = time.perf_counter() - started
+    started = time.perf_counter()
+    vectorized = score_arrays(columns["reach"], columns["impact"], columns["confidence"], columns["effort"])
+    numpy_seconds = time.perf_counter() - started
+    if not np.allclose(per_row, vectorized):
+        raise SystemExit("calc_score and score_arrays disagree")
+    print(f"score {rows} rows in memory: calc_score {python_seconds:.2f}s, score_arrays {numpy_seconds:.3f}s")
+
+
+async def main() -> None:
+    """Parse arguments, seed RICE rows and time every stage."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=5_000_000, help="RICE rows to seed")
+    parser.add_argument("--chunk-size", type=int, default=10_000, help="rows per read and transaction")
+    args = parser.parse_args()
+
+    compare_scoring(args.rows)
+
+    await reset_schema()
+    started = time.perf_counter()
+    await seed(args.rows)
+    print(f"seeded {args.rows} rows in {time.perf_counter() - started:.1f}s")
+
+    async with SessionLocal() as session:
+        started = time.perf_counter()
+        ranking = await RICEScoringService(session).what_if(RICEScenario(confidence=0.5), args.chunk_size, limit=20)
+        elapsed = time.perf_counter() - started
+    print(f"what-if over {args.rows} rows: {elapsed:.1f}s ({args.rows / elapsed:,.0f} rows/s), top {len(ranking)}")
+
+    async with SessionLocal() as session:
+        started = time.perf_counter()
+        updated = await RICEScoringService(session).rescore(RICEScenario(confidence=0.5), args.chunk_size)
+        elapsed = time.perf_counter() - started
+    print(f"rescore wrote {updated} rows: {elapsed:.1f}s ({updated / elapsed:,.0f} rows/s)")
+
+
+if __name__ == "__main__":
+    run(main)
@@ -0,0 +1,68 @@
+"""Shared setup of the benchmark scripts: import this module before anything from ``app``.
+
+Benchmarks run against a throwaway SQLite database unless ``DATABASE_URL`` is set,
+so they can be pointed at a Postgres instance for numbers closer to production.
+"""
+
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+
+os.environ.setdefault("DATABASE_URL", f"sqlite+aiosqlite:///{tempfile.mkdtemp(prefix='app-bench-')}/bench.db")
+os.environ.setdefault("SECRET_KEY", "bench-secret")
+os.environ.setdefault("ENVIRONMENT", "bench")
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+# Benchmarks measure the pooled engine; ``run`` disposes it so the process can exit.
+os.environ.setdefault("SQLITE_POOL_ENABLED", "true")
+
+from app import models  # noqa: E402,F401
+from app.db.base import Base  # noqa: E402
+from app.db.session import engine  # noqa: E402
+
+
+async def reset_schema() -> None:
+    """Drop and recreate every table."""
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.drop_all)
+        await connection.run_sync(Base.metadata.create_all)
+
+
+def run(main: Callable[[], Awaitable[None]]) -> None:
+    """Run a benchmark coroutine and close pooled connections, whose threads would keep the process alive."""
+
+    async def wrapper() -> None:
+        try:
+            await main()
+        finally:
+            await engine.dispose()
+
+    asyncio.run(wrapper())
+
+
+def percentile(values: list[float], q: float) -> float:
+    """Return the ``q``-th percentile of the values, interpolated."""
+    if len(values) < 2:
+        return values[0] if values else float("nan")
+    return statistics.quantiles(values, n=100, method="inclusive")[max(0, min(98, round(q) - 1))]
+
+
+def summary(values: list[float]) -> str:
+    """Format count, p50, p99 and max of latencies given in seconds."""
+    if not values:
+        return "n=0"
+    return (
+        f"n={len(values)} p50={percentile(values, 50) * 1000:.1f}ms "
+        f"p99={percentile(values, 99) * 1000:.1f}ms max={max(values) * 1000:.1f}ms"
+    )
+
+
+@contextmanager
+def timed(label: str) -> Iterator[None]:
+    """Print the wall time of a block."""
+    started = time.perf_counter()
+    yield
+    print(f"{label}: {time.perf_counter() - started:.3f}s")
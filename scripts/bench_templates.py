@@ -0,0 +1,103 @@
+"""Measure template load time and first-request latency, cold and warm.
+
+Per template, reports the time to load it in a fresh environment compiling from
+source, and loading from a populated bytecode cache. Then reports the latency of
+the first and second document detail request of a freshly created application
+that starts cold, starts with a populated bytecode cache, or has been warmed up
+the way the lifespan does it.
+
+    python -m scripts.bench_templates
+"""
+
+import tempfile
+import time
+
+import httpx
+
+from scripts.bench_support import reset_schema, run
+
+from app.application.services.approval_service import ApprovalService
+from app.application.services.document_service import DocumentService
+from app.core.config import settings
+from app.core.fragment_cache import fragment_cache
+from app.core.security import create_access_token
+from app.core.templating import create_templates, warm_up_templates
+from app.db.session import SessionLocal
+from app.domain.models.user import User
+from app.main import create_app
+from app.schemas.document import DocumentCreate
+
+
+def use_bytecode_cache(cache_dir: str | None) -> None:
+    """Point new template environments at a bytecode cache directory, or disable it."""
+    settings.template_bytecode_cache = cache_dir is not None
+    settings.template_bytecode_cache_dir = cache_dir
+
+
+def load_times() -> dict[str, float]:
+    """Return the time to load every template in a new environment, by name."""
+    templates = create_templates()
+    times = {}
+    for name in templates.env.list_templates(extensions=["html"]):
+        started = time.perf_counter()
+        templates.env.get_template(name)
+        times[name] = time.perf_counter() - started
+    return times
+
+
+async def seed() -> tuple[str, int]:
+    """Create a user and a document submitted to them; return the user's token and the document id."""
+    async with SessionLocal() as session:
+        user = User(email="bench@example.com", full_name="Bench", password_hash="-")
+        session.add(user)
+        await session.commit()
+    async with SessionLocal() as session:
+        document = await DocumentService(session).create_draft(DocumentCreate(title="Документ", description="Описание"))
+        await ApprovalService(session).create_approval_flow(document.id, [user.id])
+    return create_access_token(user.email), document.id
+
+
+async def first_requests(token: str, document_id: int, warm_up: bool) -> tuple[float, float]:
+    """Return the latency of the first two detail requests served by a new application."""
+    fragment_cache.clear()
+    application = create_app()
+    if warm_up:
+        warm_up_templates(application.state.templates)
+    transport = httpx.ASGITransport(app=application)
+    latencies = []
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        client.cookies.set("access_token", token)
+        for _ in range(2):
+            started = time.perf_counter()
+            response = await client.get(f"/documents/{document_id}")
+            latencies.append(time.perf_counter() - started)
+            response.raise_for_status()
+    return latencies[0], latencies[1]
+
+
+async def main() -> None:
+    """Print per-template load times and first-request latencies."""
+    await reset_schema()
+    token, document_id = await seed()
+    cache_dir = tempfile.mkdtemp(prefix="jinja-bytecode-")
+
+    use_bytecode_cache(None)
+    from_source = load_times()
+    use_bytecode_cache(cache_dir)
+    load_times()  # populates the cache
+    from_bytecode = load_times()
+    print(f"{'template':<30} {'source ms':>10} {'bytecode ms':>12}")
+    for name, seconds in from_source.items():
+        print(f"{name:<30} {seconds * 1000:>10.2f} {from_bytecode[name] * 1000:>12.2f}")
+    print(f"{'total':<30} {sum(from_source.values()) * 1000:>10.2f} {sum(from_bytecode.values()) * 1000:>12.2f}")
+
+    print()
+    print(f"{'GET /documents/{id}':<30} {'first ms':>10} {'second ms':>12}")
+    for label, cache, warm_up in (("cold", None, False), ("bytecode cache", cache_dir, False), ("warmed up", cache_dir, True)):
+        use_bytecode_cache(cache)
+        first, second = await first_requests(token, document_id, warm_up)
+        print(f"{label:<30} {first * 1000:>10.2f} {second * 1000:>12.2f}")
+
+
+if __name__ == "__main__":
+    run(main)
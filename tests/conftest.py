@@ -0,0 +1,112 @@
+import os
+import tempfile
+from collections.abc import AsyncIterator, Awaitable, Callable
+
+_DATABASE_DIR = tempfile.mkdtemp(prefix="app-tests-")
+os.environ.setdefault("DATABASE_URL", f"sqlite+aiosqlite:///{_DATABASE_DIR}/test.db")
+os.environ.setdefault("SECRET_KEY", "test-secret")
+os.environ.setdefault("ENVIRONMENT", "test")
+os.environ.setdefault("TEMPLATE_BYTECODE_CACHE", "false")
+# A deliberately small pool: anything holding one connection while waiting for another shows up as a timeout.
+os.environ.setdefault("SQLITE_POOL_ENABLED", "true")
+os.environ.setdefault("DB_POOL_SIZE", "2")
+os.environ.setdefault("DB_MAX_OVERFLOW", "0")
+os.environ.setdefault("DB_POOL_TIMEOUT", "3")
+
+import httpx  # noqa: E402
+import pytest  # noqa: E402
+from fastapi import FastAPI  # noqa: E402
+
+from app import models  # noqa: E402,F401
+from app.application.services.approval_service import ApprovalService  # noqa: E402
+from app.application.services.comment_service import CommentService  # noqa: E402
+from app.application.services.document_metric_service import DocumentMetricService  # noqa: E402
+from app.application.services.document_rice_service import DocumentRICEService  # noqa: E402
+from app.application.services.document_service import DocumentService  # noqa: E402
+from app.core.fragment_cache import fragment_cache  # noqa: E402
+from app.core.principal_cache import principal_cache  # noqa: E402
+from app.core.row_count_cache import row_count_cache  # noqa: E402
+from app.core.security import create_access_token  # noqa: E402
+from app.db.base import Base  # noqa: E402
+from app.db.session import SessionLocal, engine  # noqa: E402
+from app.domain.models.document import Document  # noqa: E402
+from app.domain.models.user import User  # noqa: E402
+from app.schemas.document import DocumentCreate  # noqa: E402
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    """Run async tests on asyncio only."""
+    return "asyncio"
+
+
+@pytest.fixture(autouse=True)
+async def database(anyio_backend: str) -> AsyncIterator[None]:
+    """Give every test an empty schema and drop pooled connections and per-process caches afterwards."""
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.drop_all)
+        await connection.run_sync(Base.metadata.create_all)
+    yield
+    await engine.dispose()
+    principal_cache.clear()
+    fragment_cache.clear()
+    row_count_cache.clear()
+
+
+@pytest.fixture
+def app() -> FastAPI:
+    """Return the application under test."""
+    from app.main import app as application
+
+    return application
+
+
+@pytest.fixture
+async def user() -> User:
+    """Create an active user."""
+    async with SessionLocal() as session:
+        account = User(email="tester@example.com", full_name="Tester", password_hash="-")
+        session.add(account)
+        await session.commit()
+        return account
+
+
+@pytest.fixture
+async def client(app: FastAPI, user: User) -> AsyncIterator[httpx.AsyncClient]:
+    """Return an HTTP client authenticated as ``user``."""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as http_client:
+        http_client.cookies.set("access_token", create_access_token(user.email))
+        yield http_client
+
+
+@pytest.fixture
+def make_document(user: User) -> Callable[..., Awaitable[Document]]:
+    """Return a factory creating a document, optionally submitted for approval by ``user``."""
+
+    async def factory(title: str = "Документ", submit: bool = False) -> Document:
+        async with SessionLocal() as session:
+            document = await DocumentService(session).create_draft(DocumentCreate(title=title, description="Описание"))
+            if submit:
+                await ApprovalService(session).create_approval_flow(document.id, [user.id])
+            return document
+
+    return factory
+
+
+@pytest.fixture
+def fill_document() -> Callable[[int, int, int], Awaitable[None]]:
+    """Return a helper giving a draft comments, metrics and RICE scores, submitting it on the way."""
+
+    async def fill(document_id: int, user_id: int, children: int) -> None:
+        async with SessionLocal() as session:
+            for index in range(children):
+                await CommentService(session).add_comment(f"Комментарий {index}", document_id, None)
+                await DocumentMetricService(session).add_metric(document_id, f"Метрика {index}", str(index), "шт")
+            await ApprovalService(session).create_approval_flow(document_id, [user_id])
+            for _ in range(children):
+                await DocumentRICEService(session).add_rice(
+                    document_id, user_id, {"reach": 10, "impact": 2, "confidence": 0.5, "effort": 1}
+                )
+
+    return fill
@@ -0,0 +1,25 @@
+import pytest
+
+from app.db.session import count_queries
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.mark.parametrize("endpoint", ["/documents/comments", "/documents/metrics", "/documents/rice"])
+async def test_batch_endpoint_query_count_does_not_grow_with_ids(client, make_document, fill_document, user, endpoint):
+    document_ids = []
+    for index in range(10):
+        document = await make_document(title=f"Документ {index}")
+        await fill_document(document.id, user.id, children=2)
+        document_ids.append(document.id)
+    await client.get(endpoint, params={"ids": document_ids[0]})  # caches the principal
+
+    counts = {}
+    for size in (1, len(document_ids)):
+        with count_queries() as queries:
+            response = await client.get(endpoint, params={"ids": ",".join(map(str, document_ids[:size]))})
+        assert response.status_code == 200
+        assert len(response.json()) == size
+        counts[size] = queries.count
+
+    assert counts[1] == counts[len(document_ids)] == 1
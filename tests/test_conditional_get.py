@@ -0,0 +1,45 @@
+import pytest
+from sqlalchemy import select
+
+from app.application.services.approval_service import ApprovalService
+from app.application.services.comment_service import CommentService
+from app.db.session import SessionLocal
+from app.domain.models.approval import Approval, ApprovalStep
+
+pytestmark = pytest.mark.anyio
+
+HTML = {"accept": "text/html"}
+
+
+async def etag_of(client, document_id: int) -> str:
+    response = await client.get(f"/documents/{document_id}", headers=HTML)
+    assert response.status_code == 200
+    return response.headers["etag"]
+
+
+async def test_unchanged_document_answers_304(client, make_document):
+    document = await make_document()
+    etag = await etag_of(client, document.id)
+
+    response = await client.get(f"/documents/{document.id}", headers={**HTML, "if-none-match": etag})
+
+    assert response.status_code == 304
+
+
+async def test_etag_ignores_other_documents_approvals_and_comments(client, make_document, user):
+    changed = await make_document(title="Меняется", submit=True)
+    draft = await make_document(title="Черновик")
+    submitted = await make_document(title="На согласовании", submit=True)
+    before = {document.id: await etag_of(client, document.id) for document in (draft, submitted)}
+
+    async with SessionLocal() as session:
+        approval_id = await session.scalar(select(Approval.id).where(Approval.document_id == changed.id))
+        step_id = await session.scalar(select(ApprovalStep.id).where(ApprovalStep.approval_id == approval_id))
+    async with SessionLocal() as session:
+        await CommentService(session).add_comment("К документу", changed.id, None)
+        await CommentService(session).add_comment("К согласованию", None, approval_id)
+        await ApprovalService(session).approve_step(step_id, user.id)
+
+    for document_id, etag in before.items():
+        response = await client.get(f"/documents/{document_id}", headers={**HTML, "if-none-match": etag})
+        assert response.status_code == 304
@@ -0,0 +1,48 @@
+import asyncio
+
+import pytest
+
+from app.core.config import settings
+from app.db.session import SessionLocal, engine, fan_out_reads
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_concurrent_detail_pages_do_not_starve_the_pool(client, make_document):
+    document = await make_document(submit=True)
+    requests = settings.db_pool_size + settings.db_max_overflow
+
+    responses = await asyncio.gather(
+        *(client.get(f"/documents/{document.id}", headers={"accept": "text/html"}) for _ in range(requests))
+    )
+
+    assert [response.status_code for response in responses] == [200] * requests
+
+
+async def session_of(read_session):
+    await asyncio.sleep(0)
+    return read_session
+
+
+async def test_fan_out_opens_extra_sessions_when_the_pool_has_headroom():
+    async with SessionLocal() as session:
+        used = await fan_out_reads(session, session_of, session_of)
+
+    assert used[0] is session
+    assert used[1] is not session
+
+
+async def test_fan_out_runs_on_the_request_session_without_pool_headroom():
+    async with SessionLocal() as session:
+        await session.connection()
+        held = [await engine.connect() for _ in range(settings.db_pool_size + settings.db_max_overflow - 1)]
+        try:
+            used = await asyncio.wait_for(
+                fan_out_reads(session, session_of, session_of),
+                timeout=settings.db_pool_timeout / 2,
+            )
+        finally:
+            for connection in held:
+                await connection.close()
+
+    assert used == [session, session]
@@ -0,0 +1,54 @@
+import io
+import logging
+from collections.abc import Iterator
+
+import orjson
+import pytest
+
+from app.core import logger as app_logger
+from app.core.logger import setup_logging, shutdown_logging
+
+
+@pytest.fixture
+def fresh_logging() -> Iterator[None]:
+    """Start from stopped logging and leave it stopped."""
+    shutdown_logging()
+    yield
+    shutdown_logging()
+
+
+def root_handler_of(handler_type: type) -> logging.Handler:
+    """Return the root handler of exactly the given type."""
+    return next(handler for handler in logging.getLogger().handlers if type(handler) is handler_type)
+
+
+def test_records_logged_after_shutdown_are_written_directly(fresh_logging):
+    setup_logging()
+    shutdown_logging()
+
+    assert not any(isinstance(handler, app_logger.NonBlockingQueueHandler) for handler in logging.getLogger().handlers)
+    buffer = io.StringIO()
+    root_handler_of(logging.StreamHandler).setStream(buffer)
+    logging.getLogger("tests.logging").warning("After shutdown", extra={"step": "atexit"})
+
+    record = orjson.loads(buffer.getvalue())
+    assert record["message"] == "After shutdown"
+    assert record["step"] == "atexit"
+
+
+def test_setup_after_shutdown_replaces_the_direct_handler(fresh_logging):
+    setup_logging()
+    shutdown_logging()
+    setup_logging()
+
+    handlers = logging.getLogger().handlers
+    assert sum(isinstance(handler, app_logger.NonBlockingQueueHandler) for handler in handlers) == 1
+    assert not any(type(handler) is logging.StreamHandler for handler in handlers)
+
+
+def test_setup_keeps_other_root_handlers(fresh_logging, caplog):
+    setup_logging()
+
+    logging.getLogger("tests.logging").warning("Still captured")
+
+    assert [record.getMessage() for record in caplog.records] == ["Still captured"]
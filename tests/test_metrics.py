@@ -0,0 +1,36 @@
+import re
+
+import pytest
+
+from app.core.security import password_hasher
+from app.db.session import SessionLocal
+from app.domain.models.user import User
+
+pytestmark = pytest.mark.anyio
+
+
+def sample(body: str, name: str) -> float:
+    """Return the value of an unlabelled sample in a Prometheus text body."""
+    match = re.search(rf"^{re.escape(name)} (\S+)$", body, re.MULTILINE)
+    assert match, f"{name} is missing"
+    return float(match.group(1))
+
+
+async def test_metrics_expose_password_hashing(client):
+    async with SessionLocal() as session:
+        session.add(
+            User(email="login@example.com", full_name="Login", password_hash=await password_hasher.hash("secret"))
+        )
+        await session.commit()
+    before = (await client.get("/metrics")).text
+
+    response = await client.post("/login", data={"email": "login@example.com", "password": "secret"})
+
+    assert response.status_code == 200
+    after = (await client.get("/metrics")).text
+    assert sample(after, "password_hash_workers") == password_hasher.max_workers
+    assert sample(after, "password_hash_in_flight") == 0
+    assert sample(after, "password_hash_queue_depth") == 0
+    for histogram in ("password_hash_wait_seconds", "password_hash_run_seconds"):
+        assert sample(after, f"{histogram}_count") == sample(before, f"{histogram}_count") + 1
+        assert sample(after, f'{histogram}_bucket{{le="+Inf"}}') == sample(after, f"{histogram}_count")
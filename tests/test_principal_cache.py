@@ -0,0 +1,31 @@
+import pytest
+
+from app.application.services.user_service import UserService
+from app.core.principal_cache import principal_cache
+from app.db.session import session_scope
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_deactivated_user_is_rejected_on_next_request(client, user):
+    assert (await client.get("/documents/ranking")).status_code == 200  # caches the principal
+
+    async with session_scope() as session:
+        await UserService(session).deactivate_user(user.id)
+        # Until the request transaction commits, other requests must still see the committed user.
+        assert principal_cache.get(user.email) is not None
+
+    assert principal_cache.get(user.email) is None
+    assert (await client.get("/documents/ranking")).status_code == 401
+
+
+async def test_rolled_back_user_update_keeps_cached_principal(client, user):
+    assert (await client.get("/documents/ranking")).status_code == 200
+
+    with pytest.raises(RuntimeError):
+        async with session_scope() as session:
+            await UserService(session).update_user(user.id, email="renamed@example.com", full_name=None, password=None)
+            raise RuntimeError("request failed")
+
+    assert principal_cache.get(user.email) is not None
+    assert (await client.get("/documents/ranking")).status_code == 200
@@ -0,0 +1,77 @@
+import logging
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from sqlalchemy import select
+
+from app.core.config import settings
+from app.core.metrics import QueryBudgetExceeded, instrument_routes, query_budget
+from app.db.session import SessionLocal
+from app.domain.models.user import User
+
+pytestmark = pytest.mark.anyio
+
+LOOKUPS = 3
+
+
+@pytest.fixture
+def budget_client() -> httpx.AsyncClient:
+    """Return a client for an app with one route that runs an N+1 loop over its budget of one statement."""
+    application = FastAPI()
+
+    @application.get("/users")
+    @query_budget(1)
+    async def lookup_users() -> dict:
+        async with SessionLocal() as session:
+            for user_id in range(LOOKUPS):
+                await session.execute(select(User.email).where(User.id == user_id))
+        return {"lookups": LOOKUPS}
+
+    instrument_routes(application)
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=application), base_url="http://testserver")
+
+
+def request_record(caplog: pytest.LogCaptureFixture) -> logging.LogRecord:
+    """Return the single request log line of the metrics middleware."""
+    (record,) = [record for record in caplog.records if record.name == "app.core.metrics"]
+    return record
+
+
+async def test_route_over_budget_fails_in_strict_mode(budget_client, monkeypatch):
+    monkeypatch.setattr(settings, "sql_query_budget_strict", True)
+
+    with pytest.raises(QueryBudgetExceeded, match=f"GET /users ran {LOOKUPS} SQL statements, budget is 1"):
+        async with budget_client:
+            await budget_client.get("/users")
+
+
+async def test_route_over_budget_is_logged_outside_strict_mode(budget_client, caplog):
+    async with budget_client:
+        response = await budget_client.get("/users")
+
+    assert response.status_code == 200
+    record = request_record(caplog)
+    assert record.levelno == logging.WARNING
+    assert record.db_queries == LOOKUPS
+    assert record.query_budget == 1
+
+
+async def test_repeated_statement_is_flagged_as_n_plus_one(budget_client, caplog, monkeypatch):
+    monkeypatch.setattr(settings, "sql_n_plus_one_threshold", LOOKUPS)
+
+    async with budget_client:
+        await budget_client.get("/users")
+
+    [(fingerprint, count)] = request_record(caplog).n_plus_one.items()
+    assert fingerprint.startswith("SELECT users.email FROM users WHERE users.id = ?")
+    assert count == LOOKUPS
+
+
+async def test_statements_below_threshold_are_not_flagged(budget_client, caplog, monkeypatch):
+    monkeypatch.setattr(settings, "sql_n_plus_one_threshold", LOOKUPS + 1)
+
+    async with budget_client:
+        await budget_client.get("/users")
+
+    assert not hasattr(request_record(caplog), "n_plus_one")
@@ -0,0 +1,45 @@
+import pytest
+
+from app.application.services.approval_service import ApprovalService
+from app.application.services.document_detail_service import DETAIL_QUERY_BUDGET, DocumentDetailService
+from app.db.session import SessionLocal, count_queries
+from app.domain.models.user import User
+
+pytestmark = pytest.mark.anyio
+
+# Document lookup, approval insert, one bulk step insert, document update, and the inbox
+# refresh: document row lock, delete and insert ... select.
+APPROVAL_FLOW_STATEMENTS = 7
+
+
+@pytest.mark.parametrize("children", [1, 10])
+async def test_detail_loader_stays_within_query_budget(make_document, fill_document, user, children):
+    document = await make_document()
+    await fill_document(document.id, user.id, children)
+
+    async with SessionLocal() as session:
+        detail = await DocumentDetailService(session).load(document.id)
+
+    assert len(detail.document_comments) == len(detail.metrics) == len(detail.rices) == children
+    assert detail.approval is not None and len(detail.approval_steps) == 1
+    assert detail.query_count == DETAIL_QUERY_BUDGET
+
+
+
+@pytest.mark.parametrize("approvers", [1, 15])
+async def test_approval_flow_statement_count_does_not_grow_with_approvers(make_document, approvers):
+    document = await make_document()
+    async with SessionLocal() as session:
+        users = [
+            User(email=f"approver{index}@example.com", full_name="Approver", password_hash="-")
+            for index in range(approvers)
+        ]
+        session.add_all(users)
+        await session.commit()
+
+    async with SessionLocal() as session:
+        with count_queries() as queries:
+            approval = await ApprovalService(session).create_approval_flow(document.id, [user.id for user in users])
+
+    assert approval is not None
+    assert queries.count == APPROVAL_FLOW_STATEMENTS
@@ -0,0 +1,135 @@
+import json
+import re
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import datetime
+
+import pytest
+from sqlalchemy import event, select
+
+from app.application.services.comment_service import CommentService
+from app.db.base import Base
+from app.db.session import IS_SQLITE, SessionLocal, engine
+from app.domain.models.approval import Approval
+from app.infrastructure.repositories.approval_repository import ApprovalRepository
+from app.infrastructure.repositories.approver_inbox_repository import ApproverInboxRepository
+from app.infrastructure.repositories.comment_repository import CommentRepository
+from app.infrastructure.repositories.document_metric_repository import DocumentMetricRepository
+from app.infrastructure.repositories.document_repository import DocumentRepository
+from app.infrastructure.repositories.document_rice_aggregate_repository import DocumentRICEAggregateRepository
+from app.infrastructure.repositories.document_rice_repository import DocumentRICERepository
+from app.modules.records.repository import RecordRepository
+
+pytestmark = pytest.mark.anyio
+
+# SQLite reports index lookups as "SEARCH ..." and reads of a whole table or index as "SCAN <table>"
+# or "SCAN <table> USING [COVERING] INDEX <index>". Walking an index in order is only bounded when
+# the statement has a LIMIT, as the keyset pages do.
+SQLITE_SCAN = re.compile(r"^SCAN (\w+)( USING (?:COVERING )?INDEX \w+)?$")
+
+# Hot read queries: (name, call). Each call gets a session, a document id, its approval id and a user id.
+HOT_QUERIES = [
+    ("documents keyset first page", lambda s, d, a, u: DocumentRepository(s).list_documents(20)),
+    (
+        "documents keyset next page",
+        lambda s, d, a, u: DocumentRepository(s).list_documents(20, after=(datetime.utcnow(), d)),
+    ),
+    ("documents by status", lambda s, d, a, u: DocumentRepository(s).list_documents(20, status="approval")),
+    ("documents by title prefix", lambda s, d, a, u: DocumentRepository(s).list_documents(20, title_prefix="Док")),
+    ("document with approvals", lambda s, d, a, u: DocumentRepository(s).get_document_with_approvals(d)),
+    ("detail version", lambda s, d, a, u: DocumentRepository(s).get_detail_version(d)),
+    (
+        "comments by document or approval",
+        lambda s, d, a, u: CommentRepository(s).list_for_document_or_approval(d, a),
+    ),
+    ("comments by document", lambda s, d, a, u: CommentRepository(s).list_rows_for_document(d)),
+    ("comments by approval", lambda s, d, a, u: CommentRepository(s).list_rows_for_approval(a)),
+    ("comments of many documents", lambda s, d, a, u: CommentRepository(s).list_for_documents([d, d + 1])),
+    ("comment version by document", lambda s, d, a, u: CommentRepository(s).get_version_for_document(d)),
+    ("comment version by approval", lambda s, d, a, u: CommentRepository(s).get_version_for_approval(a)),
+    ("approval by document", lambda s, d, a, u: ApprovalRepository(s).get_by_document_id(d)),
+    ("approval steps", lambda s, d, a, u: ApprovalRepository(s).list_steps(a)),
+    ("approver inbox", lambda s, d, a, u: ApproverInboxRepository(s).list_documents(u)),
+    ("approver inbox count", lambda s, d, a, u: ApproverInboxRepository(s).count(u)),
+    ("metrics by document", lambda s, d, a, u: DocumentMetricRepository(s).list_for_document(d)),
+    ("metrics of many documents", lambda s, d, a, u: DocumentMetricRepository(s).list_for_documents([d, d + 1])),
+    ("RICE by document", lambda s, d, a, u: DocumentRICERepository(s).list_for_document(d)),
+    ("RICE of many documents", lambda s, d, a, u: DocumentRICERepository(s).list_for_documents([d, d + 1])),
+    ("RICE version", lambda s, d, a, u: DocumentRICERepository(s).get_version_for_document(d)),
+    ("RICE ranking", lambda s, d, a, u: DocumentRICEAggregateRepository(s).list_ranking(20)),
+    ("records page", lambda s, d, a, u: RecordRepository(s).list_records(0, 20)),
+]
+
+
+@contextmanager
+def captured_statements() -> Iterator[list[tuple[str, object]]]:
+    """Collect every statement sent to the database, with its parameters."""
+    statements: list[tuple[str, object]] = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany) -> None:
+        statements.append((statement, parameters))
+
+    event.listen(engine.sync_engine, "before_cursor_execute", capture)
+    try:
+        yield statements
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", capture)
+
+
+def postgres_seq_scans(plan: dict) -> Iterator[str]:
+    """Yield relations read by a sequential scan anywhere in a JSON plan."""
+    if plan.get("Node Type") == "Seq Scan":
+        yield plan["Relation Name"]
+    for child in plan.get("Plans", []):
+        yield from postgres_seq_scans(child)
+
+
+async def full_scans(statements: list[tuple[str, object]]) -> list[str]:
+    """Explain each statement and return the application tables it reads without an index."""
+    scans = []
+    async with engine.connect() as connection:
+        if not IS_SQLITE:
+            # Small test tables make a sequential scan the cheapest plan; forbid it so only
+            # a missing index can produce one.
+            await connection.exec_driver_sql("SET enable_seqscan = off")
+        for statement, parameters in statements:
+            if IS_SQLITE:
+                result = await connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)
+                matches = [SQLITE_SCAN.match(row[-1]) for row in result]
+                tables = [
+                    match.group(1)
+                    for match in matches
+                    if match and not (match.group(2) and " LIMIT " in statement.upper())
+                ]
+            else:
+                result = await connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {statement}", parameters)
+                plan = result.scalar_one()
+                plan = json.loads(plan) if isinstance(plan, str) else plan
+                tables = list(postgres_seq_scans(plan[0]["Plan"]))
+            scans += [f"{table}: {statement}" for table in tables if table in Base.metadata.tables]
+    return scans
+
+
+@pytest.fixture
+async def seeded(make_document, user) -> tuple[int, int, int]:
+    """Create a few documents, one submitted to ``user`` with comments; return its ids."""
+    for index in range(3):
+        await make_document(title=f"Черновик {index}")
+    document = await make_document(title="Документ на согласовании", submit=True)
+    async with SessionLocal() as session:
+        approval_id = await session.scalar(select(Approval.id).where(Approval.document_id == document.id))
+    async with SessionLocal() as session:
+        await CommentService(session).add_comment("К документу", document.id, None)
+        await CommentService(session).add_comment("К согласованию", None, approval_id)
+    return document.id, approval_id, user.id
+
+
+@pytest.mark.parametrize("name, call", HOT_QUERIES, ids=[name for name, _ in HOT_QUERIES])
+async def test_hot_query_uses_indexes(seeded, name, call):
+    document_id, approval_id, user_id = seeded
+    async with SessionLocal() as session:
+        with captured_statements() as statements:
+            await call(session, document_id, approval_id, user_id)
+
+    assert statements
+    assert await full_scans(statements) == []
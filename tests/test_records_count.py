@@ -0,0 +1,46 @@
+import pytest
+
+from app.core.config import settings
+from app.core.row_count_cache import row_count_cache
+from app.db.session import SessionLocal
+from app.modules.records.service import RECORDS_COUNT_KEY, RecordService
+from app.schemas.record import RecordCreate
+
+pytestmark = pytest.mark.anyio
+
+PAYLOAD = RecordCreate(title="Запись", description=None)
+
+
+async def test_create_record_invalidates_cached_count_after_request_commit():
+    row_count_cache.set(RECORDS_COUNT_KEY, 5)
+
+    async with SessionLocal() as session:
+        async with session.begin():
+            await RecordService(session).create_record(PAYLOAD)
+            assert row_count_cache.get(RECORDS_COUNT_KEY) == 5
+
+    assert row_count_cache.get(RECORDS_COUNT_KEY) is None
+
+
+async def test_rolled_back_create_record_keeps_cached_count():
+    row_count_cache.set(RECORDS_COUNT_KEY, 5)
+
+    async with SessionLocal() as session:
+        transaction = await session.begin()
+        await RecordService(session).create_record(PAYLOAD)
+        await transaction.rollback()
+        async with session.begin():
+            pass  # a later commit on the same session must not run the discarded invalidation
+
+    assert row_count_cache.get(RECORDS_COUNT_KEY) == 5
+
+
+async def test_cached_count_includes_committed_record(monkeypatch):
+    monkeypatch.setattr(settings, "records_count_strategy", "cached")
+    async with SessionLocal() as session:
+        assert await RecordService(session).count_records() == (0, False)
+    async with SessionLocal() as session:
+        await RecordService(session).create_record(PAYLOAD)
+
+    async with SessionLocal() as session:
+        assert await RecordService(session).count_records() == (1, False)